@@ -0,0 +1,173 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+from dagster._core.utils import make_new_run_id
+from dagster._utils.concurrency import ConcurrencyStepClaim
+from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Simulate contention for global op concurrency slots from many runs. The script starts `--num-runs`
+runs in parallel threads, each of which needs to execute `--num-steps` steps limited by a single
+concurrency key with `--num-slots` slots. Each run repeatedly tries to claim slots for all of its
+remaining steps, and frees the slots of the steps it was able to claim, until all of its steps have
+executed. This is done once by claiming and freeing slots one step at a time, and once with the bulk
+`claim_concurrency_slots` / `free_concurrency_slots_for_steps` APIs. Execution time is logged for
+each storage and mode.
+
+The sqlite event log storage is always benchmarked. Pass `--postgres-url` to also benchmark a
+postgres event log storage. Note that all of the concurrency tables of the given database are wiped.
+"""
+
+CONCURRENCY_KEY = "benchmark"
+
+parser = argparse.ArgumentParser(
+    prog="concurrency_claims",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    default=10,
+    help="Set the number of runs contending for slots.",
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=50,
+    help="Set the number of concurrency limited steps in each run.",
+)
+
+parser.add_argument(
+    "--num-slots",
+    type=int,
+    default=5,
+    help="Set the number of slots for the benchmarked concurrency key.",
+)
+
+parser.add_argument(
+    "--postgres-url",
+    type=str,
+    default=None,
+    help="Set a postgres connection string to also benchmark a postgres event log storage.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@contextmanager
+def sqlite_storage() -> Iterator[SqlEventLogStorage]:
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConcurrencyEnabledSqliteTestEventLogStorage(tmpdir_path)
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+
+@contextmanager
+def postgres_storage(postgres_url: str) -> Iterator[SqlEventLogStorage]:
+    from dagster_postgres.event_log import PostgresEventLogStorage
+
+    storage = PostgresEventLogStorage.create_clean_storage(postgres_url)
+    try:
+        yield storage
+    finally:
+        storage.dispose()
+
+
+def execute_run(storage: SqlEventLogStorage, num_steps: int, bulk: bool) -> int:
+    """Executes the steps of a single run as soon as they claim a slot, and returns the number of
+    claim attempts.
+    """
+    run_id = make_new_run_id()
+    remaining = [f"step_{i}" for i in range(num_steps)]
+    attempts = 0
+    while remaining:
+        if bulk:
+            claim_statuses = storage.claim_concurrency_slots(
+                run_id, [ConcurrencyStepClaim(CONCURRENCY_KEY, step_key) for step_key in remaining]
+            )
+            claimed = [
+                step_key
+                for step_key, claim_status in claim_statuses.items()
+                if claim_status.is_claimed
+            ]
+            attempts += 1
+            if claimed:
+                storage.free_concurrency_slots_for_steps(run_id, claimed)
+        else:
+            claimed = []
+            for step_key in remaining:
+                if storage.claim_concurrency_slot(CONCURRENCY_KEY, run_id, step_key).is_claimed:
+                    claimed.append(step_key)
+                attempts += 1
+            for step_key in claimed:
+                storage.free_concurrency_slot_for_step(run_id, step_key)
+
+        remaining = [step_key for step_key in remaining if step_key not in claimed]
+
+    return attempts
+
+
+def execute_runs(
+    storage: SqlEventLogStorage, num_runs: int, num_steps: int, num_slots: int, bulk: bool
+) -> int:
+    storage.set_concurrency_slots(CONCURRENCY_KEY, num_slots)
+    with ThreadPoolExecutor(max_workers=num_runs) as executor:
+        futures = [executor.submit(execute_run, storage, num_steps, bulk) for _ in range(num_runs)]
+        attempts = sum(future.result() for future in futures)
+    storage.delete_concurrency_limit(CONCURRENCY_KEY)
+    return attempts
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_runs: int, num_steps: int, num_slots: int, postgres_url: Optional[str]) -> None:
+    session = ProfilingSession(
+        name="Concurrency slot claims",
+        experiment_settings={
+            "num_runs": num_runs,
+            "num_steps": num_steps,
+            "num_slots": num_slots,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    storage_fns = [("sqlite", sqlite_storage)]
+    if postgres_url:
+        storage_fns.append(("postgres", lambda: postgres_storage(postgres_url)))
+
+    attempts = {}
+    for storage_name, storage_fn in storage_fns:
+        for mode, bulk in [("per step", False), ("bulk", True)]:
+            with storage_fn() as storage:
+                with session.logged_execution_time(f"Execute runs ({storage_name}, {mode})"):
+                    attempts[(storage_name, mode)] = execute_runs(
+                        storage, num_runs, num_steps, num_slots, bulk
+                    )
+
+    session.log_result_summary()
+
+    print()
+    for (storage_name, mode), num_attempts in attempts.items():
+        print(f"{storage_name}, {mode}: {num_attempts} claim calls")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.num_steps, args.num_slots, args.postgres_url)
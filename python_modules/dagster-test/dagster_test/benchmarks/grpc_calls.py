@@ -0,0 +1,202 @@
+# ruff: noqa: T201
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import grpc
+from dagster import Definitions, job, op
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.client import DagsterGrpcClient
+from dagster._grpc.server import GrpcServerProcess
+from dagster._seven import IS_WINDOWS
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the throughput of gRPC calls from clients in this process to a local code server. The script
+starts a code server for a small code location defined in this file, once listening on a TCP port
+and once on a unix socket (except on Windows). For each transport and for each compression setting
+given by `--compression`, `--num-threads` threads each make `--num-calls` calls of each method given
+by `--method`, with one client per thread. Clients for the same server share a pooled channel.
+Execution time is logged for each transport, compression and method, and the number of calls per
+second is printed at the end.
+"""
+
+COMPRESSIONS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+METHODS: Dict[str, Callable[[DagsterGrpcClient], object]] = {
+    "ping": lambda client: client.ping("hello"),
+    "list_repositories": lambda client: client.list_repositories(),
+}
+
+parser = argparse.ArgumentParser(
+    prog="grpc_calls",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=500,
+    help="Set the number of calls of each method that each thread makes.",
+)
+
+parser.add_argument(
+    "--num-threads",
+    type=int,
+    default=1,
+    help="Set the number of threads making calls concurrently.",
+)
+
+parser.add_argument(
+    "--compression",
+    choices=list(COMPRESSIONS.keys()),
+    action="append",
+    default=None,
+    help=(
+        "Set a compression setting to benchmark. Can be passed multiple times. Defaults to none"
+        " and gzip."
+    ),
+)
+
+parser.add_argument(
+    "--method",
+    choices=list(METHODS.keys()),
+    action="append",
+    default=None,
+    help=(
+        "Set a client method to benchmark. Can be passed multiple times. Defaults to all"
+        " methods."
+    ),
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+defs = Definitions(jobs=[noop_job])
+
+
+def make_calls(
+    server_process: GrpcServerProcess,
+    compression: grpc.Compression,
+    method: Callable[[DagsterGrpcClient], object],
+    num_calls: int,
+) -> None:
+    client = DagsterGrpcClient(
+        port=server_process.port, socket=server_process.socket, compression=compression
+    )
+    for _ in range(num_calls):
+        method(client)
+
+
+def execute_calls(
+    server_process: GrpcServerProcess,
+    compression: grpc.Compression,
+    method: Callable[[DagsterGrpcClient], object],
+    num_calls: int,
+    num_threads: int,
+) -> float:
+    """Makes the calls from the given number of threads, and returns the elapsed time in seconds."""
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [
+            executor.submit(make_calls, server_process, compression, method, num_calls)
+            for _ in range(num_threads)
+        ]
+        for future in futures:
+            future.result()
+    return time.perf_counter() - start_time
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    num_calls: int,
+    num_threads: int,
+    compression_names: Optional[Sequence[str]],
+    method_names: Optional[Sequence[str]],
+) -> None:
+    compression_names = compression_names or ["none", "gzip"]
+    method_names = method_names or list(METHODS.keys())
+
+    session = ProfilingSession(
+        name="gRPC calls",
+        experiment_settings={
+            "num_calls": num_calls,
+            "num_threads": num_threads,
+            "compressions": ", ".join(compression_names),
+            "methods": ", ".join(method_names),
+        },
+    ).start()
+
+    session.log_start_message()
+
+    transports = [("tcp", True)]
+    if not IS_WINDOWS:
+        transports.append(("unix socket", False))
+
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable, python_file=__file__, attribute="defs"
+    )
+
+    calls_per_second: Dict[Tuple[str, str, str], float] = {}
+    with instance_for_test() as instance:
+        for transport_name, force_port in transports:
+            with GrpcServerProcess(
+                instance_ref=instance.get_ref(),
+                loadable_target_origin=loadable_target_origin,
+                force_port=force_port,
+                wait_on_exit=True,
+            ) as server_process:
+                with session.logged_execution_time(f"Start server ({transport_name})"):
+                    # the first call waits for the server to load the code location
+                    make_calls(server_process, grpc.Compression.NoCompression, METHODS["ping"], 1)
+
+                for compression_name in compression_names:
+                    for method_name in method_names:
+                        with session.logged_execution_time(
+                            f"Call {method_name} ({transport_name}, {compression_name})"
+                        ):
+                            elapsed = execute_calls(
+                                server_process,
+                                COMPRESSIONS[compression_name],
+                                METHODS[method_name],
+                                num_calls,
+                                num_threads,
+                            )
+                        calls_per_second[(transport_name, compression_name, method_name)] = (
+                            num_calls * num_threads / elapsed
+                        )
+
+    session.log_result_summary()
+
+    print()
+    for (transport_name, compression_name, method_name), rate in calls_per_second.items():
+        print(f"{transport_name}, {compression_name}, {method_name}: {rate:.1f} calls/sec")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_calls, args.num_threads, args.compression, args.method)
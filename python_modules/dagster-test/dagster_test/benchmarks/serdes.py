@@ -0,0 +1,132 @@
+# ruff: noqa: T201
+import argparse
+from typing import Callable, Sequence
+
+from dagster import AssetMaterialization, MetadataValue, Output, job, op
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.snap import JobSnapshot
+from dagster._serdes import deserialize_value, pack_value, serialize_value, unpack_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Micro-benchmarks for serdes. Builds two representative payloads:
+
+    events:   the event log of a job run where each of `--num-ops` ops reports asset
+              materializations with metadata (many small, deeply nested objects)
+    snapshot: the JobSnapshot of a job with `--num-ops` ops in a chain (one large object)
+
+Each payload is then run through pack_value, unpack_value, serialize_value and deserialize_value
+`--num-iterations` times. Execution time is logged for each step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=50,
+    help="Set the number of ops in the jobs used to build the payloads.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=20,
+    help="Set the number of times each operation is run over each payload.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def _materializations(context):
+    for i in range(3):
+        yield AssetMaterialization(
+            asset_key=["benchmark", context.op.name, f"asset_{i}"],
+            metadata={
+                "row_count": MetadataValue.int(i * 1000),
+                "path": MetadataValue.path(f"/tmp/{context.op.name}/{i}.parquet"),
+            },
+        )
+    yield Output(None)
+
+
+@op
+def root_op(context):
+    yield from _materializations(context)
+
+
+@op
+def downstream_op(context, _upstream):
+    yield from _materializations(context)
+
+
+def get_job(num_ops: int):
+    @job
+    def benchmark_job():
+        upstream = root_op()
+        for i in range(num_ops - 1):
+            upstream = downstream_op.alias(f"op_{i}")(upstream)
+
+    return benchmark_job
+
+
+def get_payloads(num_ops: int) -> Sequence[Sequence[object]]:
+    benchmark_job = get_job(num_ops)
+    with instance_for_test() as instance:
+        result = benchmark_job.execute_in_process(instance=instance)
+        events = instance.all_logs(result.run_id)
+    return [events, [JobSnapshot.from_job_def(benchmark_job)]]
+
+
+def run_iterations(num_iterations: int, fn: Callable[[object], object], values: Sequence) -> list:
+    for _ in range(num_iterations):
+        results = [fn(value) for value in values]
+    return results
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_iterations: int) -> None:
+    events, snapshots = get_payloads(num_ops)
+
+    session = ProfilingSession(
+        name="Serdes",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_iterations": num_iterations,
+            "num_events": len(events),
+        },
+    ).start()
+
+    session.log_start_message()
+
+    for payload_name, values in [("events", events), ("snapshot", snapshots)]:
+        with session.logged_execution_time(f"pack_value ({payload_name})"):
+            packed = run_iterations(num_iterations, pack_value, values)
+
+        with session.logged_execution_time(f"unpack_value ({payload_name})"):
+            unpacked = run_iterations(num_iterations, unpack_value, packed)
+
+        with session.logged_execution_time(f"serialize_value ({payload_name})"):
+            serialized = run_iterations(num_iterations, serialize_value, values)
+
+        with session.logged_execution_time(f"deserialize_value ({payload_name})"):
+            deserialized = run_iterations(num_iterations, deserialize_value, serialized)
+
+        assert unpacked == deserialized == list(values)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_iterations)
@@ -0,0 +1,113 @@
+# ruff: noqa: T201
+import argparse
+from datetime import datetime
+
+from dagster import TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compute partition counts, partition keys by index, partition key membership, and subset sizes for an
+hourly partitions definition spanning `--num-years` years. This is done for definitions in the UTC
+and US/Central timezones, for which partition indexes are computed arithmetically, and once for an
+equivalent definition in the US/Central timezone with the cron schedule `0 */1 * * *`, which is not
+recognized as having a fixed cadence outside of UTC and so iterates over the time windows of the
+cron schedule. Execution time is logged for each operation and definition.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-years",
+    type=int,
+    default=10,
+    help="Set the number of years of hourly partitions.",
+)
+
+START_YEAR = 2010
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_partitions_def(cron_schedule: str, timezone: str) -> TimeWindowPartitionsDefinition:
+    return TimeWindowPartitionsDefinition(
+        start=f"{START_YEAR}-01-01-00:00",
+        fmt="%Y-%m-%d-%H:%M",
+        cron_schedule=cron_schedule,
+        timezone=timezone,
+    )
+
+
+def run_operations(
+    session: ProfilingSession,
+    name: str,
+    partitions_def: TimeWindowPartitionsDefinition,
+    current_time: datetime,
+) -> int:
+    with session.logged_execution_time(f"Count partitions ({name})"):
+        num_partitions = partitions_def.get_num_partitions(current_time)
+
+    with session.logged_execution_time(f"Get last 100 partition keys by index ({name})"):
+        last_partition_keys = partitions_def.get_partition_keys_between_indexes(
+            num_partitions - 100, num_partitions, current_time=current_time
+        )
+
+    with session.logged_execution_time(f"Check last 100 partition keys ({name})"):
+        for partition_key in last_partition_keys:
+            assert partitions_def.has_partition_key(partition_key, current_time=current_time)
+
+    first_window = partitions_def.time_window_for_partition_key(
+        partitions_def.get_partition_keys_between_indexes(0, 1, current_time=current_time)[0]
+    )
+    last_window = partitions_def.time_window_for_partition_key(last_partition_keys[-1])
+    with session.logged_execution_time(f"Count partitions in subset ({name})"):
+        subset_num_partitions = TimeWindowPartitionsSubset(
+            partitions_def,
+            num_partitions=None,
+            included_time_windows=[first_window._replace(end=last_window.end)],
+        ).num_partitions
+
+    assert subset_num_partitions == num_partitions
+    return num_partitions
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_years: int) -> None:
+    session = ProfilingSession(
+        name="Time window partitions",
+        experiment_settings={"num_years": num_years},
+    ).start()
+
+    session.log_start_message()
+
+    current_time = datetime(START_YEAR + num_years, 1, 1)
+    num_partitions = {}
+    for name, cron_schedule, timezone in [
+        ("fixed cadence, UTC", "0 * * * *", "UTC"),
+        ("fixed cadence, US/Central", "0 * * * *", "US/Central"),
+        ("iterated, US/Central", "0 */1 * * *", "US/Central"),
+    ]:
+        num_partitions[name] = run_operations(
+            session, name, build_partitions_def(cron_schedule, timezone), current_time
+        )
+
+    session.log_result_summary()
+
+    print()
+    for name, count in num_partitions.items():
+        print(f"{name}: {count} partitions")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_years)
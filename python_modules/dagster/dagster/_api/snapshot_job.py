@@ -4,10 +4,14 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.remote_representation.external_data import ExternalJobSubsetResult
-from dagster._core.remote_representation.origin import RemoteJobOrigin
+from dagster._core.remote_representation.external_data import (
+    ExternalJobData,
+    ExternalJobSubsetResult,
+)
+from dagster._core.remote_representation.origin import RemoteJobOrigin, RemoteRepositoryOrigin
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
     from dagster._grpc.client import DagsterGrpcClient
@@ -47,3 +51,23 @@ def sync_get_external_job_subset_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_job_data_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: RemoteRepositoryOrigin,
+    job_name: str,
+) -> ExternalJobData:
+    from dagster._grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    check.inst_param(repository_origin, "repository_origin", RemoteRepositoryOrigin)
+    check.str_param(job_name, "job_name")
+
+    reply = api_client.external_job(repository_origin, job_name)
+    if reply.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_value(reply.serialized_error, SerializableErrorInfo)
+        )
+
+    return deserialize_value(reply.serialized_job_data, ExternalJobData)
@@ -9,40 +9,51 @@
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
-    from dagster._core.remote_representation import CodeLocation
+    from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
     from dagster._grpc.client import DagsterGrpcClient
 
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient", code_location: "CodeLocation", defer_snapshots: bool = False
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
 
-    repo_datas = {}
-    for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=RemoteRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
-            )
+    return {
+        repository_name: sync_get_streaming_external_repository_data_grpc(
+            api_client,
+            RemoteRepositoryOrigin(code_location.origin, repository_name),
+            defer_snapshots=defer_snapshots,
         )
+        for repository_name in code_location.repository_names  # type: ignore
+    }
+
+
+def sync_get_streaming_external_repository_data_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: "RemoteRepositoryOrigin",
+    defer_snapshots: bool = False,
+) -> ExternalRepositoryData:
+    from dagster._core.remote_representation import RemoteRepositoryOrigin
 
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
+    check.inst_param(repository_origin, "repository_origin", RemoteRepositoryOrigin)
+
+    external_repository_chunks = list(
+        api_client.streaming_external_repository(
+            external_repository_origin=repository_origin,
+            defer_snapshots=defer_snapshots,
         )
+    )
+
+    result = deserialize_value(
+        "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        ),
+        (ExternalRepositoryData, ExternalRepositoryErrorData),
+    )
 
-        if isinstance(result, ExternalRepositoryErrorData):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
+    if isinstance(result, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
 
-        repo_datas[repository_name] = result
-    return repo_datas
+    return result
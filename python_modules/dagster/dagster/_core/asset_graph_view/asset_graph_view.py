@@ -15,6 +15,7 @@
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
     PartitionDimensionDefinition,
 )
 from dagster._core.definitions.partition import (
@@ -181,7 +182,9 @@ def time_windows(self) -> Sequence[TimeWindow]:
                 self._asset_graph_view.effective_dt
             )
             return [TimeWindow(datetime.min, last_tw.end)] if last_tw else []
-        elif isinstance(self._compatible_subset.subset_value, DefaultPartitionsSubset):
+        elif isinstance(
+            self._compatible_subset.subset_value, (DefaultPartitionsSubset, MultiPartitionsSubset)
+        ):
             check.inst(
                 self._partitions_def,
                 MultiPartitionsDefinition,
@@ -1,7 +1,9 @@
+import contextvars
 import datetime
 import logging
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -9,6 +11,7 @@
     Dict,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -92,6 +95,7 @@ def __init__(
         respect_materialization_data_versions: bool,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        max_evaluation_workers: Optional[int] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -107,6 +111,10 @@ def __init__(
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
+        self._max_evaluation_workers = check.opt_int_param(
+            max_evaluation_workers, "max_evaluation_workers"
+        )
+        self._evaluation_duration_by_asset_key: Dict[AssetKey, float] = {}
 
         # cache data before the tick starts
         self.prefetch()
@@ -149,6 +157,11 @@ def asset_records_to_prefetch(self) -> Sequence[AssetKey]:
             key for key in self.auto_materialize_asset_keys_and_parents if self.asset_graph.has(key)
         ]
 
+    @property
+    def evaluation_duration_by_asset_key(self) -> Mapping[AssetKey, float]:
+        """The number of seconds it took to evaluate each asset on this tick."""
+        return self._evaluation_duration_by_asset_key
+
     @property
     def respect_materialization_data_versions(self) -> bool:
         return self._respect_materialization_data_versions
@@ -166,7 +179,7 @@ def prefetch(self) -> None:
         self._logger.info(
             f"Prefetching asset records for {len(self.asset_records_to_prefetch)} records."
         )
-        self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
+        self.instance_queryer.prefetch_asset_partition_data(self.asset_records_to_prefetch)
         self._logger.info("Done prefetching asset records.")
 
     def evaluate_asset(
@@ -212,6 +225,83 @@ def evaluate_asset(
         )
         return AssetConditionEvaluationState.create(context, result), expected_data_time
 
+    def _evaluate_asset_timed(
+        self,
+        asset_key: AssetKey,
+        evaluation_state_by_key: Mapping[AssetKey, AssetConditionEvaluationState],
+        expected_data_time_mapping: Mapping[AssetKey, Optional[datetime.datetime]],
+    ) -> Tuple[AssetConditionEvaluationState, Optional[datetime.datetime], float]:
+        start_time = time.time()
+        try:
+            (evaluation_state, expected_data_time) = self.evaluate_asset(
+                asset_key, evaluation_state_by_key, expected_data_time_mapping
+            )
+        except Exception as e:
+            raise Exception(
+                f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
+            ) from e
+        return evaluation_state, expected_data_time, time.time() - start_time
+
+    def _get_asset_keys_to_evaluate_by_level(self) -> Iterator[Sequence[AssetKey]]:
+        """Yields the auto-materialize asset keys in topological order, grouped into levels such
+        that no asset depends on another asset in the same level.
+        """
+        for asset_keys_in_level in self.asset_graph.toposorted_asset_keys_by_level:
+            asset_keys = sorted(
+                asset_key
+                for asset_key in asset_keys_in_level
+                if asset_key in self.auto_materialize_asset_keys
+            )
+            if asset_keys:
+                yield asset_keys
+
+    def _iter_evaluation_results(
+        self,
+        evaluation_state_by_key: Mapping[AssetKey, AssetConditionEvaluationState],
+        expected_data_time_mapping: Mapping[AssetKey, Optional[datetime.datetime]],
+    ) -> Iterator[
+        Tuple[AssetKey, Tuple[AssetConditionEvaluationState, Optional[datetime.datetime], float]]
+    ]:
+        """Evaluates each auto-materialize asset, yielding the results in topological order. The
+        results for an asset are yielded before any of its children are evaluated.
+
+        If max_evaluation_workers is set, the assets within each topological level are evaluated in
+        parallel on a thread pool. As assets only depend on the results of their parents, this
+        yields the same results as evaluating the assets one at a time.
+        """
+        if self._max_evaluation_workers is None or self._max_evaluation_workers <= 1:
+            for asset_keys in self._get_asset_keys_to_evaluate_by_level():
+                for asset_key in asset_keys:
+                    yield (
+                        asset_key,
+                        self._evaluate_asset_timed(
+                            asset_key, evaluation_state_by_key, expected_data_time_mapping
+                        ),
+                    )
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_evaluation_workers,
+            thread_name_prefix="asset_daemon_evaluation_worker",
+        ) as executor:
+            for asset_keys in self._get_asset_keys_to_evaluate_by_level():
+                futures = [
+                    executor.submit(
+                        # run in a copy of the current context so that calls made by the worker
+                        # are counted towards this tick's traced call counts
+                        contextvars.copy_context().run,
+                        self._evaluate_asset_timed,
+                        asset_key,
+                        evaluation_state_by_key,
+                        expected_data_time_mapping,
+                    )
+                    for asset_key in asset_keys
+                ]
+                # wait for the entire level to be evaluated before the results are recorded, so
+                # that the mappings are not modified while they may be read by other workers
+                results = [future.result() for future in futures]
+                yield from zip(asset_keys, results)
+
     def get_asset_condition_evaluations(
         self,
     ) -> Tuple[Sequence[AssetConditionEvaluationState], AbstractSet[AssetKeyPartitionKey]]:
@@ -226,26 +316,13 @@ def get_asset_condition_evaluations(
         num_checked_assets = 0
         num_auto_materialize_asset_keys = len(self.auto_materialize_asset_keys)
 
-        for asset_key in self.asset_graph.toposorted_asset_keys:
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.auto_materialize_asset_keys:
-                continue
-
+        for asset_key, (
+            evaluation_state,
+            expected_data_time,
+            duration,
+        ) in self._iter_evaluation_results(evaluation_state_by_key, expected_data_time_mapping):
             num_checked_assets = num_checked_assets + 1
-            start_time = time.time()
-            self._logger.debug(
-                "Evaluating asset"
-                f" {asset_key.to_user_string()} ({num_checked_assets}/{num_auto_materialize_asset_keys})"
-            )
-
-            try:
-                (evaluation_state, expected_data_time) = self.evaluate_asset(
-                    asset_key, evaluation_state_by_key, expected_data_time_mapping
-                )
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
-                ) from e
+            self._evaluation_duration_by_asset_key[asset_key] = duration
 
             num_requested = evaluation_state.true_subset.size
             log_fn = self._logger.info if num_requested > 0 else self._logger.debug
@@ -257,8 +334,9 @@ def get_asset_condition_evaluations(
             to_request |= to_request_asset_partitions
 
             log_fn(
-                f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
-                f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds)"
+                f"Asset {asset_key.to_user_string()} evaluation result"
+                f" ({num_checked_assets}/{num_auto_materialize_asset_keys}): {num_requested}"
+                f" requested ({to_request_str}) ({format(duration, '.3f')} seconds)"
             )
 
             evaluation_state_by_key[asset_key] = evaluation_state
@@ -264,6 +264,24 @@ def from_asset_partition_set(
             non_partitioned_asset_keys=non_partitioned_asset_keys,
         )
 
+    @classmethod
+    def from_asset_subsets(cls, asset_subsets: Iterable[AssetSubset]) -> "AssetGraphSubset":
+        partitions_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+        non_partitioned_asset_keys: Set[AssetKey] = set()
+        for asset_subset in asset_subsets:
+            if asset_subset.is_partitioned:
+                if asset_subset.size > 0:
+                    partitions_subsets_by_asset_key[asset_subset.asset_key] = (
+                        asset_subset.subset_value
+                    )
+            elif asset_subset.bool_value:
+                non_partitioned_asset_keys.add(asset_subset.asset_key)
+
+        return AssetGraphSubset(
+            partitions_subsets_by_asset_key=partitions_subsets_by_asset_key,
+            non_partitioned_asset_keys=non_partitioned_asset_keys,
+        )
+
     @classmethod
     def can_deserialize(
         cls, serialized_dict: Mapping[str, Any], asset_graph: BaseAssetGraph
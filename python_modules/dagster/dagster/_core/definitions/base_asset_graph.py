@@ -3,6 +3,7 @@
 from datetime import datetime
 from functools import cached_property, total_ordering
 from heapq import heapify, heappop, heappush
+from itertools import count
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -11,11 +12,13 @@
     Generic,
     Iterable,
     Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -42,9 +45,10 @@
 from dagster._utils.cached_method import cached_method
 
 from .events import AssetKeyPartitionKey
-from .partition import PartitionsSubset
+from .partition import AllPartitionsSubset, PartitionsSubset
 from .partition_key_range import PartitionKeyRange
 from .partition_mapping import (
+    CachingPartitionMappingResolver,
     UpstreamPartitionsResult,
     infer_partition_mapping,
 )
@@ -283,6 +287,7 @@ def all_partitions_defs(self) -> Sequence[PartitionsDefinition]:
     def all_group_names(self) -> AbstractSet[str]:
         return {a.group_name for a in self.asset_nodes if a.group_name is not None}
 
+    @cached_method
     def get_partition_mapping(
         self, asset_key: AssetKey, parent_asset_key: AssetKey
     ) -> PartitionMapping:
@@ -293,6 +298,19 @@ def get_partition_mapping(
             self.get(parent_asset_key).partitions_def,
         )
 
+    def get_partition_mapping_resolver(
+        self, dynamic_partitions_store: DynamicPartitionsStore
+    ) -> CachingPartitionMappingResolver:
+        """Returns the resolver used to map partitions between assets. CachingInstanceQueryers are
+        scoped to a single evaluation, so partitions mapped with one as the dynamic partitions store
+        are memoized for its lifetime.
+        """
+        from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+        if isinstance(dynamic_partitions_store, CachingInstanceQueryer):
+            return dynamic_partitions_store.partition_mapping_resolver
+        return CachingPartitionMappingResolver(dynamic_partitions_store)
+
     def get_children(self, node: T_AssetNode) -> AbstractSet[T_AssetNode]:
         """Returns all asset nodes that directly depend on the given asset node."""
         return {self._asset_nodes_by_key[key] for key in self.get(node.key).child_keys}
@@ -355,11 +373,13 @@ def get_parent_asset_subset(
 
         partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
         parent_partitions_subset = (
-            partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+            self.get_partition_mapping_resolver(
+                dynamic_partitions_store
+            ).get_upstream_mapped_partitions_result_for_partitions(
+                partition_mapping,
                 child_asset_subset.subset_value if child_partitions_def is not None else None,
                 downstream_partitions_def=child_partitions_def,
                 upstream_partitions_def=parent_partitions_def,
-                dynamic_partitions_store=dynamic_partitions_store,
                 current_time=current_time,
             )
         ).partitions_subset
@@ -392,11 +412,13 @@ def get_child_asset_subset(
             return ValidAssetSubset(child_asset_key, value=parent_asset_subset.size > 0)
         else:
             partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-            child_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
+            child_partitions_subset = self.get_partition_mapping_resolver(
+                dynamic_partitions_store
+            ).get_downstream_partitions_for_partitions(
+                partition_mapping,
                 parent_asset_subset.subset_value,
                 parent_partitions_def,
                 downstream_partitions_def=child_partitions_def,
-                dynamic_partitions_store=dynamic_partitions_store,
                 current_time=current_time,
             )
             return ValidAssetSubset(child_asset_key, value=child_partitions_subset)
@@ -467,11 +489,12 @@ def get_child_partition_keys_of_parent(
             )
 
         partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
-        child_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
-            parent_partitions_def.empty_subset().with_partition_keys([parent_partition_key]),
+        resolver = self.get_partition_mapping_resolver(dynamic_partitions_store)
+        child_partitions_subset = resolver.get_downstream_partitions_for_partitions(
+            partition_mapping,
+            resolver.get_subset_for_partition_key(parent_partitions_def, parent_partition_key),
             parent_partitions_def,
             downstream_partitions_def=child_partitions_def,
-            dynamic_partitions_store=dynamic_partitions_store,
             current_time=current_time,
         )
 
@@ -552,16 +575,17 @@ def get_parent_partition_keys_for_child(
             )
 
         partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        resolver = self.get_partition_mapping_resolver(dynamic_partitions_store)
 
-        return partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+        return resolver.get_upstream_mapped_partitions_result_for_partitions(
+            partition_mapping,
             (
-                child_partitions_def.subset_with_partition_keys([partition_key])
+                resolver.get_subset_for_partition_key(child_partitions_def, partition_key)
                 if partition_key
                 else None
             ),
             downstream_partitions_def=child_partitions_def,
             upstream_partitions_def=parent_partitions_def,
-            dynamic_partitions_store=dynamic_partitions_store,
             current_time=current_time,
         )
 
@@ -685,14 +709,14 @@ def bfs_filter_subsets(
                             )
                             queued_subsets_by_asset_key[child_key] = child_partitions_subset
                         else:
-                            child_partitions_subset = (
-                                partition_mapping.get_downstream_partitions_for_partitions(
-                                    partitions_subset,
-                                    check.not_none(self.get(asset_key).partitions_def),
-                                    downstream_partitions_def=child_partitions_def,
-                                    dynamic_partitions_store=dynamic_partitions_store,
-                                    current_time=current_time,
-                                )
+                            child_partitions_subset = self.get_partition_mapping_resolver(
+                                dynamic_partitions_store
+                            ).get_downstream_partitions_for_partitions(
+                                partition_mapping,
+                                partitions_subset,
+                                check.not_none(self.get(asset_key).partitions_def),
+                                downstream_partitions_def=child_partitions_def,
+                                current_time=current_time,
                             )
                             prior_child_partitions_subset = queued_subsets_by_asset_key.get(
                                 child_key
@@ -757,6 +781,192 @@ def bfs_filter_asset_partitions(
 
         return result
 
+    def bfs_filter_asset_graph_subset(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        condition_fn: Callable[["AssetGraphSubset", "AssetGraphSubset"], "AssetGraphSubset"],
+        initial_subset: "AssetGraphSubset",
+        current_time: datetime,
+    ) -> "AssetGraphSubset":
+        """Returns asset partitions within the graph that satisfy supplied criteria. Equivalent to
+        bfs_filter_asset_partitions, but operates on a subset of partitions per asset at a time
+        rather than on individual asset partitions.
+
+        - Are >= initial_subset
+        - Are returned by the condition_fn
+        - Any of their ancestors >= initial_subset are returned by the condition_fn
+
+        Visits parents before children. Each execution set (non-subsettable multi-asset) is
+        provided to the condition_fn as a single candidate subset, containing the partitions that
+        are in the initial subset or map to a partition of a parent that was returned by the
+        condition_fn. The condition_fn is also provided the subset of asset partitions that it has
+        returned so far, and returns the subset of the candidates that satisfy the condition.
+
+        Execution sets that include an asset with a self-dependency are visited a single partition
+        at a time, in the same order as bfs_filter_asset_partitions, since whether a partition of
+        such an asset satisfies the condition can depend on the result for its previous partition.
+        """
+        from .asset_graph_subset import AssetGraphSubset
+
+        toposort_level_by_asset_key = {
+            asset_key: i
+            for i, asset_keys in enumerate(self.toposorted_asset_keys_by_level)
+            for asset_key in asset_keys
+        }
+
+        # execution sets are queued by toposort level, and then by the order they were queued in
+        queue: List[Tuple[int, int, AbstractSet[AssetKey]]] = []
+        queued_execution_sets: Set[AbstractSet[AssetKey]] = set()
+        queue_counter = count()
+        candidates_by_asset_key: Dict[AssetKey, ValidAssetSubset] = {}
+        visited_by_asset_key: Dict[AssetKey, ValidAssetSubset] = {}
+
+        def _get_unvisited(asset_subset: ValidAssetSubset) -> ValidAssetSubset:
+            visited = visited_by_asset_key.get(asset_subset.asset_key)
+            return asset_subset - visited if visited is not None else asset_subset
+
+        def _mark_visited(asset_subset: ValidAssetSubset) -> None:
+            visited = visited_by_asset_key.get(asset_subset.asset_key)
+            visited_by_asset_key[asset_subset.asset_key] = (
+                visited | asset_subset if visited is not None else asset_subset
+            )
+
+        def _enqueue(asset_subset: ValidAssetSubset) -> None:
+            if isinstance(asset_subset.value, AllPartitionsSubset):
+                # resolve to the concrete partition keys, since not all partition mappings can
+                # map an AllPartitionsSubset to the partitions of downstream assets
+                asset_subset = asset_subset._replace(
+                    value=asset_subset.value.partitions_def.subset_with_all_partitions(
+                        current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                    )
+                )
+            asset_subset = _get_unvisited(asset_subset)
+            if asset_subset.size == 0:
+                return
+
+            asset_key = asset_subset.asset_key
+            queued = candidates_by_asset_key.get(asset_key)
+            candidates_by_asset_key[asset_key] = (
+                queued | asset_subset if queued is not None else asset_subset
+            )
+
+            execution_set_keys = frozenset(self.get(asset_key).execution_set_asset_keys)
+            if execution_set_keys not in queued_execution_sets:
+                queued_execution_sets.add(execution_set_keys)
+                level = max(toposort_level_by_asset_key[key] for key in execution_set_keys)
+                heappush(queue, (level, next(queue_counter), execution_set_keys))
+
+        def _get_children_subsets(matched: AssetGraphSubset) -> Iterator[ValidAssetSubset]:
+            for asset_key in matched.asset_keys:
+                asset_subset = matched.get_asset_subset(asset_key, self).as_valid(
+                    self.get(asset_key).partitions_def
+                )
+                for child_key in self.get(asset_key).child_keys:
+                    yield self.get_child_asset_subset(
+                        asset_subset, child_key, dynamic_partitions_store, current_time
+                    )
+
+        for asset_key in initial_subset.asset_keys:
+            _enqueue(
+                initial_subset.get_asset_subset(asset_key, self).as_valid(
+                    self.get(asset_key).partitions_def
+                )
+            )
+
+        result = AssetGraphSubset()
+        while len(queue) > 0:
+            _, _, execution_set_keys = heappop(queue)
+            queued_execution_sets.remove(execution_set_keys)
+            candidates = self._get_execution_set_candidates(
+                execution_set_keys,
+                [
+                    candidates_by_asset_key.pop(asset_key)
+                    for asset_key in execution_set_keys
+                    if asset_key in candidates_by_asset_key
+                ],
+            )
+            for candidate in candidates:
+                _mark_visited(candidate)
+
+            if not any(self.get(key).has_self_dependency for key in execution_set_keys) or not all(
+                candidate.is_partitioned for candidate in candidates
+            ):
+                matched = condition_fn(AssetGraphSubset.from_asset_subsets(candidates), result)
+                result |= matched
+                for child_subset in _get_children_subsets(matched):
+                    _enqueue(child_subset)
+                continue
+
+            # visit the partitions of self-dependent assets one at a time, requeueing the
+            # downstream partitions within the execution set as their parent partitions match
+            partition_queue: List[Tuple[float, int, str]] = []
+            for partition_key in candidates[0].subset_value.get_partition_keys():
+                self._push_self_dependent_partition(
+                    partition_queue, candidates[0].asset_key, partition_key, queue_counter
+                )
+
+            while len(partition_queue) > 0:
+                _, _, partition_key = heappop(partition_queue)
+                matched = condition_fn(
+                    AssetGraphSubset.from_asset_partition_set(
+                        {
+                            AssetKeyPartitionKey(candidate.asset_key, partition_key)
+                            for candidate in candidates
+                        },
+                        self,
+                    ),
+                    result,
+                )
+                result |= matched
+                for child_subset in _get_children_subsets(matched):
+                    if child_subset.asset_key not in execution_set_keys:
+                        _enqueue(child_subset)
+                        continue
+
+                    unvisited_child_subset = _get_unvisited(child_subset)
+                    _mark_visited(unvisited_child_subset)
+                    for (
+                        child_partition_key
+                    ) in unvisited_child_subset.subset_value.get_partition_keys():
+                        self._push_self_dependent_partition(
+                            partition_queue,
+                            child_subset.asset_key,
+                            child_partition_key,
+                            queue_counter,
+                        )
+
+        return result
+
+    def _get_execution_set_candidates(
+        self, execution_set_keys: AbstractSet[AssetKey], candidates: Sequence[ValidAssetSubset]
+    ) -> Sequence[ValidAssetSubset]:
+        """Aligns the candidate subsets of the assets in an execution set, so that each of the assets
+        is visited with the same partitions, when they share a partitions definition.
+        """
+        partitions_defs = {self.get(asset_key).partitions_def for asset_key in execution_set_keys}
+        if len(execution_set_keys) == 1 or len(partitions_defs) != 1:
+            return candidates
+
+        value = candidates[0].value
+        for candidate in candidates[1:]:
+            value = value | candidate.value
+        return [
+            ValidAssetSubset(asset_key=asset_key, value=value)
+            for asset_key in sorted(execution_set_keys, key=lambda key: key.to_string())
+        ]
+
+    def _push_self_dependent_partition(
+        self,
+        partition_queue: List[Tuple[float, int, str]],
+        asset_key: AssetKey,
+        partition_key: str,
+        queue_counter: Iterator[int],
+    ) -> None:
+        sort_key = sort_key_for_asset_partition(
+            self, AssetKeyPartitionKey(asset_key, partition_key)
+        )
+        heappush(partition_queue, (sort_key, next(queue_counter), partition_key))
+
     def split_asset_keys_by_repository(
         self, asset_keys: AbstractSet[AssetKey]
     ) -> Sequence[AbstractSet[AssetKey]]:
@@ -1,9 +1,15 @@
 import hashlib
 import itertools
+from collections import defaultdict
 from datetime import datetime
-from functools import lru_cache, reduce
+from functools import cached_property, lru_cache, reduce
 from typing import (
+    AbstractSet,
+    Callable,
     Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -14,6 +20,7 @@
     Type,
     Union,
     cast,
+    overload,
 )
 
 import pendulum
@@ -33,6 +40,7 @@
 )
 
 from .partition import (
+    AllPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
@@ -101,6 +109,88 @@ def keys_by_dimension(self) -> Mapping[str, str]:
         return {dim_key.dimension_name: dim_key.partition_key for dim_key in self.dimension_keys}
 
 
+class MultiPartitionKeySequence(Sequence[MultiPartitionKey]):
+    """A lazy, indexable view of the cross-product of the partition keys of each dimension of a
+    MultiPartitionsDefinition, in the same order as itertools.product. MultiPartitionKeys are only
+    constructed when they are accessed, so the number of keys and membership can be computed
+    without enumerating the cross-product.
+    """
+
+    def __init__(
+        self, dimension_names: Sequence[str], partition_keys_by_dimension: Sequence[Sequence[str]]
+    ):
+        self._dimension_names = dimension_names
+        self._partition_keys_by_dimension = partition_keys_by_dimension
+        self._partition_key_sets_by_dimension: Optional[Sequence[AbstractSet[str]]] = None
+
+    def _get_key(self, partition_keys: Sequence[str]) -> MultiPartitionKey:
+        return MultiPartitionKey(dict(zip(self._dimension_names, partition_keys)))
+
+    def __len__(self) -> int:
+        return reduce(lambda x, y: x * len(y), self._partition_keys_by_dimension, 1)
+
+    @overload
+    def __getitem__(self, index: int) -> MultiPartitionKey: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[MultiPartitionKey]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[MultiPartitionKey, Sequence[MultiPartitionKey]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        num_keys = len(self)
+        if index < 0:
+            index += num_keys
+        if index < 0 or index >= num_keys:
+            raise IndexError("MultiPartitionKeySequence index out of range")
+
+        # the last dimension varies fastest, as in itertools.product
+        partition_keys = []
+        for dimension_keys in reversed(self._partition_keys_by_dimension):
+            index, dimension_index = divmod(index, len(dimension_keys))
+            partition_keys.append(dimension_keys[dimension_index])
+        return self._get_key(list(reversed(partition_keys)))
+
+    def __iter__(self) -> Iterator[MultiPartitionKey]:
+        for partition_keys in itertools.product(*self._partition_keys_by_dimension):
+            yield self._get_key(partition_keys)
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+
+        if self._partition_key_sets_by_dimension is None:
+            self._partition_key_sets_by_dimension = [
+                set(dimension_keys) for dimension_keys in self._partition_keys_by_dimension
+            ]
+
+        partition_keys = (
+            [value.keys_by_dimension.get(name) for name in self._dimension_names]
+            if isinstance(value, MultiPartitionKey)
+            else value.split(MULTIPARTITION_KEY_DELIMITER)
+        )
+        return len(partition_keys) == len(self._dimension_names) and all(
+            partition_key in dimension_key_set
+            for partition_key, dimension_key_set in zip(
+                partition_keys, self._partition_key_sets_by_dimension
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiPartitionKeySequence):
+            return (
+                self._dimension_names == other._dimension_names
+                and self._partition_keys_by_dimension == other._partition_keys_by_dimension
+            )
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionKeySequence(dimensions={self._dimension_names}, size={len(self)})"
+
+
 class PartitionDimensionDefinition(
     NamedTuple(
         "_PartitionDimensionDefinition",
@@ -220,6 +310,15 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
         return DefaultPartitionsSubset
 
+    def subset_with_all_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        return MultiPartitionsSubset.all_partitions(
+            self, current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+
     def get_partition_keys_in_range(
         self,
         partition_key_range: PartitionKeyRange,
@@ -228,23 +327,19 @@ def get_partition_keys_in_range(
         start: MultiPartitionKey = self.get_partition_key_from_str(partition_key_range.start)
         end: MultiPartitionKey = self.get_partition_key_from_str(partition_key_range.end)
 
-        partition_key_sequences = [
-            partition_dim.partitions_def.get_partition_keys_in_range(
-                PartitionKeyRange(
-                    start.keys_by_dimension[partition_dim.name],
-                    end.keys_by_dimension[partition_dim.name],
-                ),
-                dynamic_partitions_store=dynamic_partitions_store,
-            )
-            for partition_dim in self._partitions_defs
-        ]
-
-        return [
-            MultiPartitionKey(
-                {self._partitions_defs[i].name: key for i, key in enumerate(partition_key_tuple)}
-            )
-            for partition_key_tuple in itertools.product(*partition_key_sequences)
-        ]
+        return MultiPartitionKeySequence(
+            self.partition_dimension_names,
+            [
+                partition_dim.partitions_def.get_partition_keys_in_range(
+                    PartitionKeyRange(
+                        start.keys_by_dimension[partition_dim.name],
+                        end.keys_by_dimension[partition_dim.name],
+                    ),
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+                for partition_dim in self._partitions_defs
+            ],
+        )
 
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
@@ -306,19 +401,15 @@ def has_partition_key(
     def _get_partition_keys(
         self, current_time: datetime, dynamic_partitions_store: Optional[DynamicPartitionsStore]
     ) -> Sequence[MultiPartitionKey]:
-        partition_key_sequences = [
-            partition_dim.partitions_def.get_partition_keys(
-                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
-            )
-            for partition_dim in self._partitions_defs
-        ]
-
-        return [
-            MultiPartitionKey(
-                {self._partitions_defs[i].name: key for i, key in enumerate(partition_key_tuple)}
-            )
-            for partition_key_tuple in itertools.product(*partition_key_sequences)
-        ]
+        return MultiPartitionKeySequence(
+            self.partition_dimension_names,
+            [
+                partition_dim.partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                )
+                for partition_dim in self._partitions_defs
+            ],
+        )
 
     @public
     def get_partition_keys(
@@ -548,6 +639,337 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+class MultiPartitionsSubset(PartitionsSubset[MultiPartitionKey]):
+    """A subset of the partitions of a MultiPartitionsDefinition, represented as a union of
+    disjoint products, each of which combines a subset of the partitions of the primary dimension
+    with a subset of the partitions of the secondary dimension.
+
+    This allows subsets spanning many partitions of both dimensions, such as the subset of all
+    partitions, to be stored and combined without enumerating the cross-product of their partition
+    keys. When serialized, this subset uses the same format as a DefaultPartitionsSubset.
+    """
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        products: Sequence[Tuple[PartitionsSubset, PartitionsSubset]],
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        # the primary subsets of the products are disjoint, and no product is empty
+        self._products = [
+            (primary_subset, secondary_subset)
+            for primary_subset, secondary_subset in products
+            if len(primary_subset) > 0 and len(secondary_subset) > 0
+        ]
+
+    @staticmethod
+    def all_partitions(
+        partitions_def: MultiPartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(
+            partitions_def,
+            [
+                (
+                    partitions_def.primary_dimension.partitions_def.subset_with_all_partitions(
+                        current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                    ),
+                    partitions_def.secondary_dimension.partitions_def.subset_with_all_partitions(
+                        current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                    ),
+                )
+            ],
+        )
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def products(self) -> Sequence[Tuple[PartitionsSubset, PartitionsSubset]]:
+        return self._products
+
+    def _empty_secondary_subset(self) -> PartitionsSubset:
+        return self._partitions_def.secondary_dimension.partitions_def.empty_subset()
+
+    def _to_multi_partitions_subset(self, other: PartitionsSubset) -> "MultiPartitionsSubset":
+        if isinstance(other, MultiPartitionsSubset):
+            return other
+        if isinstance(other, AllPartitionsSubset):
+            return MultiPartitionsSubset.all_partitions(
+                self._partitions_def, other.current_time, other.dynamic_partitions_store
+            )
+        return self._from_partition_keys(other.get_partition_keys())
+
+    def _from_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        primary_name = self._partitions_def.primary_dimension.name
+        secondary_name = self._partitions_def.secondary_dimension.name
+        secondary_keys_by_primary_key: Dict[str, Set[str]] = defaultdict(set)
+        for partition_key in partition_keys:
+            keys_by_dimension = self._partitions_def.get_partition_key_from_str(
+                partition_key
+            ).keys_by_dimension
+            secondary_keys_by_primary_key[keys_by_dimension[primary_name]].add(
+                keys_by_dimension[secondary_name]
+            )
+
+        secondary_partitions_def = self._partitions_def.secondary_dimension.partitions_def
+        primary_keys_by_secondary_keys: Dict[FrozenSet[str], List[str]] = defaultdict(list)
+        for primary_key, secondary_keys in secondary_keys_by_primary_key.items():
+            primary_keys_by_secondary_keys[frozenset(secondary_keys)].append(primary_key)
+        return self._from_primary_keys_by_secondary_subset(
+            [
+                (primary_keys, secondary_partitions_def.subset_with_partition_keys(secondary_keys))
+                for secondary_keys, primary_keys in primary_keys_by_secondary_keys.items()
+            ]
+        )
+
+    def _from_primary_keys_by_secondary_subset(
+        self, primary_keys_and_secondary_subsets: Sequence[Tuple[Sequence[str], PartitionsSubset]]
+    ) -> "MultiPartitionsSubset":
+        primary_partitions_def = self._partitions_def.primary_dimension.partitions_def
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            [
+                (primary_partitions_def.subset_with_partition_keys(primary_keys), secondary_subset)
+                for primary_keys, secondary_subset in primary_keys_and_secondary_subsets
+            ],
+        )
+
+    @cached_property
+    def _product_index_by_primary_key(self) -> Mapping[str, int]:
+        return {
+            primary_key: i
+            for i, (primary_subset, _) in enumerate(self._products)
+            for primary_key in primary_subset.get_partition_keys()
+        }
+
+    def _combine(
+        self,
+        other: "MultiPartitionsSubset",
+        secondary_fn: Callable[[PartitionsSubset, PartitionsSubset], PartitionsSubset],
+        include_other_only: bool,
+    ) -> PartitionsSubset:
+        """Applies secondary_fn to the secondary subsets of each overlapping pair of products of
+        the two subsets. secondary_fn must return an empty subset for two empty subsets.
+
+        Rather than intersecting every product of this subset with every product of the other,
+        this sweeps the primary partition keys once, grouping them by the pair of products they
+        belong to, so secondary_fn is applied once per distinct pair.
+        """
+        other_index_by_primary_key = other._product_index_by_primary_key  # noqa: SLF001
+        primary_keys_by_product_pair: Dict[Tuple[Optional[int], Optional[int]], List[str]] = (
+            defaultdict(list)
+        )
+        for primary_key, i in self._product_index_by_primary_key.items():
+            primary_keys_by_product_pair[(i, other_index_by_primary_key.get(primary_key))].append(
+                primary_key
+            )
+        if include_other_only:
+            for primary_key, j in other_index_by_primary_key.items():
+                if primary_key not in self._product_index_by_primary_key:
+                    primary_keys_by_product_pair[(None, j)].append(primary_key)
+
+        # merge products that share the same secondary subset, keyed by its partition keys
+        empty_secondary_subset = self._empty_secondary_subset()
+        merged_products: Dict[FrozenSet[str], Tuple[List[str], PartitionsSubset]] = {}
+        for (i, j), primary_keys in primary_keys_by_product_pair.items():
+            secondary_subset = secondary_fn(
+                self._products[i][1] if i is not None else empty_secondary_subset,
+                other.products[j][1] if j is not None else empty_secondary_subset,
+            )
+            if len(secondary_subset) == 0:
+                continue
+            secondary_keys = frozenset(secondary_subset.get_partition_keys())
+            if secondary_keys in merged_products:
+                merged_products[secondary_keys][0].extend(primary_keys)
+            else:
+                merged_products[secondary_keys] = (list(primary_keys), secondary_subset)
+
+        # when the products hold fewer than two partition keys each on average, a plain set of
+        # keys is cheaper to store and combine than the products
+        num_partition_keys = sum(
+            len(primary_keys) * len(secondary_subset)
+            for primary_keys, secondary_subset in merged_products.values()
+        )
+        if len(merged_products) > 1 and 2 * len(merged_products) > num_partition_keys:
+            primary_name = self._partitions_def.primary_dimension.name
+            secondary_name = self._partitions_def.secondary_dimension.name
+            return DefaultPartitionsSubset(
+                {
+                    MultiPartitionKey({primary_name: primary_key, secondary_name: secondary_key})
+                    for primary_keys, secondary_subset in merged_products.values()
+                    for primary_key in primary_keys
+                    for secondary_key in secondary_subset.get_partition_keys()
+                }
+            )
+
+        return self._from_primary_keys_by_secondary_subset(list(merged_products.values()))
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        return (
+            MultiPartitionsSubset.all_partitions(
+                self._partitions_def,
+                current_time=current_time,
+                dynamic_partitions_store=dynamic_partitions_store,
+            )
+            - self
+        ).get_partition_keys()
+
+    def get_partition_keys(self) -> Iterable[MultiPartitionKey]:
+        primary_name = self._partitions_def.primary_dimension.name
+        secondary_name = self._partitions_def.secondary_dimension.name
+        return [
+            MultiPartitionKey({primary_name: primary_key, secondary_name: secondary_key})
+            for primary_subset, secondary_subset in self._products
+            for primary_key in primary_subset.get_partition_keys()
+            for secondary_key in secondary_subset.get_partition_keys()
+        ]
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return self.to_serializable_subset().get_partition_key_ranges(
+            partitions_def,
+            current_time=current_time,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        return self | self._from_partition_keys(partition_keys)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        return self._combine(
+            self._to_multi_partitions_subset(other),
+            lambda secondary_subset, other_secondary_subset: secondary_subset
+            | other_secondary_subset,
+            include_other_only=True,
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return self
+        if not isinstance(other, MultiPartitionsSubset):
+            return DefaultPartitionsSubset(
+                {
+                    partition_key
+                    for partition_key in other.get_partition_keys()
+                    if partition_key in self
+                }
+            )
+        return self._combine(
+            other,
+            lambda secondary_subset, other_secondary_subset: secondary_subset
+            & other_secondary_subset,
+            include_other_only=False,
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self.empty_subset()
+        return self._combine(
+            self._to_multi_partitions_subset(other),
+            lambda secondary_subset, other_secondary_subset: secondary_subset
+            - other_secondary_subset,
+            include_other_only=False,
+        )
+
+    def serialize(self) -> str:
+        return self.to_serializable_subset().serialize()
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        return DefaultPartitionsSubset.from_serialized(partitions_def, serialized)
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __len__(self) -> int:
+        return sum(
+            len(primary_subset) * len(secondary_subset)
+            for primary_subset, secondary_subset in self._products
+        )
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        if not isinstance(value, MultiPartitionKey):
+            if len(value.split(MULTIPARTITION_KEY_DELIMITER)) != len(
+                self._partitions_def.partitions_defs
+            ):
+                return False
+            value = self._partitions_def.get_partition_key_from_str(value)
+
+        keys_by_dimension = value.keys_by_dimension
+        primary_key = keys_by_dimension.get(self._partitions_def.primary_dimension.name)
+        secondary_key = keys_by_dimension.get(self._partitions_def.secondary_dimension.name)
+        if len(self._products) <= 1:
+            return any(
+                primary_key in primary_subset and secondary_key in secondary_subset
+                for primary_subset, secondary_subset in self._products
+            )
+        i = self._product_index_by_primary_key.get(primary_key)
+        return i is not None and secondary_key in self._products[i][1]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiPartitionsSubset):
+            return (
+                self._partitions_def == other.partitions_def
+                and len(self) == len(other)
+                and len(self - other) == 0
+            )
+        return (
+            isinstance(other, DefaultPartitionsSubset)
+            and len(self) == len(other)
+            and all(partition_key in self for partition_key in other.get_partition_keys())
+        )
+
+    # A MultiPartitionsSubset is equal to any subset with the same partition keys, including a
+    # DefaultPartitionsSubset, so a hash consistent with __eq__ would have to enumerate all of its
+    # partition keys. Like DefaultPartitionsSubset, it is not hashable.
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset(products={self._products})"
+
+    def empty_subset(
+        self, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(self._partitions_def, [])
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
@@ -18,6 +18,8 @@
     NamedTuple,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -35,6 +37,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import (
@@ -355,6 +358,32 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return StaticPartitionsSubset
+
+    @cached_method
+    def get_partition_key_indices(self) -> Mapping[str, int]:
+        """Returns a mapping from each partition key to its position in the partitions definition."""
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
+    def has_partition_key(
+        self,
+        partition_key: str,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> bool:
+        return partition_key in self.get_partition_key_indices()
+
+    def get_serializable_unique_identifier(
+        self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
+    ) -> str:
+        return self._get_serializable_unique_identifier()
+
+    @cached_method
+    def _get_serializable_unique_identifier(self) -> str:
+        return super().get_serializable_unique_identifier()
+
     def __hash__(self):
         return hash(self.__repr__())
 
@@ -1184,7 +1213,36 @@ def can_deserialize(
             data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
         )
 
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        from .multi_dimensional_partitions import MultiPartitionsSubset
+
+        if isinstance(other, MultiPartitionsSubset):
+            return other | self
+        return super().__or__(other)
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        from .multi_dimensional_partitions import MultiPartitionsSubset
+
+        if isinstance(other, MultiPartitionsSubset):
+            return DefaultPartitionsSubset(
+                {partition_key for partition_key in self.subset if partition_key not in other}
+            )
+        return super().__sub__(other)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        from .multi_dimensional_partitions import MultiPartitionsSubset
+
+        if isinstance(other, MultiPartitionsSubset):
+            return DefaultPartitionsSubset(
+                {partition_key for partition_key in self.subset if partition_key in other}
+            )
+        return super().__and__(other)
+
     def __eq__(self, other: object) -> bool:
+        from .multi_dimensional_partitions import MultiPartitionsSubset
+
+        if isinstance(other, (MultiPartitionsSubset, StaticPartitionsSubset)):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1203,6 +1261,271 @@ def empty_subset(
         return cls()
 
 
+class StaticPartitionsSubsetSerializer(NamedTupleSerializer):
+    """Serializes StaticPartitionsSubsets in the DefaultPartitionsSubset format, since serdes-serialized
+    objects that contain partitions subsets (e.g. AssetSubsets) don't store the partitions definition
+    needed to resolve the positions of a bitmap.
+    """
+
+    def get_storage_name(self) -> str:
+        return "DefaultPartitionsSubset"
+
+    def object_as_mapping(self, value: "StaticPartitionsSubset") -> Mapping[str, Any]:
+        return {"subset": set(value.get_partition_keys())}
+
+
+@whitelist_for_serdes(serializer=StaticPartitionsSubsetSerializer)
+class StaticPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple(
+        "_StaticPartitionsSubset",
+        [
+            ("partitions_def", StaticPartitionsDefinition),
+            ("bitmap", int),
+            ("unknown_keys", AbstractSet[str]),
+        ],
+    ),
+):
+    """A subset of the partitions of a StaticPartitionsDefinition, stored as a bitmap in which bit i
+    is set if the partition key at position i of the partitions definition is in the subset. Set
+    operations between subsets of the same partitions definition are bitwise integer operations.
+
+    Keys that are not in the partitions definition (e.g. keys of partitions that have since been
+    removed) are kept in a separate set, so that this subset contains the same keys as a
+    DefaultPartitionsSubset would.
+
+    Serialized subsets (version 2) store the bitmap as a hex string, alongside a hash of the
+    partition keys of the partitions definition to guard against deserializing a bitmap against a
+    definition whose partition keys have since changed. Subsets serialized in the
+    DefaultPartitionsSubset format (version 1) can also be deserialized. Versions that predate the
+    bitmap format raise a DagsterInvalidDeserializationVersionError for version 2 subsets, as they
+    do for any other unknown version.
+    """
+
+    SERIALIZATION_VERSION = 2
+
+    def __new__(
+        cls,
+        partitions_def: StaticPartitionsDefinition,
+        bitmap: int = 0,
+        unknown_keys: Optional[AbstractSet[str]] = None,
+    ):
+        return super(StaticPartitionsSubset, cls).__new__(
+            cls,
+            partitions_def=check.inst_param(
+                partitions_def, "partitions_def", StaticPartitionsDefinition
+            ),
+            bitmap=check.int_param(bitmap, "bitmap"),
+            unknown_keys=frozenset(check.opt_set_param(unknown_keys, "unknown_keys")),
+        )
+
+    def _get_bitmap_for_partition_keys(self, partition_keys: Iterable[str]) -> Tuple[int, Set[str]]:
+        partition_key_indices = self.partitions_def.get_partition_key_indices()
+        bitmap = 0
+        unknown_keys = set()
+        for partition_key in partition_keys:
+            index = partition_key_indices.get(partition_key)
+            if index is None:
+                unknown_keys.add(partition_key)
+            else:
+                bitmap |= 1 << index
+        return bitmap, unknown_keys
+
+    def _get_partition_keys_for_bitmap(self, bitmap: int) -> Sequence[str]:
+        partition_keys = self.partitions_def.get_partition_keys()
+        # the binary representation of the bitmap, from the lowest bit to the highest
+        bits = bin(bitmap)[:1:-1]
+        return [partition_keys[i] for i, bit in enumerate(bits) if bit == "1"]
+
+    def _get_all_partitions_bitmap(self) -> int:
+        return (1 << len(self.partitions_def.get_partition_keys())) - 1
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return set(
+            self._get_partition_keys_for_bitmap(self._get_all_partitions_bitmap() & ~self.bitmap)
+        )
+
+    def get_partition_keys(self) -> Iterable[str]:
+        return {*self._get_partition_keys_for_bitmap(self.bitmap), *self.unknown_keys}
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self.partitions_def.get_partition_keys()
+        bits = bin(self.bitmap)[:1:-1]
+        result = []
+        range_start = None
+        for i, bit in enumerate(bits):
+            if bit == "1" and range_start is None:
+                range_start = i
+            elif bit == "0" and range_start is not None:
+                result.append(PartitionKeyRange(partition_keys[range_start], partition_keys[i - 1]))
+                range_start = None
+        if range_start is not None:
+            # the highest bit of the bitmap is always set
+            result.append(
+                PartitionKeyRange(partition_keys[range_start], partition_keys[len(bits) - 1])
+            )
+        return result
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "StaticPartitionsSubset":
+        bitmap, unknown_keys = self._get_bitmap_for_partition_keys(partition_keys)
+        return StaticPartitionsSubset(
+            self.partitions_def,
+            bitmap=self.bitmap | bitmap,
+            unknown_keys=self.unknown_keys | unknown_keys,
+        )
+
+    def _has_same_partitions_def(self, other: "StaticPartitionsSubset") -> bool:
+        return (
+            other.partitions_def is self.partitions_def
+            or other.partitions_def == self.partitions_def
+        )
+
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other):
+            return StaticPartitionsSubset(
+                self.partitions_def,
+                bitmap=self.bitmap | other.bitmap,
+                unknown_keys=self.unknown_keys | other.unknown_keys,
+            )
+        return super().__or__(other)
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other):
+            return StaticPartitionsSubset(
+                self.partitions_def,
+                bitmap=self.bitmap & ~other.bitmap,
+                unknown_keys=self.unknown_keys - other.unknown_keys,
+            )
+        # Anything - AllPartitionsSubset = Empty
+        if isinstance(other, AllPartitionsSubset):
+            return StaticPartitionsSubset(self.partitions_def)
+        return StaticPartitionsSubset(self.partitions_def).with_partition_keys(
+            partition_key
+            for partition_key in self.get_partition_keys()
+            if partition_key not in other
+        )
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other):
+            return StaticPartitionsSubset(
+                self.partitions_def,
+                bitmap=self.bitmap & other.bitmap,
+                unknown_keys=self.unknown_keys & other.unknown_keys,
+            )
+        # Anything & AllPartitionsSubset = Anything
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        return StaticPartitionsSubset(self.partitions_def).with_partition_keys(
+            partition_key for partition_key in self.get_partition_keys() if partition_key in other
+        )
+
+    def serialize(self) -> str:
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partitions_def_id": self.partitions_def.get_serializable_unique_identifier(),
+                "bitmap": format(self.bitmap, "x"),
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "unknown_keys": sorted(self.unknown_keys),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "StaticPartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", StaticPartitionsDefinition
+        )
+        data = json.loads(serialized)
+
+        if (
+            isinstance(data, list)
+            or data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION
+        ):
+            # subsets serialized in the DefaultPartitionsSubset format
+            return cls.empty_subset(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(partitions_def, serialized).subset
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+        if data.get("partitions_def_id") != partitions_def.get_serializable_unique_identifier():
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset for a StaticPartitionsDefinition whose"
+                " partition keys have changed since the subset was serialized."
+            )
+        return cls(
+            partitions_def,
+            bitmap=int(data["bitmap"], 16),
+            unknown_keys=set(data.get("unknown_keys", [])),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        data = json.loads(serialized)
+        if isinstance(data, dict) and data.get("version") == cls.SERIALIZATION_VERSION:
+            return (
+                data.get("partitions_def_id") == partitions_def.get_serializable_unique_identifier()
+            )
+
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StaticPartitionsSubset):
+            return (
+                self._has_same_partitions_def(other)
+                and self.bitmap == other.bitmap
+                and self.unknown_keys == other.unknown_keys
+            )
+        return isinstance(other, DefaultPartitionsSubset) and set(self.get_partition_keys()) == set(
+            other.subset
+        )
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1") + len(self.unknown_keys)
+
+    def __contains__(self, value) -> bool:
+        index = self.partitions_def.get_partition_key_indices().get(value)
+        if index is None:
+            return value in self.unknown_keys
+        return bool(self.bitmap >> index & 1)
+
+    def __repr__(self) -> str:
+        return f"StaticPartitionsSubset(subset={set(self.get_partition_keys())})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "StaticPartitionsSubset":
+        return cls(check.inst_param(partitions_def, "partitions_def", StaticPartitionsDefinition))
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -1276,8 +1599,18 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         return other
 
     def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        from .multi_dimensional_partitions import MultiPartitionsDefinition
+
         if self == other:
             return self.partitions_def.empty_subset()
+        if isinstance(self.partitions_def, MultiPartitionsDefinition):
+            return (
+                self.partitions_def.subset_with_all_partitions(
+                    current_time=self.current_time,
+                    dynamic_partitions_store=self.dynamic_partitions_store,
+                )
+                - other
+            )
         return self.partitions_def.empty_subset().with_partition_keys(
             set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
         )
@@ -1286,7 +1619,10 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         return self
 
     def __len__(self) -> int:
-        return len(self.get_partition_keys())
+        return self.partitions_def.get_num_partitions(
+            current_time=self.current_time,
+            dynamic_partitions_store=self.dynamic_partitions_store,
+        )
 
     def __contains__(self, value) -> bool:
         return self.partitions_def.has_partition_key(
@@ -4,6 +4,8 @@
 from collections import defaultdict
 from datetime import datetime
 from typing import (
+    Any,
+    Callable,
     Collection,
     Dict,
     List,
@@ -13,6 +15,7 @@
     Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -32,8 +35,15 @@
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._serdes import whitelist_for_serdes
 from dagster._utils.cached_method import cached_method
+from dagster._utils.lru_cache import LRUCache
 from dagster._utils.warnings import disable_dagster_warnings
 
+T = TypeVar("T")
+
+# Bounds on the number of results and single-partition subsets that a
+# CachingPartitionMappingResolver holds at once.
+PARTITION_MAPPING_RESOLVER_CACHE_SIZE = 4096
+
 
 class UpstreamPartitionsResult(NamedTuple):
     """Represents the result of mapping a PartitionsSubset to the corresponding
@@ -1140,3 +1150,116 @@ def get_builtin_partition_mapping_types() -> Tuple[Type[PartitionMapping], ...]:
         MultiToSingleDimensionPartitionMapping,
         MultiPartitionMapping,
     )
+
+
+class CachingPartitionMappingResolver:
+    """Maps partitions subsets between assets with PartitionMappings, memoizing the results. Intended
+    for use within the scope of a single evaluation (e.g. an asset daemon tick or an asset backfill
+    iteration), in which the same subsets are often mapped between the same assets many times.
+
+    Results are keyed on the identity of the partition mapping, partitions definitions and
+    partitions subset that they were computed from. Each cached result holds references to these
+    objects, so their ids can't be reused by other objects while the result is cached. At most
+    PARTITION_MAPPING_RESOLVER_CACHE_SIZE results are kept, evicting the least recently used
+    ones, so a long-lived resolver does not keep every subset it has mapped alive.
+
+    Args:
+        dynamic_partitions_store (DynamicPartitionsStore): The store used to fetch dynamic
+            partitions when mapping partitions. Must not change over the lifetime of the resolver.
+    """
+
+    def __init__(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        max_size: int = PARTITION_MAPPING_RESOLVER_CACHE_SIZE,
+    ):
+        self._dynamic_partitions_store = dynamic_partitions_store
+        self._cache: LRUCache[Tuple, Tuple[Tuple, Any]] = LRUCache(max_size)
+        self._subsets_by_partition_key: LRUCache[
+            Tuple[int, str], Tuple[PartitionsDefinition, PartitionsSubset]
+        ] = LRUCache(max_size)
+
+    @property
+    def num_hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def num_misses(self) -> int:
+        return self._cache.misses
+
+    def _get_or_compute(
+        self, key: Tuple, referenced_objects: Tuple, compute_fn: Callable[[], T]
+    ) -> T:
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        result = compute_fn()
+        self._cache.set(key, (referenced_objects, result))
+        return result
+
+    def get_subset_for_partition_key(
+        self, partitions_def: PartitionsDefinition, partition_key: str
+    ) -> PartitionsSubset:
+        """Returns a subset containing only the given partition key. Repeated calls with the same
+        arguments return the same subset while it is cached, so that results mapped from it can be
+        reused.
+        """
+        key = (id(partitions_def), partition_key)
+        cached = self._subsets_by_partition_key.get(key)
+        if cached is None:
+            cached = (partitions_def, partitions_def.subset_with_partition_keys([partition_key]))
+            self._subsets_by_partition_key.set(key, cached)
+        return cached[1]
+
+    def get_downstream_partitions_for_partitions(
+        self,
+        partition_mapping: PartitionMapping,
+        upstream_partitions_subset: PartitionsSubset,
+        upstream_partitions_def: PartitionsDefinition,
+        downstream_partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+    ) -> PartitionsSubset:
+        objects = (
+            partition_mapping,
+            upstream_partitions_subset,
+            upstream_partitions_def,
+            downstream_partitions_def,
+        )
+        return self._get_or_compute(
+            ("downstream", current_time, *(id(obj) for obj in objects)),
+            objects,
+            lambda: partition_mapping.get_downstream_partitions_for_partitions(
+                upstream_partitions_subset,
+                upstream_partitions_def,
+                downstream_partitions_def=downstream_partitions_def,
+                current_time=current_time,
+                dynamic_partitions_store=self._dynamic_partitions_store,
+            ),
+        )
+
+    def get_upstream_mapped_partitions_result_for_partitions(
+        self,
+        partition_mapping: PartitionMapping,
+        downstream_partitions_subset: Optional[PartitionsSubset],
+        downstream_partitions_def: Optional[PartitionsDefinition],
+        upstream_partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+    ) -> UpstreamPartitionsResult:
+        objects = (
+            partition_mapping,
+            downstream_partitions_subset,
+            downstream_partitions_def,
+            upstream_partitions_def,
+        )
+        return self._get_or_compute(
+            ("upstream", current_time, *(id(obj) for obj in objects)),
+            objects,
+            lambda: partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+                downstream_partitions_subset,
+                downstream_partitions_def=downstream_partitions_def,
+                upstream_partitions_def=upstream_partitions_def,
+                current_time=current_time,
+                dynamic_partitions_store=self._dynamic_partitions_store,
+            ),
+        )
@@ -1,6 +1,7 @@
 import functools
 import hashlib
 import json
+import math
 import re
 from abc import abstractmethod, abstractproperty
 from datetime import datetime, timedelta
@@ -52,6 +53,7 @@
 from dagster._utils.schedules import (
     cron_string_iterator,
     cron_string_repeats_every_hour,
+    get_schedule_time_on_date,
     is_valid_cron_schedule,
     reverse_cron_string_iterator,
 )
@@ -220,6 +222,53 @@ def unpack(
         return None
 
 
+@functools.lru_cache(maxsize=100)
+def get_fixed_cadence_period_seconds(cron_schedule: str, timezone: str) -> Optional[int]:
+    """Returns the number of seconds between consecutive ticks of the given cron schedule, if every
+    pair of consecutive ticks is the same number of seconds apart. Returns None otherwise.
+
+    Schedules that tick every hour or more often are evenly spaced in any timezone, since daylight
+    savings time transitions only shift the wall clock hour. Schedules that tick every few hours,
+    daily, or weekly are only evenly spaced in a timezone without daylight savings time
+    transitions.
+    """
+    if cron_schedule == "* * * * *":
+        return 60
+
+    match = re.fullmatch(r"\*/(\d+) \* \* \* \*", cron_schedule)
+    if match:
+        step = int(match.group(1))
+        return step * 60 if 0 < step < 60 and 60 % step == 0 else None
+
+    if re.fullmatch(r"\d+ \* \* \* \*", cron_schedule):
+        return 60 * 60
+
+    if timezone != "UTC":
+        return None
+
+    match = re.fullmatch(r"\d+ \*/(\d+) \* \* \*", cron_schedule)
+    if match:
+        step = int(match.group(1))
+        return step * 60 * 60 if 0 < step < 24 and 24 % step == 0 else None
+
+    period_days = get_fixed_cadence_period_days(cron_schedule)
+    return period_days * 24 * 60 * 60 if period_days is not None else None
+
+
+@functools.lru_cache(maxsize=100)
+def get_fixed_cadence_period_days(cron_schedule: str) -> Optional[int]:
+    """Returns the number of days between consecutive ticks of the given cron schedule, if it ticks
+    at the same time of day every day or every week. Returns None otherwise.
+    """
+    if re.fullmatch(r"\d+ \d+ \* \* \*", cron_schedule):
+        return 1
+
+    if re.fullmatch(r"\d+ \d+ \* \* \d+", cron_schedule):
+        return 7
+
+    return None
+
+
 @whitelist_for_serdes(
     field_serializers={"start": DatetimeFieldSerializer, "end": DatetimeFieldSerializer}
 )
@@ -377,6 +426,9 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self.has_fixed_cadence:
+            return self._get_fixed_cadence_num_partitions(current_timestamp)
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -408,6 +460,13 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        if self.has_fixed_cadence:
+            num_partitions = self._get_fixed_cadence_num_partitions(current_timestamp)
+            return [
+                self._get_fixed_cadence_partition_key(idx)
+                for idx in range(max(start_idx, 0), min(end_idx, num_partitions))
+            ]
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -471,6 +530,116 @@ def get_partition_keys(
 
         return partition_keys
 
+    @property
+    def fixed_cadence_period_seconds(self) -> Optional[int]:
+        """The number of seconds in each time window, if all time windows of this partitions
+        definition have the same length. If so, the index of the partition containing a given time
+        can be computed directly, rather than by iterating over the time windows.
+        """
+        return get_fixed_cadence_period_seconds(self.cron_schedule, self.timezone)
+
+    @property
+    def fixed_cadence_period_days(self) -> Optional[int]:
+        """The number of days in each time window, if each time window starts at the same time of
+        day. Time windows that span a daylight savings time transition are longer or shorter than
+        the others, but the index of the partition containing a given time can still be computed
+        directly from the number of days between the time and the start of the first partition.
+        """
+        return get_fixed_cadence_period_days(self.cron_schedule)
+
+    @property
+    def has_fixed_cadence(self) -> bool:
+        return (
+            self.fixed_cadence_period_seconds is not None
+            or self.fixed_cadence_period_days is not None
+        )
+
+    @functools.lru_cache(maxsize=100)
+    def _get_fixed_cadence_first_start(self) -> PendulumDateTime:
+        # the first partition starts at the first tick of the cron schedule at or after the start
+        return next(iter(self._iterate_time_windows(self.start))).start
+
+    def _get_fixed_cadence_start(self, idx: int) -> PendulumDateTime:
+        """Returns the start of the time window with the given index, relative to the first
+        partition.
+        """
+        first_start = self._get_fixed_cadence_first_start()
+        period = self.fixed_cadence_period_seconds
+        if period is not None:
+            return pendulum.from_timestamp(first_start.timestamp() + idx * period, tz=self.timezone)
+
+        minute, hour = self.cron_schedule.split(" ")[:2]
+        return get_schedule_time_on_date(
+            first_start.date()
+            + timedelta(days=idx * check.not_none(self.fixed_cadence_period_days)),
+            int(hour),
+            int(minute),
+            self.timezone,
+        )
+
+    def _get_fixed_cadence_index_for_timestamp(self, timestamp: float) -> int:
+        """Returns the index of the time window that contains the given timestamp, relative to the
+        first partition. The index is negative if the timestamp is before the first partition.
+        """
+        first_start = self._get_fixed_cadence_first_start()
+        period = self.fixed_cadence_period_seconds
+        if period is not None:
+            return math.floor((timestamp - first_start.timestamp()) / period)
+
+        # each time window starts on the local date that is a whole number of periods after the
+        # start of the first partition, so the window containing the timestamp starts on the
+        # latest such date at or before the local date of the timestamp, or the one before that
+        # if the timestamp is earlier in the day than the start of the window
+        num_days = (
+            pendulum.from_timestamp(timestamp, tz=self.timezone).date() - first_start.date()
+        ).days
+        idx = num_days // check.not_none(self.fixed_cadence_period_days)
+        if self._get_fixed_cadence_start(idx).timestamp() > timestamp:
+            idx -= 1
+        return idx
+
+    def _get_fixed_cadence_time_window(self, idx: int) -> TimeWindow:
+        return TimeWindow(
+            self._get_fixed_cadence_start(idx), self._get_fixed_cadence_start(idx + 1)
+        )
+
+    def _get_fixed_cadence_partition_key(self, idx: int) -> str:
+        return dst_safe_strftime(
+            self._get_fixed_cadence_start(idx),
+            self.timezone,
+            self.fmt,
+            self.cron_schedule,
+        )
+
+    def _get_fixed_cadence_num_partitions(self, current_timestamp: float) -> int:
+        # the number of time windows that end at or before the current time
+        num_partitions = max(
+            self._get_fixed_cadence_index_for_timestamp(current_timestamp), 0
+        ) + max(self.end_offset, 0)
+        if self.end:
+            # the number of time windows that end at or before the end of the partitions definition
+            num_partitions = min(
+                num_partitions,
+                max(self._get_fixed_cadence_index_for_timestamp(self.end.timestamp()), 0),
+            )
+        return max(num_partitions + min(self.end_offset, 0), 0)
+
+    def _get_fixed_cadence_first_index_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the first time window that starts at or after the given timestamp."""
+        idx = self._get_fixed_cadence_index_for_timestamp(timestamp)
+        if self._get_fixed_cadence_start(idx).timestamp() < timestamp:
+            idx += 1
+        return idx
+
+    def get_num_partitions_in_time_window(self, time_window: TimeWindow) -> int:
+        """Returns the number of partitions that start within the given time window."""
+        if not self.has_fixed_cadence:
+            return len(self.get_partition_keys_in_time_window(time_window))
+
+        start_idx = self._get_fixed_cadence_first_index_at_or_after(time_window.start.timestamp())
+        end_idx = self._get_fixed_cadence_first_index_at_or_after(time_window.end.timestamp())
+        return max(end_idx - start_idx, 0)
+
     def __str__(self) -> str:
         schedule_str = (
             self.schedule_type.value.capitalize() if self.schedule_type else self.cron_schedule
@@ -678,6 +847,13 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
+        elif self.has_fixed_cadence:
+            num_partitions = self._get_fixed_cadence_num_partitions(current_time.timestamp())
+            return (
+                self._get_fixed_cadence_time_window(num_partitions - 1)
+                if num_partitions > 0
+                else None
+            )
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
@@ -949,6 +1125,13 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        if self.has_fixed_cadence:
+            idx = self._get_fixed_cadence_index_for_timestamp(timestamp)
+            time_window = self._get_fixed_cadence_time_window(idx)
+            if end_closed and time_window.start.timestamp() == timestamp:
+                time_window = self._get_fixed_cadence_time_window(idx - 1)
+            return dst_safe_strftime(time_window.start, self.timezone, self.fmt, self.cron_schedule)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -1830,7 +2013,7 @@ def tuples_to_time_windows(tuples):
             # backwards compatibility
             time_windows = tuples_to_time_windows(loaded)
             num_partitions = sum(
-                len(partitions_def.get_partition_keys_in_time_window(time_window))
+                partitions_def.get_num_partitions_in_time_window(time_window)
                 for time_window in time_windows
             )
         elif isinstance(loaded, dict) and (
@@ -2151,7 +2334,7 @@ def num_partitions(self) -> int:
         num_partitions_ = self._asdict()["num_partitions"]
         if num_partitions_ is None:
             return sum(
-                len(self.partitions_def.get_partition_keys_in_time_window(time_window))
+                self.partitions_def.get_num_partitions_in_time_window(time_window)
                 for time_window in self.included_time_windows
             )
         return num_partitions_
@@ -2161,7 +2344,7 @@ def _num_partitions_from_time_windows(
         cls, partitions_def: TimeWindowPartitionsDefinition, time_windows: Sequence[TimeWindow]
     ) -> int:
         return sum(
-            len(partitions_def.get_partition_keys_in_time_window(time_window))
+            partitions_def.get_num_partitions_in_time_window(time_window)
             for time_window in time_windows
         )
 
@@ -8,10 +8,11 @@
 import dagster._check as check
 from dagster._annotations import PublicAttr
 from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
-from dagster._core.errors import DagsterInvalidInvocationError
+from dagster._core.errors import DagsterEventLogInvalidForRun, DagsterInvalidInvocationError
 from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import deserialize_value, whitelist_for_serdes
+from dagster._serdes.errors import DeserializationError
 from dagster._seven import json
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
@@ -135,6 +136,108 @@ def asset_observation(self) -> Optional[AssetObservation]:
         return self.event_log_entry.asset_observation
 
 
+class LazyEventLogRecord:
+    """A record of a stored event whose event log entry is only deserialized when first accessed.
+
+    The storage id, run id, asset key and partition key are read from the indexed columns of the
+    row, so callers that only need those never deserialize the entry. Rows written before the
+    asset key or partition columns were backfilled fall back to the entry.
+
+    Lazy records are not EventLogRecords: call `to_event_log_record` to materialize one, e.g.
+    before serializing it or handing it to code that expects an EventLogRecord.
+    """
+
+    __slots__ = (
+        "_storage_id",
+        "_serialized_event",
+        "_run_id",
+        "_asset_key_str",
+        "_partition",
+        "_event_log_entry",
+    )
+
+    def __init__(
+        self,
+        storage_id: int,
+        run_id: str,
+        serialized_event: Optional[str] = None,
+        asset_key_str: Optional[str] = None,
+        partition: Optional[str] = None,
+        event_log_entry: Optional[EventLogEntry] = None,
+    ):
+        check.invariant(
+            serialized_event is not None or event_log_entry is not None,
+            "Must provide either serialized_event or event_log_entry",
+        )
+        self._storage_id = check.int_param(storage_id, "storage_id")
+        self._run_id = check.str_param(run_id, "run_id")
+        self._serialized_event = check.opt_str_param(serialized_event, "serialized_event")
+        self._asset_key_str = check.opt_str_param(asset_key_str, "asset_key_str")
+        self._partition = check.opt_str_param(partition, "partition")
+        self._event_log_entry = check.opt_inst_param(
+            event_log_entry, "event_log_entry", EventLogEntry
+        )
+
+    @staticmethod
+    def from_event_log_record(record: EventLogRecord) -> "LazyEventLogRecord":
+        """Wraps an already deserialized EventLogRecord."""
+        return LazyEventLogRecord(
+            storage_id=record.storage_id,
+            run_id=record.run_id,
+            event_log_entry=record.event_log_entry,
+        )
+
+    @property
+    def storage_id(self) -> int:
+        return self._storage_id
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the event log entry of this record has been deserialized."""
+        return self._event_log_entry is not None
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        """The event log entry of this record, deserialized on first access.
+
+        Raises DagsterEventLogInvalidForRun if the stored entry cannot be deserialized.
+        """
+        if self._event_log_entry is None:
+            try:
+                self._event_log_entry = deserialize_value(
+                    check.not_none(self._serialized_event), EventLogEntry
+                )
+            except (json.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=self._run_id) from err
+        return self._event_log_entry
+
+    @property
+    def asset_key(self) -> Optional[AssetKey]:
+        if self._asset_key_str:
+            return AssetKey.from_db_string(self._asset_key_str)
+        return self.to_event_log_record().asset_key
+
+    @property
+    def partition_key(self) -> Optional[str]:
+        if self._partition:
+            return self._partition
+        return self.to_event_log_record().partition_key
+
+    def to_event_log_record(self) -> EventLogRecord:
+        """Deserializes the event log entry if needed, and returns the equivalent EventLogRecord."""
+        return EventLogRecord(storage_id=self._storage_id, event_log_entry=self.event_log_entry)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyEventLogRecord(storage_id={self._storage_id}, run_id={self._run_id!r},"
+            f" is_loaded={self.is_loaded})"
+        )
+
+
 class EventRecordsResult(NamedTuple):
     """Return value for a query fetching event records from the instance.  Contains a list of event
     records, a cursor string, and a boolean indicating whether there are more records to fetch.
@@ -244,12 +244,6 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
-BATCH_WRITABLE_EVENTS = {
-    DagsterEventType.ASSET_MATERIALIZATION,
-    DagsterEventType.ASSET_OBSERVATION,
-}
-
 ASSET_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
@@ -1713,7 +1707,9 @@ def in_process(
 
     @staticmethod
     def multiprocess(
-        pid: int, step_keys_to_execute: Optional[Sequence[str]] = None
+        pid: int,
+        step_keys_to_execute: Optional[Sequence[str]] = None,
+        step_dispatch_latencies: Optional[Mapping[str, float]] = None,
     ) -> "EngineEventData":
         return EngineEventData(
             metadata={
@@ -1723,6 +1719,21 @@ def multiprocess(
                     if step_keys_to_execute
                     else {}
                 ),
+                **(
+                    {
+                        "step_dispatch_latency_ms": MetadataValue.json(
+                            {
+                                step_key: round(latency * 1000, 3)
+                                for step_key, latency in step_dispatch_latencies.items()
+                            }
+                        ),
+                        "max_step_dispatch_latency_ms": MetadataValue.float(
+                            round(max(step_dispatch_latencies.values()) * 1000, 3)
+                        ),
+                    }
+                    if step_dispatch_latencies
+                    else {}
+                ),
             }
         )
 
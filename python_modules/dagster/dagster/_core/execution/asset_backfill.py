@@ -1,5 +1,6 @@
 import json
 import logging
+import operator
 import os
 import time
 from collections import defaultdict
@@ -8,6 +9,8 @@
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -29,6 +32,7 @@
 )
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 from dagster._core.definitions.asset_selection import KeysAssetSelection
+from dagster._core.definitions.asset_subset import ValidAssetSubset
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
@@ -69,7 +73,7 @@
 )
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._serdes import whitelist_for_serdes
-from dagster._utils import utc_datetime_from_timestamp
+from dagster._utils import Counter, traced_counter_scope, utc_datetime_from_timestamp
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 from .submit_asset_runs import submit_asset_runs_in_chunks
@@ -190,6 +194,9 @@ def all_requested_partitions_marked_as_materialized_or_failed(self) -> bool:
     def get_target_root_asset_partitions(
         self, instance_queryer: CachingInstanceQueryer
     ) -> Iterable[AssetKeyPartitionKey]:
+        return list(self.get_target_root_subset(instance_queryer).iterate_asset_partitions())
+
+    def get_target_root_subset(self, instance_queryer: CachingInstanceQueryer) -> AssetGraphSubset:
         def _get_self_and_downstream_targeted_subset(
             initial_subset: AssetGraphSubset,
         ) -> AssetGraphSubset:
@@ -261,7 +268,7 @@ def _get_self_and_downstream_targeted_subset(
                 " This is likely a system error. Please report this issue to the Dagster team."
             )
 
-        return list(root_subset.iterate_asset_partitions())
+        return root_subset
 
     def get_target_partitions_subset(self, asset_key: AssetKey) -> PartitionsSubset:
         # Return the targeted partitions for the root partitioned asset keys
@@ -882,6 +889,20 @@ def execute_asset_backfill_iteration(
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
     """
+    # count the instance queries of each iteration separately
+    with traced_counter_scope() as query_counter:
+        yield from _execute_asset_backfill_iteration(
+            backfill, logger, workspace_process_context, instance, query_counter
+        )
+
+
+def _execute_asset_backfill_iteration(
+    backfill: "PartitionBackfill",
+    logger: logging.Logger,
+    workspace_process_context: IWorkspaceProcessContext,
+    instance: DagsterInstance,
+    query_counter: Counter,
+) -> Iterable[None]:
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 
     logger.info(f"Evaluating asset backfill {backfill.backfill_id}")
@@ -968,6 +989,17 @@ def execute_asset_backfill_iteration(
         logger.info(
             f"Updated asset backfill data for {backfill.backfill_id}: {updated_asset_backfill_data}"
         )
+        partition_mapping_resolver = instance_queryer.partition_mapping_resolver
+        logger.debug(
+            f"Partition mapping cache for {backfill.backfill_id}:"
+            f" {partition_mapping_resolver.num_hits} hits,"
+            f" {partition_mapping_resolver.num_misses} misses"
+        )
+        query_counts = query_counter.counts()
+        logger.debug(
+            f"Asset backfill {backfill.backfill_id} made {sum(query_counts.values())} instance"
+            f" queries: {query_counts}"
+        )
 
     elif backfill.status == BulkActionStatus.CANCELING:
         if not instance.run_coordinator:
@@ -1142,19 +1174,27 @@ def _get_failed_and_downstream_asset_partitions(
     instance_queryer: CachingInstanceQueryer,
     backfill_start_time: datetime,
 ) -> AssetGraphSubset:
-    failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
-        asset_graph.bfs_filter_asset_partitions(
-            instance_queryer,
-            lambda asset_partitions, _: any(
-                asset_partition in asset_backfill_data.target_subset
-                for asset_partition in asset_partitions
-            ),
-            _get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph),
-            evaluation_time=backfill_start_time,
+    def _get_targeted_subset_unit(candidates_unit: AssetGraphSubset) -> AssetGraphSubset:
+        # the partitions of the unit where any of its assets are targeted
+        return _combine_asset_subsets_in_unit(
+            asset_graph,
+            [
+                _get_valid_asset_subset(candidates_unit, asset_key, asset_graph)
+                & asset_backfill_data.target_subset.get_asset_subset(asset_key, asset_graph)
+                for asset_key in candidates_unit.asset_keys
+            ],
+            operator.or_,
+        )
+
+    return asset_graph.bfs_filter_asset_graph_subset(
+        instance_queryer,
+        lambda candidates_unit, _: _get_targeted_subset_unit(candidates_unit),
+        AssetGraphSubset.from_asset_partition_set(
+            set(_get_failed_asset_partitions(instance_queryer, backfill_id, asset_graph)),
+            asset_graph,
         ),
-        asset_graph,
+        current_time=backfill_start_time,
     )
-    return failed_and_downstream_subset
 
 
 def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int:
@@ -1187,12 +1227,10 @@ def execute_asset_backfill_iteration_inner(
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
     """
-    initial_candidates: Set[AssetKeyPartitionKey] = set()
+    initial_candidates = AssetGraphSubset()
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
     if request_roots:
-        initial_candidates.update(
-            asset_backfill_data.get_target_root_asset_partitions(instance_queryer)
-        )
+        initial_candidates = asset_backfill_data.get_target_root_subset(instance_queryer)
 
         yield None
 
@@ -1220,6 +1258,16 @@ def execute_asset_backfill_iteration_inner(
                 " AssetGraphSubset"
             )
 
+        instance_queryer.prefetch_asset_partition_data(
+            {
+                key
+                for asset_key in asset_backfill_data.target_subset.asset_keys
+                for key in {asset_key, *asset_graph.get(asset_key).parent_keys}
+            }
+        )
+
+        yield None
+
         parent_materialized_asset_partitions = set().union(
             *(
                 instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
@@ -1229,7 +1277,9 @@ def execute_asset_backfill_iteration_inner(
                 for asset_key in asset_backfill_data.target_subset.asset_keys
             )
         )
-        initial_candidates.update(parent_materialized_asset_partitions)
+        initial_candidates = AssetGraphSubset.from_asset_partition_set(
+            parent_materialized_asset_partitions, asset_graph
+        )
 
         yield None
 
@@ -1239,9 +1289,9 @@ def execute_asset_backfill_iteration_inner(
 
         yield None
 
-    asset_partitions_to_request = asset_graph.bfs_filter_asset_partitions(
+    subset_to_request = asset_graph.bfs_filter_asset_graph_subset(
         instance_queryer,
-        lambda unit, visited: should_backfill_atomic_asset_partitions_unit(
+        lambda unit, visited: get_asset_subset_unit_to_backfill(
             candidates_unit=unit,
             asset_partitions_to_request=visited,
             asset_graph=asset_graph,
@@ -1252,9 +1302,10 @@ def execute_asset_backfill_iteration_inner(
             dynamic_partitions_store=instance_queryer,
             current_time=backfill_start_time,
         ),
-        initial_asset_partitions=initial_candidates,
-        evaluation_time=backfill_start_time,
+        initial_subset=initial_candidates,
+        current_time=backfill_start_time,
     )
+    asset_partitions_to_request = set(subset_to_request.iterate_asset_partitions())
 
     # check if all assets have backfill policies if any of them do, otherwise, raise error
     asset_backfill_policies = [
@@ -1302,8 +1353,7 @@ def execute_asset_backfill_iteration_inner(
         or request_roots,
         materialized_subset=updated_materialized_subset,
         failed_and_downstream_subset=failed_and_downstream_subset,
-        requested_subset=asset_backfill_data.requested_subset
-        | AssetGraphSubset.from_asset_partition_set(set(asset_partitions_to_request), asset_graph),
+        requested_subset=asset_backfill_data.requested_subset | subset_to_request,
         backfill_start_time=backfill_start_time,
     )
     yield AssetBackfillIterationResult(run_requests, updated_asset_backfill_data)
@@ -1320,14 +1370,36 @@ def can_run_with_parent(
     """Returns if a given candidate can be materialized in the same run as a given parent on
     this tick.
     """
-    parent_target_subset = target_subset.get_asset_subset(parent.asset_key, asset_graph)
-    candidate_target_subset = target_subset.get_asset_subset(candidate.asset_key, asset_graph)
+    return (
+        parent.partition_key in asset_partitions_to_request_map[parent.asset_key]
+        or parent in candidates_unit
+    ) and can_run_with_parent_asset(
+        parent.asset_key,
+        candidate.asset_key,
+        asset_graph,
+        target_subset,
+        num_parent_partitions_to_request=len(asset_partitions_to_request_map[parent.asset_key]),
+    )
+
+
+def can_run_with_parent_asset(
+    parent_asset_key: AssetKey,
+    candidate_asset_key: AssetKey,
+    asset_graph: RemoteAssetGraph,
+    target_subset: AssetGraphSubset,
+    num_parent_partitions_to_request: int,
+) -> bool:
+    """Returns if partitions of a given candidate asset can be materialized in the same run as the
+    partitions of a given parent asset that are requested on this tick.
+    """
+    parent_target_subset = target_subset.get_asset_subset(parent_asset_key, asset_graph)
+    candidate_target_subset = target_subset.get_asset_subset(candidate_asset_key, asset_graph)
     partition_mapping = asset_graph.get_partition_mapping(
-        candidate.asset_key, parent_asset_key=parent.asset_key
+        candidate_asset_key, parent_asset_key=parent_asset_key
     )
 
-    parent_node = asset_graph.get(parent.asset_key)
-    candidate_node = asset_graph.get(candidate.asset_key)
+    parent_node = asset_graph.get(parent_asset_key)
+    candidate_node = asset_graph.get(candidate_asset_key)
     # checks if there is a simple partition mapping between the parent and the child
     has_identity_partition_mapping = (
         # both unpartitioned
@@ -1347,10 +1419,6 @@ def can_run_with_parent(
         parent_node.backfill_policy == candidate_node.backfill_policy
         and parent_node.priority_repository_handle is candidate_node.priority_repository_handle
         and parent_node.partitions_def == candidate_node.partitions_def
-        and (
-            parent.partition_key in asset_partitions_to_request_map[parent.asset_key]
-            or parent in candidates_unit
-        )
         and (
             # if there is a simple mapping between the parent and the child, then
             # with the parent
@@ -1367,11 +1435,10 @@ def can_run_with_parent(
                     parent_node.backfill_policy.max_partitions_per_run is None
                     # a single run can materialize all requested parent partitions
                     or parent_node.backfill_policy.max_partitions_per_run
-                    > len(asset_partitions_to_request_map[parent.asset_key])
+                    > num_parent_partitions_to_request
                 )
                 # all targeted parents are being requested this tick
-                and len(asset_partitions_to_request_map[parent.asset_key])
-                == parent_target_subset.size
+                and num_parent_partitions_to_request == parent_target_subset.size
             )
             # if all the above are true, then a single run can be launched this tick which
             # will materialize all requested partitions
@@ -1437,6 +1504,148 @@ def should_backfill_atomic_asset_partitions_unit(
     return True
 
 
+def get_asset_subset_unit_to_backfill(
+    asset_graph: RemoteAssetGraph,
+    candidates_unit: AssetGraphSubset,
+    asset_partitions_to_request: AssetGraphSubset,
+    target_subset: AssetGraphSubset,
+    requested_subset: AssetGraphSubset,
+    materialized_subset: AssetGraphSubset,
+    failed_and_downstream_subset: AssetGraphSubset,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    current_time: datetime,
+) -> AssetGraphSubset:
+    """Equivalent of should_backfill_atomic_asset_partitions_unit for a subset of the partitions of
+    a unit at a time. Returns the subset of candidates_unit that should be backfilled.
+
+    Args:
+    candidates_unit: The candidate partitions of a set of assets that must all be materialized if
+        any is materialized. A partition is only backfilled if it can be backfilled for all of the
+        assets in the unit.
+    """
+    to_backfill: List[ValidAssetSubset] = []
+    for candidate_key in candidates_unit.asset_keys:
+        candidate_subset = (
+            _get_valid_asset_subset(candidates_unit, candidate_key, asset_graph)
+            & target_subset.get_asset_subset(candidate_key, asset_graph)
+        ) - failed_and_downstream_subset.get_asset_subset(candidate_key, asset_graph)
+        candidate_subset = (
+            candidate_subset
+            - materialized_subset.get_asset_subset(candidate_key, asset_graph)
+            - requested_subset.get_asset_subset(candidate_key, asset_graph)
+        )
+
+        for parent_key in asset_graph.get(candidate_key).parent_keys:
+            if candidate_subset.size == 0:
+                break
+            if not asset_graph.has(parent_key):
+                # assets outside of the graph can't be targeted
+                continue
+
+            _check_parent_partitions_exist(
+                asset_graph,
+                candidate_subset,
+                parent_key,
+                dynamic_partitions_store=dynamic_partitions_store,
+                current_time=current_time,
+            )
+
+            # the targeted parent partitions that the candidates would have to wait for
+            blocking_parent_subset = _get_valid_asset_subset(
+                target_subset, parent_key, asset_graph
+            ) - materialized_subset.get_asset_subset(parent_key, asset_graph)
+            parent_subset_to_request = _get_valid_asset_subset(
+                asset_partitions_to_request, parent_key, asset_graph
+            )
+            if can_run_with_parent_asset(
+                parent_key,
+                candidate_key,
+                asset_graph,
+                target_subset,
+                num_parent_partitions_to_request=parent_subset_to_request.size,
+            ):
+                blocking_parent_subset = (
+                    blocking_parent_subset
+                    - parent_subset_to_request
+                    - candidates_unit.get_asset_subset(parent_key, asset_graph)
+                )
+            if blocking_parent_subset.size == 0:
+                continue
+
+            candidate_subset = candidate_subset - asset_graph.get_child_asset_subset(
+                blocking_parent_subset,
+                candidate_key,
+                dynamic_partitions_store=dynamic_partitions_store,
+                current_time=current_time,
+            )
+
+        to_backfill.append(candidate_subset)
+
+    return _combine_asset_subsets_in_unit(asset_graph, to_backfill, operator.and_)
+
+
+def _check_parent_partitions_exist(
+    asset_graph: RemoteAssetGraph,
+    candidate_subset: ValidAssetSubset,
+    parent_key: AssetKey,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    current_time: datetime,
+) -> None:
+    parent_partitions_def = asset_graph.get(parent_key).partitions_def
+    if parent_partitions_def is None:
+        return
+
+    candidate_key = candidate_subset.asset_key
+    candidate_partitions_def = asset_graph.get(candidate_key).partitions_def
+    required_but_nonexistent_partition_keys = (
+        asset_graph.get_partition_mapping(candidate_key, parent_key)
+        .get_upstream_mapped_partitions_result_for_partitions(
+            candidate_subset.subset_value if candidate_partitions_def is not None else None,
+            downstream_partitions_def=candidate_partitions_def,
+            upstream_partitions_def=parent_partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+            current_time=current_time,
+        )
+        .required_but_nonexistent_partition_keys
+    )
+    if required_but_nonexistent_partition_keys:
+        raise DagsterInvariantViolationError(
+            f"Asset {candidate_key.to_user_string()}"
+            " depends on invalid partition keys"
+            f" {[AssetKeyPartitionKey(parent_key, key) for key in required_but_nonexistent_partition_keys]}"
+        )
+
+
+def _get_valid_asset_subset(
+    asset_graph_subset: AssetGraphSubset, asset_key: AssetKey, asset_graph: BaseAssetGraph
+) -> ValidAssetSubset:
+    return asset_graph_subset.get_asset_subset(asset_key, asset_graph).as_valid(
+        asset_graph.get(asset_key).partitions_def
+    )
+
+
+def _combine_asset_subsets_in_unit(
+    asset_graph: BaseAssetGraph,
+    asset_subsets: Sequence[ValidAssetSubset],
+    oper: Callable[[Any, Any], Any],
+) -> AssetGraphSubset:
+    """Combines the subsets of the assets of a unit that share a partitions definition, so that each
+    of them contains the same partitions.
+    """
+    partitions_defs = {
+        asset_graph.get(asset_subset.asset_key).partitions_def for asset_subset in asset_subsets
+    }
+    if len(asset_subsets) <= 1 or len(partitions_defs) != 1:
+        return AssetGraphSubset.from_asset_subsets(asset_subsets)
+
+    value = asset_subsets[0].value
+    for asset_subset in asset_subsets[1:]:
+        value = oper(value, asset_subset.value)
+    return AssetGraphSubset.from_asset_subsets(
+        [asset_subset._replace(value=value) for asset_subset in asset_subsets]
+    )
+
+
 def _get_failed_asset_partitions(
     instance_queryer: CachingInstanceQueryer, backfill_id: str, asset_graph: RemoteAssetGraph
 ) -> Sequence[AssetKeyPartitionKey]:
@@ -56,10 +56,11 @@ def __exit__(
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> None:
-        to_clear = []
-        for step_key in self._pending_claims:
-            self._instance.event_log_storage.free_concurrency_slot_for_step(self._run_id, step_key)
-            to_clear.append(step_key)
+        to_clear = list(self._pending_claims)
+        if to_clear:
+            self._instance.event_log_storage.free_concurrency_slots_for_steps(
+                self._run_id, to_clear
+            )
 
         for step_key in to_clear:
             del self._pending_timeouts[step_key]
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -9,6 +9,20 @@
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._serdes import whitelist_for_serdes
 
+# The event types that contribute to the run stats reported by `build_run_stats_from_events`
+RUN_STATS_EVENT_TYPES = {
+    DagsterEventType.PIPELINE_ENQUEUED,
+    DagsterEventType.PIPELINE_STARTING,
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.PIPELINE_CANCELED,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
 
 def build_run_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
@@ -77,100 +91,52 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+# The event types that contribute to the per-step stats reported by
+# `build_run_step_stats_from_events`
+STEP_STATS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+} | MARKER_EVENTS
+
+
+def is_step_stats_event(event: EventLogEntry) -> bool:
+    """Whether the given event changes the per-step stats of the step that emitted it."""
+    if not event.is_dagster_event:
+        return False
+    dagster_event = event.get_dagster_event()
+    if not dagster_event.step_key or dagster_event.event_type not in STEP_STATS_EVENT_TYPES:
+        return False
+    if dagster_event.event_type in MARKER_EVENTS:
+        engine_event_data = dagster_event.engine_event_data
+        return bool(engine_event_data.marker_start or engine_event_data.marker_end)
+    return True
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    stats_data_by_step_key: Dict[str, RunStepStatsData] = {}
+    materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
     for event in records:
-        if not event.is_dagster_event:
+        if not is_step_stats_event(event):
             continue
         dagster_event = event.get_dagster_event()
-
-        step_key = dagster_event.step_key
-        if not step_key:
-            continue
-
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+        step_key = check.not_none(dagster_event.step_key)
+        stats_data = stats_data_by_step_key.get(step_key) or RunStepStatsData(step_key)
+        stats_data_by_step_key[step_key] = stats_data.with_event(event)
         if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
+            materialization_events[step_key].append(event)
 
     return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
-        )
-        for step_key, value in by_step_key.items()
+        stats_data.to_snapshot(run_id, materialization_events[step_key])
+        for step_key, stats_data in stats_data_by_step_key.items()
+        if stats_data.has_stats
     ]
 
 
@@ -243,3 +209,145 @@ def __new__(
             attempts_list=check.opt_sequence_param(attempts_list, "attempts_list", RunStepMarker),
             markers=check.opt_sequence_param(markers, "markers", RunStepMarker),
         )
+
+
+@whitelist_for_serdes
+class RunStepStatsData(
+    NamedTuple(
+        "_RunStepStatsData",
+        [
+            ("step_key", str),
+            ("has_stats", bool),
+            ("status", Optional[str]),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+            ("attempts", Optional[int]),
+            ("attempt_start_time", Optional[float]),
+            ("completed_attempts", Sequence[RunStepMarker]),
+            ("markers", Mapping[str, RunStepMarker]),
+            ("expectation_results", Sequence[ExpectationResult]),
+        ],
+    )
+):
+    """The per-step stats accumulated from the events of a step, folded one event at a time so
+    that they can be maintained incrementally as events are stored. Materialization events are
+    not accumulated, and are instead passed in when building the `RunStepKeyStatsSnapshot`.
+    """
+
+    def __new__(
+        cls,
+        step_key: str,
+        has_stats: bool = False,
+        status: Optional[str] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempts: Optional[int] = None,
+        attempt_start_time: Optional[float] = None,
+        completed_attempts: Optional[Sequence[RunStepMarker]] = None,
+        markers: Optional[Mapping[str, RunStepMarker]] = None,
+        expectation_results: Optional[Sequence[ExpectationResult]] = None,
+    ):
+        return super(RunStepStatsData, cls).__new__(
+            cls,
+            step_key=check.str_param(step_key, "step_key"),
+            has_stats=check.bool_param(has_stats, "has_stats"),
+            status=check.opt_str_param(status, "status"),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+            attempts=check.opt_int_param(attempts, "attempts"),
+            attempt_start_time=check.opt_float_param(attempt_start_time, "attempt_start_time"),
+            completed_attempts=check.opt_sequence_param(
+                completed_attempts, "completed_attempts", RunStepMarker
+            ),
+            markers=check.opt_mapping_param(
+                markers, "markers", key_type=str, value_type=RunStepMarker
+            ),
+            expectation_results=check.opt_sequence_param(
+                expectation_results, "expectation_results", ExpectationResult
+            ),
+        )
+
+    def with_event(self, event: EventLogEntry) -> "RunStepStatsData":
+        dagster_event = event.get_dagster_event()
+        event_type = dagster_event.event_type
+        timestamp = event.timestamp
+
+        if event_type == DagsterEventType.STEP_START:
+            return self._replace(
+                has_stats=True, start_time=timestamp, attempts=1, attempt_start_time=timestamp
+            )
+        if event_type == DagsterEventType.STEP_RESTARTED:
+            return self._replace(
+                has_stats=True,
+                attempts=(self.attempts or 0) + 1,
+                attempt_start_time=timestamp,
+            )
+        if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            return self._replace(
+                completed_attempts=[
+                    *self.completed_attempts,
+                    RunStepMarker(start_time=self.attempt_start_time, end_time=timestamp),
+                ]
+            )
+        if event_type in (
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.STEP_FAILURE,
+            DagsterEventType.STEP_SKIPPED,
+        ):
+            status = {
+                DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+                DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+                DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+            }[event_type]
+            return self._replace(has_stats=True, end_time=timestamp, status=status.value)
+        if event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            return self._replace(has_stats=True)
+        if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
+            return self._replace(
+                has_stats=True,
+                expectation_results=[
+                    *self.expectation_results,
+                    expectation_data.expectation_result,
+                ],
+            )
+        if event_type in MARKER_EVENTS:
+            markers = dict(self.markers)
+            marker_start = dagster_event.engine_event_data.marker_start
+            marker_end = dagster_event.engine_event_data.marker_end
+            if marker_start:
+                markers[marker_start] = markers.get(marker_start, RunStepMarker())._replace(
+                    start_time=timestamp
+                )
+            if marker_end:
+                markers[marker_end] = markers.get(marker_end, RunStepMarker())._replace(
+                    end_time=timestamp
+                )
+            return self._replace(markers=markers)
+
+        return self
+
+    def to_snapshot(
+        self, run_id: str, materialization_events: Sequence[EventLogEntry]
+    ) -> RunStepKeyStatsSnapshot:
+        attempts_list = list(self.completed_attempts)
+        if self.end_time:
+            attempts_list.append(
+                RunStepMarker(start_time=self.attempt_start_time, end_time=self.end_time)
+            )
+            status = StepEventStatus(self.status) if self.status else None
+        else:
+            status = StepEventStatus.IN_PROGRESS
+
+        return RunStepKeyStatsSnapshot(
+            run_id=run_id,
+            step_key=self.step_key,
+            status=status,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            materialization_events=materialization_events,
+            expectation_results=self.expectation_results,
+            attempts=self.attempts,
+            attempts_list=attempts_list,
+            markers=list(self.markers.values()),
+        )
@@ -1,5 +1,7 @@
 import logging
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
@@ -23,6 +25,8 @@
 
 EXECUTION_PLAN_CREATION_RETRIES = 1
 
+EXECUTION_DATA_PREFETCH_MAX_WORKERS = 4
+
 
 class RunRequestExecutionData(NamedTuple):
     external_job: ExternalJob
@@ -53,13 +57,9 @@ def _execution_plan_targets_asset_selection(
     return all(key in output_asset_keys for key in asset_selection)
 
 
-def _get_job_execution_data_from_run_request(
-    asset_graph: RemoteAssetGraph,
-    run_request: RunRequest,
-    instance: DagsterInstance,
-    workspace: BaseWorkspaceRequestContext,
-    run_request_execution_data_cache: Dict[int, RunRequestExecutionData],
-) -> RunRequestExecutionData:
+def _get_job_subset_selector(
+    asset_graph: RemoteAssetGraph, run_request: RunRequest
+) -> JobSubsetSelector:
     repo_handle = asset_graph.get_repository_handle(
         cast(Sequence[AssetKey], run_request.asset_selection)[0]
     )
@@ -76,7 +76,7 @@ def _get_job_execution_data_from_run_request(
     if not run_request.asset_selection:
         check.failed("Expected RunRequest to have an asset selection")
 
-    pipeline_selector = JobSubsetSelector(
+    return JobSubsetSelector(
         location_name=location_name,
         repository_name=repo_handle.repository_name,
         job_name=job_name,
@@ -85,10 +85,19 @@ def _get_job_execution_data_from_run_request(
         op_selection=None,
     )
 
+
+def _get_job_execution_data_from_run_request(
+    asset_graph: RemoteAssetGraph,
+    run_request: RunRequest,
+    instance: DagsterInstance,
+    workspace: BaseWorkspaceRequestContext,
+    run_request_execution_data_cache: Dict[int, RunRequestExecutionData],
+) -> RunRequestExecutionData:
+    pipeline_selector = _get_job_subset_selector(asset_graph, run_request)
     selector_id = hash_collection(pipeline_selector)
 
     if selector_id not in run_request_execution_data_cache:
-        code_location = workspace.get_code_location(repo_handle.code_location_origin.location_name)
+        code_location = workspace.get_code_location(pipeline_selector.location_name)
         external_job = code_location.get_external_job(pipeline_selector)
 
         external_execution_plan = code_location.get_external_execution_plan(
@@ -110,6 +119,53 @@ def _get_job_execution_data_from_run_request(
     return run_request_execution_data_cache[selector_id]
 
 
+def prefetch_job_execution_data(
+    run_requests: Sequence[RunRequest],
+    instance: DagsterInstance,
+    workspace_process_context: IWorkspaceProcessContext,
+    asset_graph: RemoteAssetGraph,
+    run_request_execution_data_cache: Dict[int, RunRequestExecutionData],
+    logger: logging.Logger,
+) -> None:
+    """Fetches the external job and execution plan for each distinct asset selection in the given
+    run requests that is not already cached, making the calls to the code locations concurrently
+    rather than one at a time as runs are created. Errors are logged and otherwise ignored here, so
+    that they are raised and handled when the run for the run request is created.
+    """
+    run_requests_by_selector_id: Dict[int, RunRequest] = {}
+    for run_request in run_requests:
+        if not run_request.asset_selection:
+            continue
+        selector_id = hash_collection(_get_job_subset_selector(asset_graph, run_request))
+        if selector_id not in run_request_execution_data_cache:
+            run_requests_by_selector_id.setdefault(selector_id, run_request)
+
+    if len(run_requests_by_selector_id) < 2:
+        return
+
+    workspace = workspace_process_context.create_request_context()
+    with ThreadPoolExecutor(
+        max_workers=min(len(run_requests_by_selector_id), EXECUTION_DATA_PREFETCH_MAX_WORKERS),
+        thread_name_prefix="execution_data_prefetch_worker",
+    ) as executor:
+        futures = [
+            executor.submit(
+                _get_job_execution_data_from_run_request,
+                asset_graph,
+                run_request,
+                instance,
+                workspace,
+                run_request_execution_data_cache,
+            )
+            for run_request in run_requests_by_selector_id.values()
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.debug(f"Failed to prefetch execution data, will retry on run creation: {e}")
+
+
 def _create_asset_run(
     run_id: Optional[str],
     run_request: RunRequest,
@@ -120,10 +176,11 @@ def _create_asset_run(
     workspace_process_context: IWorkspaceProcessContext,
     debug_crash_flags: SingleInstigatorDebugCrashFlags,
     logger: logging.Logger,
-) -> DagsterRun:
+) -> Tuple[DagsterRun, RunRequestExecutionData]:
     """Creates a run on the instance for the given run request. Ensures that the created run results
     in an ExecutionPlan that targets the given asset selection. If it does not, attempts to create
-    a valid ExecutionPlan by reloading the workspace.
+    a valid ExecutionPlan by reloading the workspace. Returns the run along with the execution data
+    that it was created from.
     """
     from dagster._daemon.controller import RELOAD_WORKSPACE_INTERVAL
 
@@ -175,7 +232,7 @@ def _create_asset_run(
                     asset_job_partitions_def=partitions_def,
                 )
 
-                return run
+                return run, execution_data
         except DagsterInvalidSubsetError:
             pass
 
@@ -238,7 +295,7 @@ def submit_asset_run(
             )
             run_to_submit = existing_run
     else:
-        run_to_submit = _create_asset_run(
+        run_to_submit, _ = _create_asset_run(
             run_id,
             run_request,
             run_request_index,
@@ -268,6 +325,111 @@ def submit_asset_run(
     return run_to_submit
 
 
+def _create_and_submit_asset_runs_from_templates(
+    run_requests: Sequence[RunRequest],
+    run_request_start_index: int,
+    instance: DagsterInstance,
+    workspace_process_context: IWorkspaceProcessContext,
+    asset_graph: RemoteAssetGraph,
+    run_request_execution_data_cache: Dict[int, RunRequestExecutionData],
+    logger: logging.Logger,
+    submitted_runs: List[Tuple[RunRequest, DagsterRun]],
+) -> Iterator[None]:
+    """Creates and submits new runs for a sequence of run requests that target asset selections,
+    appending each submitted run to submitted_runs. Run requests that target the same asset
+    selection share their snapshots, so once the first of their runs has been created, the rest are
+    copied from it and added to run storage in a single batch. The runs are then submitted in the
+    order of their run requests. Yields None after each run is submitted.
+
+    If the code location can't be reached while resolving the execution data of a run request, the
+    runs for the run requests before it are still created and submitted before the error is raised.
+    If it can't be reached while submitting a run, that run and the runs after it are deleted before
+    the error is raised, so that they are created again when their run requests are retried.
+    """
+    template_by_selector_id: Dict[int, Tuple[DagsterRun, RunRequestExecutionData]] = {}
+    copied_run_indices_by_selector_id: Dict[int, List[int]] = defaultdict(list)
+    runs: List[Optional[DagsterRun]] = []
+    code_location_error: Optional[Exception] = None
+    try:
+        for i, run_request in enumerate(run_requests):
+            check.invariant(
+                not run_request.run_config, "Asset run requests have no custom run config"
+            )
+            selector_id = hash_collection(_get_job_subset_selector(asset_graph, run_request))
+            if selector_id not in template_by_selector_id:
+                template_run, execution_data = _create_asset_run(
+                    None,
+                    run_request,
+                    run_request_start_index + i,
+                    instance,
+                    run_request_execution_data_cache,
+                    asset_graph,
+                    workspace_process_context,
+                    {},
+                    logger,
+                )
+                template_by_selector_id[selector_id] = (template_run, execution_data)
+                runs.append(template_run)
+            else:
+                # resolve the execution data for each run request, as when creating runs from
+                # scratch, so that an unavailable code location stops at the same run request
+                _get_job_execution_data_from_run_request(
+                    asset_graph,
+                    run_request,
+                    instance,
+                    workspace=workspace_process_context.create_request_context(),
+                    run_request_execution_data_cache=run_request_execution_data_cache,
+                )
+                copied_run_indices_by_selector_id[selector_id].append(i)
+                runs.append(None)
+    except (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError) as e:
+        code_location_error = e
+
+    unsubmitted_run_ids = {run.run_id for run in runs if run is not None}
+    try:
+        for selector_id, indices in copied_run_indices_by_selector_id.items():
+            template_run, execution_data = template_by_selector_id[selector_id]
+            created_runs = instance.create_runs_from_template(
+                template_run=template_run,
+                run_ids_and_tags=[(None, run_requests[i].tags) for i in indices],
+                execution_plan_snapshot=execution_data.external_execution_plan.execution_plan_snapshot,
+                asset_job_partitions_def=execution_data.partitions_def,
+            )
+            unsubmitted_run_ids.update(run.run_id for run in created_runs)
+            for i, run in zip(indices, created_runs):
+                runs[i] = run
+
+        for run_request, run in zip(run_requests, [check.not_none(run) for run in runs]):
+            instance.submit_run(run.run_id, workspace_process_context.create_request_context())
+            unsubmitted_run_ids.remove(run.run_id)
+            submitted_runs.append((run_request, run))
+
+            asset_key_str = ", ".join(
+                [
+                    asset_key.to_user_string()
+                    for asset_key in check.not_none(run_request.asset_selection)
+                ]
+            )
+            logger.info(
+                f"Submitted run {run.run_id} for assets {asset_key_str} with tags"
+                f" {run_request.tags}"
+            )
+
+            # allow the daemon to heartbeat while runs are submitted
+            yield None
+    except (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError):
+        # the run requests will be retried once the code location is available, so don't leave
+        # behind runs that were never submitted
+        for run_id in unsubmitted_run_ids:
+            unsubmitted_run = instance.get_run_by_id(run_id)
+            if unsubmitted_run and unsubmitted_run.status == DagsterRunStatus.NOT_STARTED:
+                instance.delete_run(run_id)
+        raise
+
+    if code_location_error:
+        raise code_location_error
+
+
 class SubmitRunRequestChunkResult(NamedTuple):
     chunk_submitted_runs: Sequence[Tuple[RunRequest, DagsterRun]]
     retryable_error_raised: bool
@@ -288,6 +450,10 @@ def submit_asset_runs_in_chunks(
     None after each run is submitted to allow the daemon to heartbeat, and yields a list of tuples
     of the run request and the submitted run after each chunk is submitted to allow the caller to
     interrupt this process if needed.
+
+    If no run ids are reserved, there can be no previously created runs for the run requests, so
+    runs that target the same asset selection are copied from the first of them and created in bulk
+    for each chunk.
     """
     if reserved_run_ids is not None:
         check.invariant(len(run_requests) == len(reserved_run_ids))
@@ -300,6 +466,38 @@ def submit_asset_runs_in_chunks(
 
         logger.debug(f"{chunk_size}, {chunk_start}, {len(run_request_chunk)}")
 
+        prefetch_job_execution_data(
+            run_request_chunk,
+            instance,
+            workspace_process_context,
+            asset_graph,
+            run_request_execution_data_cache,
+            logger,
+        )
+
+        if reserved_run_ids is None:
+            try:
+                yield from _create_and_submit_asset_runs_from_templates(
+                    run_request_chunk,
+                    chunk_start,
+                    instance,
+                    workspace_process_context,
+                    asset_graph,
+                    run_request_execution_data_cache,
+                    logger,
+                    chunk_submitted_runs,
+                )
+            except (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError) as e:
+                logger.warning(
+                    "Unable to reach the user code server for assets in this chunk of run"
+                    f" requests. Backfill {backfill_id} will resume execution once the server is"
+                    f" available. User code server error: {e}"
+                )
+                retryable_error_raised = True
+
+            yield SubmitRunRequestChunkResult(chunk_submitted_runs, retryable_error_raised)
+            continue
+
         # submit each run in the chunk
         for chunk_idx, run_request in enumerate(run_request_chunk):
             run_request_idx = chunk_start + chunk_idx
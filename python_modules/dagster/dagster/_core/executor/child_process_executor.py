@@ -1,12 +1,25 @@
 """Facilities for running arbitrary commands in child processes."""
 
+import multiprocessing.connection
 import os
-import queue
 import sys
+import time
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
+from multiprocessing.connection import Connection
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 
 from typing_extensions import Literal
 
@@ -64,31 +77,102 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+class ChildProcessWorkerRecycleEvent(
+    NamedTuple("ChildProcessWorkerRecycleEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a pooled worker process before the completion event of its last command, to signal
+    that it will exit instead of accepting more commands.
+    """
+
+
+def _execute_command_in_child_process(event_conn: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
-        pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
-        try:
-            for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
-
-        except (
-            Exception,
-            KeyboardInterrupt,
-            DagsterExecutionInterruptedError,
-        ):
-            event_queue.put(
-                ChildProcessSystemErrorEvent(
-                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-                )
-            )
+        _execute_command(event_conn, command)
+
+
+def _execute_command(
+    event_conn: Connection,
+    command: ChildProcessCommand,
+    should_recycle_fn: Optional[Callable[[], bool]] = None,
+) -> bool:
+    pid = os.getpid()
+    event_conn.send(ChildProcessStartEvent(pid=pid))
+    try:
+        for step_event in command.execute():
+            event_conn.send(step_event)
+        completion_event: ChildProcessEvent = ChildProcessDoneEvent(pid=pid)
+
+    except (
+        Exception,
+        KeyboardInterrupt,
+        DagsterExecutionInterruptedError,
+    ):
+        completion_event = ChildProcessSystemErrorEvent(
+            pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+        )
+
+    should_recycle = should_recycle_fn() if should_recycle_fn else False
+    if should_recycle:
+        event_conn.send(ChildProcessWorkerRecycleEvent(pid=pid))
+    event_conn.send(completion_event)
+    return should_recycle
+
+
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _execute_commands_in_worker_process(
+    command_queue: Queue,
+    event_conn: Connection,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_bytes: Optional[int],
+):
+    """Long-lived loop run by each process in a ChildProcessWorkerPool.
+
+    Executes commands pulled off the command queue until it receives the shutdown sentinel (None),
+    until it has executed `max_commands` commands, or until its peak resident memory exceeds
+    `max_memory_bytes`.
+    """
+    from dagster._utils import start_termination_thread
+
+    with capture_interrupts():
+        start_termination_thread(term_event)
+        num_commands = 0
+
+        def _should_recycle() -> bool:
+            if term_event.is_set():
+                return True
+            if max_commands is not None and num_commands >= max_commands:
+                return True
+            if max_memory_bytes is not None:
+                max_rss_bytes = _get_max_rss_bytes()
+                return max_rss_bytes is not None and max_rss_bytes > max_memory_bytes
+            return False
+
+        while True:
+            command = command_queue.get()
+            if command is None:
+                break
+
+            check.inst(command, ChildProcessCommand)
+            num_commands += 1
+            if _execute_command(event_conn, command, _should_recycle):
+                break
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -97,34 +181,57 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 PROCESS_DEAD_AND_QUEUE_EMPTY = "PROCESS_DEAD_AND_QUEUE_EMPTY"
 """Sentinel value."""
 
+CRASHED_PROCESS_JOIN_TIMEOUT = 5.0
+"""How long to wait for a crashed child process to be reaped so that its exit code is available --
+default 5s.
+"""
+
 
 def _poll_for_event(
-    process, event_queue
+    process, event_conn: Connection, timeout: float = TICK
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
+    if event_conn.poll(timeout):
+        try:
+            return event_conn.recv()
+        except EOFError:
+            # The parent closes its copy of the write end of the pipe, so EOF means that the
+            # process has exited and every event it sent has been received
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process sent another event and
+        # then died. In that case we want to continue draining the pipe.
+        if event_conn.poll(0):
             try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+                return event_conn.recv()
+            except EOFError:
+                pass
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
     return None
 
 
+def wait_for_child_process_events(wait_handles: Iterable[Any], timeout: float) -> None:
+    """Block until any of the given wait handles (as collected by `execute_child_process_command`
+    or `ChildProcessWorker.execute`) is ready, i.e. until a child process has sent an event or
+    exited, or until the timeout elapses.
+    """
+    handles = list(wait_handles)
+    if handles:
+        multiprocessing.connection.wait(handles, timeout=timeout)
+    else:
+        time.sleep(timeout)
+
+
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    wait_handles: Optional[List[Any]] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -142,23 +249,36 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        wait_handles (Optional[List[Any]]): If provided, the objects that become ready when the
+            child process sends an event or exits are added to this list for the duration of the
+            execution, and polling does not block. This allows a caller driving many executions at
+            once to wait on all of them with `wait_for_child_process_events`, instead of polling
+            each one in turn.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)
+    registered_handles: List[Any] = []
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_conn, command)
         )
         process.start()
+        child_event_conn.close()
+
+        poll_timeout = TICK
+        if wait_handles is not None:
+            registered_handles = [event_conn, process.sentinel]
+            wait_handles.extend(registered_handles)
+            poll_timeout = 0
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_conn, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -170,8 +290,182 @@ def execute_child_process_command(
 
         if not completed_properly:
             # TODO Figure out what to do about stderr/stdout
+            process.join(timeout=CRASHED_PROCESS_JOIN_TIMEOUT)
             raise ChildProcessCrashException(exit_code=process.exitcode)
 
         process.join()
     finally:
-        event_queue.close()
+        for handle in registered_handles:
+            check.not_none(wait_handles).remove(handle)
+        child_event_conn.close()
+        event_conn.close()
+
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""How long to wait for an idle pooled worker to exit before terminating it -- default 5s."""
+
+
+class ChildProcessWorker:
+    """A long-lived child process owned by a ChildProcessWorkerPool, which executes one
+    ChildProcessCommand at a time.
+    """
+
+    def __init__(
+        self,
+        pool: "ChildProcessWorkerPool",
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands: Optional[int],
+        max_memory_bytes: Optional[int],
+    ):
+        self._pool = pool
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)
+        self.term_event = multiprocessing_ctx.Event()
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(
+                self._command_queue,
+                child_event_conn,
+                self.term_event,
+                max_commands,
+                max_memory_bytes,
+            ),
+        )
+        self._process.start()
+        child_event_conn.close()
+        self._retired = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    def execute(
+        self, command: ChildProcessCommand, wait_handles: Optional[List[Any]] = None
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Execute a ChildProcessCommand in this worker process.
+
+        Yields the same sequence of objects as `execute_child_process_command`, and handles
+        `wait_handles` in the same way. Once the command completes, the worker is returned to its
+        pool, or shut down if it has been recycled.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        self._command_queue.put(command)
+        poll_timeout = TICK
+        registered_handles: List[Any] = []
+        if wait_handles is not None:
+            registered_handles = [self._event_conn, self._process.sentinel]
+            wait_handles.extend(registered_handles)
+            poll_timeout = 0
+
+        completed_properly = False
+        try:
+            while not completed_properly:
+                event = _poll_for_event(self._process, self._event_conn, poll_timeout)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                if isinstance(event, ChildProcessWorkerRecycleEvent):
+                    self._retired = True
+                    continue
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+
+            if not completed_properly:
+                self._process.join(timeout=CRASHED_PROCESS_JOIN_TIMEOUT)
+                raise ChildProcessCrashException(exit_code=self._process.exitcode)
+        finally:
+            for handle in registered_handles:
+                check.not_none(wait_handles).remove(handle)
+            if completed_properly and not self._retired:
+                self._pool.release(self)
+            else:
+                self._retired = True
+                self._pool.discard(self)
+                self.shutdown()
+
+    def shutdown(self) -> None:
+        if self._process.is_alive():
+            if not self._retired:
+                self._command_queue.put(None)
+            self._process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+        self._command_queue.close()
+        self._event_conn.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived child processes that execute ChildProcessCommands.
+
+    Unlike `execute_child_process_command`, which starts a new process for every command, pooled
+    workers are reused across commands, so module imports and any state cached at the process
+    level (e.g. loaded definitions) carry over from one command to the next. Workers are started
+    lazily, and are recycled after executing `max_commands_per_worker` commands or once their peak
+    resident memory exceeds `max_worker_memory_mb` megabytes.
+
+    Commands are sent to the workers over a queue, so they must be picklable and must not contain
+    multiprocessing synchronization primitives. Each worker instead exposes a `term_event` that can
+    be set to interrupt the command it is executing.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_workers: int,
+        max_commands_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        max_worker_memory_mb = check.opt_int_param(max_worker_memory_mb, "max_worker_memory_mb")
+        self._max_worker_memory_bytes = (
+            max_worker_memory_mb * 1024 * 1024 if max_worker_memory_mb is not None else None
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: Set[ChildProcessWorker] = set()
+
+    def acquire(self) -> ChildProcessWorker:
+        """Reserve an idle worker, starting a new one if no idle worker is available."""
+        if self._idle_workers:
+            worker = self._idle_workers.pop()
+        else:
+            check.invariant(
+                len(self._busy_workers) < self._max_workers,
+                f"Cannot acquire more than {self._max_workers} workers at once.",
+            )
+            worker = ChildProcessWorker(
+                self,
+                self._multiprocessing_ctx,
+                self._max_commands_per_worker,
+                self._max_worker_memory_bytes,
+            )
+        self._busy_workers.add(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        self._busy_workers.discard(worker)
+        self._idle_workers.append(worker)
+
+    def discard(self, worker: ChildProcessWorker) -> None:
+        self._busy_workers.discard(worker)
+
+    def shutdown(self) -> None:
+        for worker in [*self._idle_workers, *self._busy_workers]:
+            worker.shutdown()
+        self._idle_workers = []
+        self._busy_workers = set()
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
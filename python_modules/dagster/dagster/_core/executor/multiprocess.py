@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import sys
+import time
 from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
@@ -37,8 +38,12 @@
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    wait_for_child_process_events,
 )
 
 if TYPE_CHECKING:
@@ -47,6 +52,11 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+EXECUTOR_WAIT_TIMEOUT = 0.5
+"""The maximum interval at which the executor wakes up to check for interrupts and newly executable
+steps while waiting for events from its child processes -- default 500ms.
+"""
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -55,7 +65,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -74,7 +84,9 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
+            # pooled worker processes start their own termination thread
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
 
             log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -112,6 +124,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -137,6 +152,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -199,9 +221,23 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_workers=limit,
+                        max_commands_per_worker=self._max_steps_per_worker,
+                        max_worker_memory_mb=self._max_worker_memory_mb,
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
+            wait_handles: Dict[str, List[Any]] = {}
+            dispatch_latencies: Dict[str, float] = {}
             stopping: bool = False
 
             while (not stopping and not active_execution.is_complete) or active_iters:
@@ -229,7 +265,11 @@ def execute(
 
                     for step in steps:
                         step_context = plan_context.for_step(step)
-                        term_events[step.key] = multiproc_ctx.Event()
+                        worker = worker_pool.acquire() if worker_pool else None
+                        term_events[step.key] = (
+                            worker.term_event if worker else multiproc_ctx.Event()
+                        )
+                        wait_handles[step.key] = []
                         active_iters[step.key] = execute_step_out_of_process(
                             multiproc_ctx,
                             job,
@@ -240,16 +280,21 @@ def execute(
                             self.retries,
                             active_execution.get_known_state(),
                             execution_plan.repository_load_data,
+                            worker=worker,
+                            wait_handles=wait_handles[step.key],
+                            dispatch_latencies=dispatch_latencies,
                         )
 
                 # process active iterators
                 empty_iters = []
+                received_event = False
                 for key, step_iter in active_iters.items():
                     try:
                         event_or_none = next(step_iter)
                         if event_or_none is None:
                             continue
                         else:
+                            received_event = True
                             yield event_or_none
                             active_execution.handle_event(event_or_none)
 
@@ -282,11 +327,21 @@ def execute(
                 for key in empty_iters:
                     del active_iters[key]
                     del term_events[key]
+                    del wait_handles[key]
                     active_execution.verify_complete(plan_context, key)
 
                 # process skipped and abandoned steps
                 yield from active_execution.plan_events_iterator(plan_context)
 
+                # rather than polling each child in turn, sleep until any child process sends an
+                # event or exits, waking periodically to check for interrupts and newly
+                # executable steps
+                if active_iters and not received_event and not empty_iters:
+                    wait_for_child_process_events(
+                        (handle for handles in wait_handles.values() for handle in handles),
+                        timeout=EXECUTOR_WAIT_TIMEOUT,
+                    )
+
             errs = {pid: err for pid, err in errors.items() if err}
 
             # After termination starts, raise an interrupted exception once all subprocesses
@@ -322,7 +377,9 @@ def execute(
             yield DagsterEvent.engine_event(
                 plan_context,
                 f"Multiprocess executor: parent process exiting after {format_duration(timer_result.millis)} (pid: {os.getpid()})",
-                event_specific_data=EngineEventData.multiprocess(os.getpid()),
+                event_specific_data=EngineEventData.multiprocess(
+                    os.getpid(), step_dispatch_latencies=dispatch_latencies
+                ),
             )
 
 
@@ -336,30 +393,48 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker: Optional[ChildProcessWorker] = None,
+    wait_handles: Optional[List[Any]] = None,
+    dispatch_latencies: Optional[Dict[str, float]] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # synchronization primitives can't be sent to pooled workers over a queue, so the worker's
+        # own termination event is used instead
+        term_event=None if worker else term_events[step.key],
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        f'Launching subprocess for "{step.key}".',
-        metadata={},
-    )
+    if worker:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Sending "{step.key}" to worker process (pid: {worker.pid}).',
+            metadata={},
+        )
+        child_process_events = worker.execute(command, wait_handles)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Launching subprocess for "{step.key}".',
+            metadata={},
+        )
+        child_process_events = execute_child_process_command(multiproc_ctx, command, wait_handles)
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    dispatch_start = time.perf_counter()
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
-            if isinstance(ret, ChildProcessSystemErrorEvent):
+            if isinstance(ret, ChildProcessStartEvent) and dispatch_latencies is not None:
+                # time from dispatching the step to the child process beginning to execute it
+                dispatch_latencies[step.key] = time.perf_counter() - dispatch_start
+            elif isinstance(ret, ChildProcessSystemErrorEvent):
                 errors[ret.pid] = ret.error_info
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
@@ -2,6 +2,7 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
@@ -18,6 +19,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -117,6 +119,7 @@
     from dagster._core.event_api import (
         AssetRecordsFilter,
         EventHandlerFn,
+        LazyEventLogRecord,
         RunStatusChangeRecordsFilter,
     )
     from dagster._core.events import (
@@ -198,6 +201,47 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the number of run events that will be buffered in memory before being written to the event
+# log in a single `store_event_batch` call. Unlike the event batch size above, this applies to all
+# events handled by the instance. Defaults to 0, which turns off write buffering. Buffered events
+# are also flushed once the oldest buffered event is older than the flush interval (by a timer that
+# is started when the buffer receives its first event), on run lifecycle and step completion
+# events, and when the instance is disposed.
+def _get_event_write_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BUFFER_SIZE", "0"))
+
+
+def _get_event_write_buffer_flush_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+
+def _is_write_buffering_enabled() -> bool:
+    return _get_event_write_buffer_size() > 0
+
+
+def _should_flush_event_write_buffer(event: "EventLogEntry") -> bool:
+    from dagster._core.events import DagsterEventType
+
+    # Events reported outside of a run (e.g. runless asset events) are written immediately
+    if event.run_id == RUNLESS_RUN_ID:
+        return True
+
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    # Other processes (run monitoring, step-delegating executors, the asset daemon) coordinate on
+    # these events via the event log, so they are never held in the buffer
+    return dagster_event.is_job_event or dagster_event.event_type in {
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.STEP_FAILURE,
+        DagsterEventType.STEP_SKIPPED,
+        DagsterEventType.STEP_UP_FOR_RETRY,
+        DagsterEventType.STEP_RESTARTED,
+        DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+    }
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -501,6 +545,12 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
 
+        # Used for buffered event writes
+        self._event_write_buffer: List[EventLogEntry] = []
+        self._event_write_buffer_start_time: Optional[float] = None
+        self._event_write_buffer_timer: Optional[threading.Timer] = None
+        self._event_write_buffer_lock = threading.RLock()
+
     # ctors
 
     @public
@@ -959,6 +1009,10 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", False)
 
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers")
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1016,6 +1070,7 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_event_write_buffer()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1626,6 +1681,63 @@ def create_run(
 
         return dagster_run
 
+    def create_runs_from_template(
+        self,
+        *,
+        template_run: DagsterRun,
+        run_ids_and_tags: Sequence[Tuple[Optional[str], Optional[Mapping[str, Any]]]],
+        execution_plan_snapshot: Optional["ExecutionPlanSnapshot"],
+        asset_job_partitions_def: Optional["PartitionsDefinition"] = None,
+    ) -> Sequence[DagsterRun]:
+        """Creates runs that are identical to the given template run other than their run ids and
+        tags. The template run must have been created with ``create_run``, so that its snapshots
+        are already persisted. The new runs are added to run storage in bulk.
+
+        Args:
+            template_run (DagsterRun): The run to copy.
+            run_ids_and_tags (Sequence[Tuple[Optional[str], Optional[Mapping[str, Any]]]]): The
+                run id and tags of each run to create. A new run id is generated for each None run
+                id.
+            execution_plan_snapshot (Optional[ExecutionPlanSnapshot]): The execution plan snapshot
+                of the template run, used to log the asset materializations planned by each run.
+            asset_job_partitions_def (Optional[PartitionsDefinition]): The partitions definition of
+                the asset job of the template run, if any.
+        """
+        from dagster._core.definitions.utils import normalize_tags
+        from dagster._core.snap import ExecutionPlanSnapshot
+        from dagster._core.utils import make_new_run_id
+
+        check.inst_param(template_run, "template_run", DagsterRun)
+        check.opt_inst_param(
+            execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot
+        )
+        check.invariant(
+            (execution_plan_snapshot is None) == (template_run.execution_plan_snapshot_id is None),
+            "execution_plan_snapshot must be passed if and only if the template run has an"
+            " execution plan snapshot",
+        )
+
+        dagster_runs = []
+        for run_id, tags in run_ids_and_tags:
+            if run_id and not is_uuid(run_id):
+                check.failed(f"run_id must be a valid UUID. Got {run_id}")
+            dagster_runs.append(
+                template_run._replace(
+                    run_id=run_id or make_new_run_id(),
+                    tags=normalize_tags(tags, warn_on_deprecated_tags=False).tags,
+                )
+            )
+
+        dagster_runs = self._run_storage.add_runs(dagster_runs)
+
+        if execution_plan_snapshot:
+            for dagster_run in dagster_runs:
+                self._log_asset_planned_events(
+                    dagster_run, execution_plan_snapshot, asset_job_partitions_def
+                )
+
+        return dagster_runs
+
     def create_reexecuted_run(
         self,
         *,
@@ -1912,6 +2024,34 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    @traced
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        ascending: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._event_storage.get_lazy_records_for_run(run_id, of_type, ascending)
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        ascending: bool = True,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator["EventLogRecord"]:
+        """Iterate over all of the event log records of a run without loading them into memory at
+        once. Records are fetched from the event log storage `chunk_size` at a time.
+        """
+        from dagster._core.storage.event_log.base import DEFAULT_RECORDS_CHUNK_SIZE
+
+        return self._event_storage.iter_records_for_run(
+            run_id,
+            of_type,
+            ascending,
+            chunk_size if chunk_size is not None else DEFAULT_RECORDS_CHUNK_SIZE,
+        )
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2265,6 +2405,34 @@ def get_latest_storage_id_by_partition(
         """
         return self._event_storage.get_latest_storage_id_by_partition(asset_key, event_type)
 
+    @traced
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self, asset_keys: Sequence[AssetKey], event_type: "DagsterEventType"
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        return self._event_storage.get_latest_storage_id_by_partition_for_asset_keys(
+            asset_keys, event_type
+        )
+
+    @traced
+    def get_latest_tags_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: "DagsterEventType",
+        tag_keys: Sequence[str],
+    ) -> Mapping[AssetKey, Mapping[str, Mapping[str, str]]]:
+        """Fetch the given tags of the latest event for each partition of each of the given asset
+        keys.
+
+        Returns a mapping of asset key to a mapping of partition to tags.
+        """
+        return self._event_storage.get_latest_tags_by_partition_for_asset_keys(
+            asset_keys, event_type, tag_keys
+        )
+
     @traced
     def get_latest_planned_materialization_info(
         self,
@@ -2393,6 +2561,12 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If write buffering is enabled (by setting `DAGSTER_EVENT_WRITE_BUFFER_SIZE`), then all
+        events are additionally held in an instance-wide write buffer that is flushed to the storage
+        layer in a single batch when it reaches the buffer size, when its oldest event exceeds the
+        flush interval, when a run lifecycle or step completion event arrives, or when the instance
+        is disposed. Subscribers are notified of events once they have been written, in order.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
@@ -2408,24 +2582,139 @@ def handle_new_event(
             else:
                 return
 
+        if _is_write_buffering_enabled() or self._event_write_buffer:
+            with self._event_write_buffer_lock:
+                if not self._event_write_buffer:
+                    self._event_write_buffer_start_time = time.monotonic()
+                    self._start_event_write_buffer_timer()
+                self._event_write_buffer.extend(events)
+                if (
+                    not _is_write_buffering_enabled()
+                    or len(self._event_write_buffer) >= _get_event_write_buffer_size()
+                    or any(_should_flush_event_write_buffer(event) for event in events)
+                    or time.monotonic() - check.not_none(self._event_write_buffer_start_time)
+                    >= _get_event_write_buffer_flush_interval()
+                ):
+                    self.flush_event_write_buffer()
+            return
+
+        self._write_events(events)
+
+    def flush_event_write_buffer(self) -> None:
+        """Write any events held in the event write buffer to the event log storage.
+
+        If storing the events fails, the events that were not stored are kept in the buffer, ahead
+        of any events that arrive later, so that the next flush retries them, and the error is
+        raised.
+        """
+        from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+
+        with self._event_write_buffer_lock:
+            events = self._event_write_buffer
+            self._event_write_buffer = []
+            self._event_write_buffer_start_time = None
+            if self._event_write_buffer_timer:
+                self._event_write_buffer_timer.cancel()
+                self._event_write_buffer_timer = None
+            if not events:
+                return
+
+            try:
+                self._store_events(events)
+            except Exception as e:
+                unstored_events = (
+                    e.unstored_events
+                    if isinstance(e, DagsterEventBatchPartiallyStoredError)
+                    else events
+                )
+                unstored_event_ids = {id(event) for event in unstored_events}
+                self._notify_stored_events(
+                    [event for event in events if id(event) not in unstored_event_ids]
+                )
+                self._event_write_buffer = list(unstored_events)
+                self._event_write_buffer_start_time = time.monotonic()
+                self._start_event_write_buffer_timer()
+                raise
+
+            self._notify_stored_events(events)
+
+    def _start_event_write_buffer_timer(self) -> None:
+        # flushes the buffer once its oldest event reaches the flush interval, even if no other
+        # events arrive in the meantime
+        if not _is_write_buffering_enabled():
+            return
+
+        timer = threading.Timer(
+            _get_event_write_buffer_flush_interval(), self._flush_event_write_buffer_on_timer
+        )
+        timer.daemon = True
+        self._event_write_buffer_timer = timer
+        timer.start()
+
+    def _flush_event_write_buffer_on_timer(self) -> None:
+        with self._event_write_buffer_lock:
+            # the buffer may have been flushed (and a new timer started) since this timer fired
+            if self._event_write_buffer_timer is not threading.current_thread():
+                return
+            self._event_write_buffer_timer = None
+            try:
+                self.flush_event_write_buffer()
+            except Exception:
+                logging.getLogger("dagster").exception("Error flushing the event write buffer")
+
+    def _write_events(self, events: Sequence["EventLogEntry"]) -> None:
+        self._store_events(events)
+        self._notify_stored_events(events)
+
+    def _store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
             try:
                 self._event_storage.store_event_batch(events)
 
-            # Fall back to storing events one by one if writing a batch fails. We catch a generic
-            # Exception because that is the parent class of the actually received error,
-            # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
-            # it living in a cloud package.
+            # Storages that can't store a batch atomically report which events were not stored
+            # when it fails partway through, so only those are retried one by one.
+            except DagsterEventBatchPartiallyStoredError as e:
+                sys.stderr.write(f"Exception while storing event batch: {e}\n")
+                sys.stderr.write(
+                    f"Falling back to storing the {len(e.unstored_events)} unstored events with"
+                    " single-event storage requests...\n"
+                )
+                self._store_events_one_by_one(e.unstored_events, events)
+
+            # Otherwise, a failed batch has not stored any events, so fall back to storing events
+            # one by one. We catch a generic Exception because that is the parent class of the
+            # actually received error, dagster_cloud_cli.core.errors.GraphQLStorageError, which we
+            # cannot import here due to it living in a cloud package.
             except Exception as e:
                 sys.stderr.write(f"Exception while storing event batch: {e}\n")
                 sys.stderr.write(
                     "Falling back to storing multiple single-event storage requests...\n"
                 )
-                for event in events:
-                    self._event_storage.store_event(event)
+                self._store_events_one_by_one(events, events)
+
+    def _store_events_one_by_one(
+        self, events: Sequence["EventLogEntry"], all_events: Sequence["EventLogEntry"]
+    ) -> None:
+        from dagster._core.errors import DagsterEventBatchPartiallyStoredError
 
+        for i, event in enumerate(events):
+            try:
+                self._event_storage.store_event(event)
+            except Exception as e:
+                # report which events were not stored if some of them were, so that they can be
+                # retried without duplicating the others
+                if len(events) - i == len(all_events):
+                    raise
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Failed to store {len(events) - i} of {len(all_events)} events: {e}",
+                    unstored_events=events[i:],
+                ) from e
+
+    def _notify_stored_events(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             run_id = event.run_id
             if event.is_dagster_event and event.get_dagster_event().is_job_event:
@@ -413,6 +413,13 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate independent assets within a single auto-materialize tick in parallel"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -1,25 +1,47 @@
 import datetime
+import hashlib
+import json
 import sys
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster._api.get_server_id import sync_get_server_id
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.notebook_data import sync_get_streaming_external_notebook_data_grpc
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_data_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
     sync_get_external_partition_set_execution_param_data_grpc,
     sync_get_external_partition_tags_grpc,
 )
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    sync_get_streaming_external_repositories_data_grpc,
+    sync_get_streaming_external_repository_data_grpc,
+)
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster._core.code_pointer import CodePointer
+from dagster._core.definitions.asset_check_spec import AssetCheckKey
+from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.partition import PartitionsDefinition
 from dagster._core.definitions.reconstruct import ReconstructableJob
 from dagster._core.definitions.repository_definition import RepositoryDefinition
@@ -42,6 +64,8 @@
     ExternalRepository,
 )
 from dagster._core.remote_representation.external_data import (
+    ExternalJobData,
+    ExternalJobRef,
     ExternalPartitionNamesData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
@@ -54,8 +78,12 @@
     CodeLocationOrigin,
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
+    RemoteRepositoryOrigin,
+)
+from dagster._core.snap.execution_plan_snapshot import (
+    ExecutionPlanSnapshot,
+    snapshot_from_execution_plan,
 )
-from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster._grpc.impl import (
     get_external_schedule_execution,
     get_external_sensor_execution,
@@ -68,6 +96,7 @@
 from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult
 from dagster._serdes import deserialize_value
 from dagster._seven.compat.pendulum import PendulumDateTime
+from dagster._utils.lru_cache import LRUCache
 from dagster._utils.merger import merge_dicts
 
 if TYPE_CHECKING:
@@ -581,6 +610,9 @@ def get_dagster_library_versions(self) -> Mapping[str, str]:
         return DagsterLibraryRegistry.get()
 
 
+EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE = 128
+
+
 class GrpcServerCodeLocation(CodeLocation):
     def __init__(
         self,
@@ -594,6 +626,7 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        job_data_by_snapshot_id: Optional[Mapping[str, ExternalJobData]] = None,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -624,6 +657,26 @@ def __init__(
         self.server_id = None
         self._external_repositories_data = None
 
+        # When the code location is reloaded, the data for jobs that were loaded by the previous
+        # copy of the code location is passed in, keyed by job snapshot id. Job snapshots are then
+        # deferred, and only the data for jobs whose snapshots have changed is fetched. With no
+        # previously loaded data there is nothing to reuse, so snapshots are fetched eagerly.
+        self._job_data_by_snapshot_id = (
+            check.opt_nullable_mapping_param(
+                job_data_by_snapshot_id,
+                "job_data_by_snapshot_id",
+                key_type=str,
+                value_type=ExternalJobData,
+            )
+            or None
+        )
+
+        # execution plan snapshots keyed by the content that they are computed from, so that runs
+        # for recurring asset selections do not each need a call to the server
+        self._execution_plan_snapshot_cache: LRUCache[Tuple, ExecutionPlanSnapshot] = LRUCache(
+            EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE
+        )
+
         self._executable_path = None
         self._container_image = None
         self._container_context = None
@@ -675,7 +728,10 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                defer_snapshots=self._job_data_by_snapshot_id is not None,
             )
+            if self._job_data_by_snapshot_id is not None:
+                self._fetch_changed_job_data()
 
             self.external_repositories = {
                 repo_name: ExternalRepository(
@@ -685,6 +741,7 @@ def __init__(
                         code_location=self,
                     ),
                     instance,
+                    ref_to_data_fn=partial(self._get_external_job_data_from_ref, repo_name),
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
@@ -696,6 +753,78 @@ def __init__(
     def origin(self) -> CodeLocationOrigin:
         return self._origin
 
+    def _fetch_changed_job_data(self) -> None:
+        """Adds the data for the jobs whose snapshots have changed to the reused job data, fetching
+        each repository with changed jobs once without deferred snapshots, rather than fetching
+        each changed job separately when it is first accessed.
+        """
+        job_data_by_snapshot_id = dict(check.not_none(self._job_data_by_snapshot_id))
+        repositories_data = dict(check.not_none(self._external_repositories_data))
+        for repository_name, repository_data in repositories_data.items():
+            changed_job_refs = [
+                job_ref
+                for job_ref in repository_data.get_external_job_refs()
+                if not _is_job_data_for_ref(
+                    job_data_by_snapshot_id.get(job_ref.snapshot_id), job_ref
+                )
+            ]
+            if not changed_job_refs:
+                continue
+
+            full_repository_data = sync_get_streaming_external_repository_data_grpc(
+                self.client, RemoteRepositoryOrigin(self.origin, repository_name)
+            )
+            job_data_by_name = {
+                job_data.name: job_data
+                for job_data in full_repository_data.get_external_job_datas()
+            }
+            if not all(
+                _is_job_data_for_ref(job_data_by_name.get(job_ref.name), job_ref)
+                for job_ref in changed_job_refs
+            ):
+                # the repository changed between the two calls, so use the full snapshot that was
+                # just fetched in place of the deferred one
+                repositories_data[repository_name] = full_repository_data
+                continue
+
+            for job_ref in changed_job_refs:
+                job_data_by_snapshot_id[job_ref.snapshot_id] = job_data_by_name[job_ref.name]
+
+        self._job_data_by_snapshot_id = job_data_by_snapshot_id
+        self._external_repositories_data = repositories_data
+
+    def _get_external_job_data_from_ref(
+        self, repository_name: str, job_ref: ExternalJobRef
+    ) -> ExternalJobData:
+        job_data = (self._job_data_by_snapshot_id or {}).get(job_ref.snapshot_id)
+        if job_data is not None and _is_job_data_for_ref(job_data, job_ref):
+            return job_data
+
+        return sync_get_external_job_data_grpc(
+            self.client, RemoteRepositoryOrigin(self.origin, repository_name), job_ref.name
+        )
+
+    def get_loaded_job_data_by_snapshot_id(self) -> Mapping[str, ExternalJobData]:
+        """Returns the data for the jobs in this code location that has already been loaded, keyed
+        by job snapshot id, so that a reloaded copy of the code location can reuse the data for
+        jobs that have not changed.
+        """
+        job_data_by_snapshot_id: Dict[str, ExternalJobData] = {}
+        for external_repository in self.external_repositories.values():
+            # carry over data from the previous copy of the code location for jobs that have not
+            # changed, even if they have not been accessed since
+            for job_ref in external_repository.external_repository_data.external_job_refs or []:
+                job_data = (self._job_data_by_snapshot_id or {}).get(job_ref.snapshot_id)
+                if job_data is not None:
+                    job_data_by_snapshot_id[job_ref.snapshot_id] = job_data
+
+            for external_job in external_repository.get_loaded_external_jobs():
+                job_data_by_snapshot_id[external_job.computed_job_snapshot_id] = (
+                    external_job.external_job_data
+                )
+
+        return job_data_by_snapshot_id
+
     @property
     def container_image(self) -> str:
         return cast(str, self._container_image)
@@ -791,6 +920,23 @@ def get_external_execution_plan(
             else None
         )
 
+        # plans that depend on the state of a previous run are not reused
+        cache_key = (
+            self._get_execution_plan_snapshot_cache_key(
+                external_job,
+                run_config,
+                asset_selection,
+                asset_check_selection,
+                step_keys_to_execute,
+            )
+            if known_state is None
+            else None
+        )
+        if cache_key is not None:
+            cached_snapshot = self._execution_plan_snapshot_cache.get(cache_key)
+            if cached_snapshot is not None:
+                return ExternalExecutionPlan(execution_plan_snapshot=cached_snapshot)
+
         execution_plan_snapshot_or_error = sync_get_external_execution_plan_grpc(
             api_client=self.client,
             job_origin=external_job.get_external_origin(),
@@ -804,8 +950,37 @@ def get_external_execution_plan(
             instance=instance,
         )
 
+        if cache_key is not None:
+            self._execution_plan_snapshot_cache.set(cache_key, execution_plan_snapshot_or_error)
+
         return ExternalExecutionPlan(execution_plan_snapshot=execution_plan_snapshot_or_error)
 
+    def _get_execution_plan_snapshot_cache_key(
+        self,
+        external_job: ExternalJob,
+        run_config: Mapping[str, Any],
+        asset_selection: Optional[AbstractSet[AssetKey]],
+        asset_check_selection: Optional[AbstractSet[AssetCheckKey]],
+        step_keys_to_execute: Optional[Sequence[str]],
+    ) -> Optional[Tuple]:
+        try:
+            run_config_hash = hashlib.sha1(
+                json.dumps(run_config, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        except (TypeError, ValueError):
+            # run config that can't be hashed is not cached
+            return None
+
+        return (
+            self.server_id,
+            external_job.identifying_job_snapshot_id,
+            asset_selection,
+            asset_check_selection,
+            tuple(external_job.op_selection) if external_job.op_selection is not None else None,
+            tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+            run_config_hash,
+        )
+
     def get_subset_external_job_result(
         self, selector: JobSubsetSelector
     ) -> "ExternalJobSubsetResult":
@@ -953,3 +1128,11 @@ def get_external_notebook_data(self, notebook_path: str) -> bytes:
 
     def get_dagster_library_versions(self) -> Optional[Mapping[str, str]]:
         return self._dagster_library_versions
+
+
+def _is_job_data_for_ref(job_data: Optional[ExternalJobData], job_ref: ExternalJobRef) -> bool:
+    return (
+        job_data is not None
+        and job_data.name == job_ref.name
+        and job_data.active_presets == job_ref.active_presets
+    )
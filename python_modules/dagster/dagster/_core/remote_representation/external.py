@@ -323,6 +323,13 @@ def get_full_external_job(self, job_name: str) -> "ExternalJob":
     def get_all_external_jobs(self) -> Sequence["ExternalJob"]:
         return [self.get_full_external_job(pn) for pn in self._job_map]
 
+    def get_loaded_external_jobs(self) -> Sequence["ExternalJob"]:
+        """Returns the jobs in this repository that have already been accessed and whose data has
+        been loaded, without loading the data for any jobs whose snapshots were deferred.
+        """
+        with self._memo_lock:
+            return [job for job in self._cached_jobs.values() if job.has_external_job_data]
+
     @property
     def handle(self) -> RepositoryHandle:
         return self._handle
@@ -449,6 +456,11 @@ def description(self):
     def node_names_in_topological_order(self):
         return self._job_index.job_snapshot.node_names_in_topological_order
 
+    @property
+    def has_external_job_data(self) -> bool:
+        with self._memo_lock:
+            return self._data is not None
+
     @property
     def external_job_data(self):
         with self._memo_lock:
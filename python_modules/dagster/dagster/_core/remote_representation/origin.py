@@ -37,6 +37,7 @@
         GrpcServerCodeLocation,
         InProcessCodeLocation,
     )
+    from dagster._core.remote_representation.external_data import ExternalJobData
     from dagster._grpc.client import DagsterGrpcClient
 
 # This is a hard-coded name for the special "in-process" location.
@@ -346,7 +347,11 @@ def get_display_metadata(self) -> Mapping[str, str]:
         }
         return {key: value for key, value in metadata.items() if value is not None}
 
-    def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
+    def reload_location(
+        self,
+        instance: "DagsterInstance",
+        job_data_by_snapshot_id: Optional[Mapping[str, "ExternalJobData"]] = None,
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import (
             GrpcServerCodeLocation,
         )
@@ -363,14 +368,22 @@ def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocatio
             else:
                 raise
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(
+            self, instance=instance, job_data_by_snapshot_id=job_data_by_snapshot_id
+        )
 
-    def create_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
+    def create_location(
+        self,
+        instance: "DagsterInstance",
+        job_data_by_snapshot_id: Optional[Mapping[str, "ExternalJobData"]] = None,
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import (
             GrpcServerCodeLocation,
         )
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(
+            self, instance=instance, job_data_by_snapshot_id=job_data_by_snapshot_id
+        )
 
     def create_client(self) -> "DagsterGrpcClient":
         from dagster._grpc.client import DagsterGrpcClient
@@ -0,0 +1,81 @@
+"""add run stats tables
+
+Revision ID: 7f2b1c9e4d5a
+Revises: 46b412388816
+Create Date: 2024-01-16 10:12:31.512394
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "7f2b1c9e4d5a"
+down_revision = "46b412388816"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("dagster_event_type", db.String(255), nullable=False),
+            db.Column("event_count", db.Integer, nullable=False),
+            db.Column("first_event_timestamp", db.types.TIMESTAMP),
+            db.Column("last_event_timestamp", db.types.TIMESTAMP),
+        )
+
+    if not has_index("run_stats", "idx_run_stats"):
+        op.create_index(
+            "idx_run_stats",
+            "run_stats",
+            ["run_id", "dagster_event_type"],
+            unique=True,
+        )
+
+    if not has_table("run_step_stats"):
+        op.create_table(
+            "run_step_stats",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("stats_body", db.Text, nullable=False),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("run_step_stats", "idx_run_step_stats"):
+        op.create_index(
+            "idx_run_step_stats",
+            "run_step_stats",
+            ["run_id", "step_key"],
+            mysql_length={"step_key": 255},
+            unique=True,
+        )
+
+
+def downgrade():
+    if has_table("run_step_stats"):
+        if has_index("run_step_stats", "idx_run_step_stats"):
+            op.drop_index("idx_run_step_stats", "run_step_stats")
+        op.drop_table("run_step_stats")
+
+    if has_table("run_stats"):
+        if has_index("run_stats", "idx_run_stats"):
+            op.drop_index("idx_run_stats", "run_stats")
+        op.drop_table("run_stats")
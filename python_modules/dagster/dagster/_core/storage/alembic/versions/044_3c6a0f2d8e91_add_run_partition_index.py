@@ -0,0 +1,26 @@
+"""add run partition index
+
+Revision ID: 3c6a0f2d8e91
+Revises: 7f2b1c9e4d5a
+Create Date: 2024-02-05 14:32:08.271455
+
+"""
+
+from dagster._core.storage.migration.utils import (
+    add_run_partition_index,
+    drop_run_partition_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "3c6a0f2d8e91"
+down_revision = "7f2b1c9e4d5a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_partition_index()
+
+
+def downgrade():
+    drop_run_partition_index()
@@ -2,6 +2,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -22,6 +23,7 @@
     EventLogRecord,
     EventRecordsFilter,
     EventRecordsResult,
+    LazyEventLogRecord,
     RunStatusChangeRecordsFilter,
 )
 from dagster._core.events import DagsterEventType
@@ -35,13 +37,22 @@
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.sql import AlembicVersion
 from dagster._utils import PrintFn
-from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
+from dagster._utils.concurrency import (
+    ConcurrencyClaimStatus,
+    ConcurrencyKeyInfo,
+    ConcurrencyStepClaim,
+)
 
 if TYPE_CHECKING:
     from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
+# Default number of records fetched per query or per round trip when iterating over the records of
+# a run with `iter_records_for_run`.
+DEFAULT_RECORDS_CHUNK_SIZE = 1000
+
+
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
     cursor: str
@@ -170,6 +181,62 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        """Get all of the event log records corresponding to a run, as records that only
+        deserialize their event log entry when it is accessed. Useful for callers that only need
+        the storage ids, asset keys or partitions of the records.
+
+        Storages that cannot defer deserialization return records that are already loaded.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            ascending (bool): Whether to return the records in ascending storage id order.
+        """
+        return [
+            LazyEventLogRecord.from_event_log_record(record)
+            for record in self.get_records_for_run(
+                run_id, of_type=of_type, ascending=ascending
+            ).records
+        ]
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+        chunk_size: int = DEFAULT_RECORDS_CHUNK_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Iterate over all of the event log records corresponding to a run, holding at most
+        `chunk_size` records in memory at a time.
+
+        By default, records are fetched with a `get_records_for_run` query per chunk, paginated by
+        storage id. Storages that support server-side cursors stream the records from a single
+        query instead.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            ascending (bool): Whether to yield the records in ascending storage id order.
+            chunk_size (int): Max number of records to fetch at once.
+        """
+        check.int_param(chunk_size, "chunk_size")
+        check.invariant(chunk_size > 0, "chunk_size must be positive")
+        cursor = None
+        while True:
+            connection = self.get_records_for_run(
+                run_id, cursor=cursor, of_type=of_type, limit=chunk_size, ascending=ascending
+            )
+            yield from connection.records
+            if not connection.has_more:
+                break
+            cursor = connection.cursor
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -374,6 +441,31 @@ def get_latest_tags_by_partition(
     ) -> Mapping[str, Mapping[str, str]]:
         pass
 
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self, asset_keys: Sequence[AssetKey], event_type: DagsterEventType
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys.
+        Storages that can fetch these for many assets at once should override this method.
+        """
+        return {
+            asset_key: self.get_latest_storage_id_by_partition(asset_key, event_type)
+            for asset_key in asset_keys
+        }
+
+    def get_latest_tags_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+        tag_keys: Sequence[str],
+    ) -> Mapping[AssetKey, Mapping[str, Mapping[str, str]]]:
+        """Fetch the given tags of the latest event for each partition of each of the given asset
+        keys. Storages that can fetch these for many assets at once should override this method.
+        """
+        return {
+            asset_key: self.get_latest_tags_by_partition(asset_key, event_type, tag_keys)
+            for asset_key in asset_keys
+        }
+
     @abstractmethod
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: AssetKey, after_storage_id: Optional[int] = None
@@ -449,6 +541,19 @@ def claim_concurrency_slot(
         """Claim concurrency slots for step."""
         raise NotImplementedError()
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        """Claim concurrency slots for many steps of a run at once.  Returns the claim status for
+        each of the given steps, keyed by step key.
+        """
+        return {
+            claim.step_key: self.claim_concurrency_slot(
+                claim.concurrency_key, run_id, claim.step_key, claim.priority
+            )
+            for claim in step_claims
+        }
+
     @abstractmethod
     def check_concurrency_claim(
         self, concurrency_key: str, run_id: str, step_key: str
@@ -471,6 +576,11 @@ def free_concurrency_slot_for_step(self, run_id: str, step_key: str) -> None:
         """Frees concurrency slots for a given run/step."""
         raise NotImplementedError()
 
+    def free_concurrency_slots_for_steps(self, run_id: str, step_keys: Sequence[str]) -> None:
+        """Frees concurrency slots for many steps of a given run at once."""
+        for step_key in step_keys:
+            self.free_concurrency_slot_for_step(run_id, step_key)
+
     @property
     def supports_asset_checks(self):
         return True
@@ -56,10 +56,10 @@ def _connect(self):
                 yield conn
 
     def run_connection(self, run_id=None):
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     def index_connection(self):
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     def has_table(self, table_name: str) -> bool:
         with self._engine.connect() as conn:
@@ -83,7 +83,15 @@ def upgrade(self):
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
         self._storage_id += 1
+        self._notify_handlers(event)
 
+    def store_event_batch(self, events):
+        super(InMemoryEventLogStorage, self).store_event_batch(events)
+        for event in events:
+            self._storage_id += 1
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         handlers = list(self._handlers[event.run_id])
         for handler in handlers:
             try:
@@ -11,9 +11,11 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+SECONDARY_INDEX_RUN_STATS = "run_stats_tables"  # builds the run stats tables from the event log
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    SECONDARY_INDEX_RUN_STATS: lambda: migrate_run_stats_data,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
@@ -73,6 +75,27 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """Utility method to build the run stats and step stats tables from the data in existing event
+    log records, for runs whose events were stored before the tables existed.  Takes in
+    event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying event logs.")
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        event_log_storage.backfill_run_stats(run_id)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster._core.definitions.events import AssetKey
     from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
@@ -180,6 +180,41 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Summary of the events of each type in a run, maintained as events are stored so that run stats
+# can be computed without aggregating over the full event log of the run
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("dagster_event_type", db.String(255), nullable=False),
+    db.Column("event_count", db.Integer, nullable=False),
+    db.Column("first_event_timestamp", db.types.TIMESTAMP),
+    db.Column("last_event_timestamp", db.types.TIMESTAMP),
+)
+
+# Serialized per-step stats (RunStepStatsData) for each step in a run, maintained as events are
+# stored
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("stats_body", db.Text, nullable=False),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index(
     "idx_asset_check_executions",
     AssetCheckExecutionsTable.c.asset_key,
@@ -268,3 +303,16 @@
     mysql_length={"concurrency_key": 255, "run_id": 255, "step_key": 32},
     unique=True,
 )
+db.Index(
+    "idx_run_stats",
+    RunStatsTable.c.run_id,
+    RunStatsTable.c.dagster_event_type,
+    unique=True,
+)
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    mysql_length={"step_key": 255},
+    unique=True,
+)
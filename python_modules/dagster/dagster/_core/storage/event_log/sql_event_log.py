@@ -1,12 +1,16 @@
 import logging
 import os
+import threading
+import time
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ContextManager,
     Dict,
     Iterable,
@@ -44,6 +48,7 @@
 )
 from dagster._core.event_api import (
     EventRecordsResult,
+    LazyEventLogRecord,
     RunShardedEventsCursor,
     RunStatusChangeRecordsFilter,
 )
@@ -51,11 +56,17 @@
     ASSET_CHECK_EVENTS,
     ASSET_EVENTS,
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
-    MARKER_EVENTS,
     DagsterEventType,
 )
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    RUN_STATS_EVENT_TYPES,
+    STEP_STATS_EVENT_TYPES,
+    RunStepKeyStatsSnapshot,
+    RunStepStatsData,
+    build_run_step_stats_from_events,
+    is_step_stats_event,
+)
 from dagster._core.storage.asset_check_execution_record import (
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
@@ -83,6 +94,7 @@
     ConcurrencyClaimStatus,
     ConcurrencyKeyInfo,
     ConcurrencySlotStatus,
+    ConcurrencyStepClaim,
     PendingStepInfo,
     get_max_concurrency_limit_value,
 )
@@ -99,7 +111,12 @@
     EventRecordsFilter,
     PlannedMaterializationInfo,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    SECONDARY_INDEX_RUN_STATS,
+)
 from .schema import (
     AssetCheckExecutionsTable,
     AssetEventTagsTable,
@@ -108,6 +125,8 @@
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -117,6 +136,15 @@
 
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+# Bounds the number of rows written in a single multi-row insert, which keeps batched writes under
+# the bound-parameter limits of older SQLite versions (999 parameters).
+MAX_EVENT_BATCH_INSERT_SIZE = 100
+# Once a storage has found that the run stats tables do not exist, it checks again at this interval,
+# so that long-lived processes start maintaining the tables once a migration has created them.
+RUN_STATS_TABLES_RECHECK_INTERVAL_SECONDS = 60.0
+# Bounds the number of times the stats of a step are re-read and re-applied when they are updated
+# concurrently by another writer.
+MAX_RUN_STEP_STATS_UPDATE_ATTEMPTS = 10
 
 
 def get_max_event_records_limit() -> int:
@@ -163,6 +191,16 @@ def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
     def index_connection(self) -> ContextManager[Connection]:
         """Context manager yielding a connection to access cross-run indexed tables."""
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str]) -> Iterator[Connection]:
+        """Context manager yielding a connection to the run shard that has begun a transaction."""
+        with self.run_connection(run_id) as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                with conn.begin():
+                    yield conn
+
     @contextmanager
     def index_transaction(self) -> Iterator[Connection]:
         """Context manager yielding a connection to the index shard that has begun a transaction."""
@@ -173,6 +211,39 @@ def index_transaction(self) -> Iterator[Connection]:
                 with conn.begin():
                     yield conn
 
+    @cached_property
+    def _batch_transaction_local(self) -> threading.local:
+        return threading.local()
+
+    @contextmanager
+    def _batch_transaction(self) -> Iterator[Connection]:
+        """Context manager yielding a connection that has begun a transaction, which is reused by
+        every `run_connection` and `index_connection` call made on this thread within the block.
+        Used to store a batch of events atomically, in storages that keep the runs and the index
+        in the same database.
+        """
+        with self.index_transaction() as conn:
+            self._batch_transaction_local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._batch_transaction_local.conn = None
+
+    @contextmanager
+    def _batch_or_new_connection(
+        self, connect: Callable[[], ContextManager[Connection]]
+    ) -> Iterator[Connection]:
+        """Yields the connection of the batch transaction open on this thread, if any, and
+        otherwise a new connection from `connect`. Storages that keep the runs and the index in the
+        same database use this to implement `run_connection` and `index_connection`.
+        """
+        batch_conn = getattr(self._batch_transaction_local, "conn", None)
+        if batch_conn is not None:
+            yield batch_conn
+        else:
+            with connect() as conn:
+                yield conn
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -450,6 +521,8 @@ def store_event(self, event: EventLogEntry) -> None:
             result = conn.execute(insert_event_statement)
             event_id = result.inserted_primary_key[0]
 
+        self.update_run_stats(run_id, [event])
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -467,6 +540,100 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events in a single transaction, writing the event rows of each run
+        using multi-row inserts, followed by the run stats, asset, asset tag, and asset check index
+        rows. If storing the batch fails, none of its events are stored.
+
+        Events are written in the order they are given, so storage ids (and therefore cursors)
+        for a run increase in the same order as they would with repeated calls to `store_event`.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        with self._batch_transaction():
+            for run_id, run_events in _group_events_by_run_id(events).items():
+                with self.run_connection(run_id) as conn:
+                    event_ids = self._insert_event_batch(conn, run_events)
+
+                self.update_run_stats(run_id, run_events)
+                self._store_asset_event_batch(run_events, event_ids)
+
+                for event, event_id in zip(run_events, event_ids):
+                    if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                        self.store_asset_check_event(event, event_id)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the rows for a sequence of events, in order, returning the storage id for each
+        event that requires one for its index rows (asset and asset check events), and None for
+        all other events.
+
+        Contiguous runs of events that do not require a storage id are written using multi-row
+        inserts. Storages whose dialect supports `INSERT ... RETURNING` should override this to
+        write the entire batch with multi-row inserts.
+        """
+        event_ids: List[Optional[int]] = []
+        pending: List[EventLogEntry] = []
+
+        def _flush_pending() -> None:
+            self._insert_event_rows(conn, pending)
+            event_ids.extend([None] * len(pending))
+            pending.clear()
+
+        for event in events:
+            if _requires_storage_id_for_index(event):
+                _flush_pending()
+                result = conn.execute(self.prepare_insert_event(event))
+                event_ids.append(result.inserted_primary_key[0])
+            else:
+                pending.append(event)
+
+        _flush_pending()
+        return event_ids
+
+    def _insert_event_rows(self, conn: Connection, events: Sequence[EventLogEntry]) -> None:
+        for chunk in _chunk_events(events):
+            conn.execute(self.prepare_insert_event_batch(chunk))
+
+    def _store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        asset_events = []
+        asset_event_ids = []
+        for event, event_id in zip(events, event_ids):
+            if (
+                event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and event.get_dagster_event().asset_key
+            ):
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                asset_events.append(event)
+                asset_event_ids.append(event_id)
+
+        if not asset_events:
+            return
+
+        # The asset key table only reflects the latest event of each type for a given asset, so
+        # we only need to apply the last event of each type per asset key (in their original
+        # relative order) to reach the same state as applying every event.
+        latest_index_by_asset_and_type: Dict[Tuple[AssetKey, DagsterEventType], int] = {}
+        for i, event in enumerate(asset_events):
+            dagster_event = event.get_dagster_event()
+            asset_key = check.not_none(dagster_event.asset_key)
+            latest_index_by_asset_and_type[(asset_key, dagster_event.event_type)] = i
+
+        for i in sorted(latest_index_by_asset_and_type.values()):
+            self.store_asset_event(asset_events[i], asset_event_ids[i])
+
+        self.store_asset_event_tags(asset_events, asset_event_ids)
+
     def get_records_for_run(
         self,
         run_id,
@@ -487,29 +654,7 @@ def get_records_for_run(
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
-        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
-
-        dagster_event_types = (
-            {of_type}
-            if isinstance(of_type, DagsterEventType)
-            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
-        )
-
-        query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .order_by(
-                SqlEventLogStorageTable.c.id.asc()
-                if ascending
-                else SqlEventLogStorageTable.c.id.desc()
-            )
-        )
-        if dagster_event_types:
-            query = query.where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
-                )
-            )
+        query = self._get_records_for_run_query(run_id, of_type, ascending)
 
         # adjust 0 based index cursor to SQL offset
         if cursor is not None:
@@ -528,22 +673,8 @@ def get_records_for_run(
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        records = self._records_for_run_from_rows(run_id, results)
+        last_record_id = records[-1].storage_id if records else None
 
         if last_record_id is not None:
             next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
@@ -560,14 +691,405 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
-    def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        ascending: bool,
+    ) -> SqlAlchemyQuery:
+        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
+
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
+        )
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(
+                SqlEventLogStorageTable.c.id.asc()
+                if ascending
+                else SqlEventLogStorageTable.c.id.desc()
+            )
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+        return query
+
+    def _records_for_run_from_rows(
+        self, run_id: str, rows: Sequence[SqlAlchemyRow]
+    ) -> Sequence[EventLogRecord]:
+        try:
+            return [
+                EventLogRecord(
+                    storage_id=record_id,
+                    event_log_entry=deserialize_value(json_str, EventLogEntry),
+                )
+                for record_id, json_str, *_ in rows
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
         check.str_param(run_id, "run_id")
 
+        query = self._get_records_for_run_query(run_id, of_type, ascending)
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        return [
+            LazyEventLogRecord(
+                storage_id=record_id,
+                serialized_event=json_str,
+                run_id=run_id,
+                asset_key_str=asset_key_str,
+                partition=partition,
+            )
+            for record_id, json_str, asset_key_str, partition in results
+        ]
+
+    def _stream_records_for_run(
+        self,
+        conn: Connection,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        ascending: bool,
+        chunk_size: int,
+    ) -> Iterator[EventLogRecord]:
+        """Yields the records of a run from a single query using a server-side cursor, fetching
+        `chunk_size` rows per round trip. Used by storages whose drivers support streaming results.
+        """
+        check.str_param(run_id, "run_id")
+        check.int_param(chunk_size, "chunk_size")
+        check.invariant(chunk_size > 0, "chunk_size must be positive")
+
+        query = self._get_records_for_run_query(run_id, of_type, ascending)
+        result = conn.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(
+            query
+        )
+        try:
+            while True:
+                rows = result.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from self._records_for_run_from_rows(run_id, rows)
+        finally:
+            result.close()
+
+    @property
+    def _has_run_stats_tables(self) -> bool:
+        return self._check_run_stats_tables(
+            None,
+            lambda: self.has_table(RunStatsTable.name) and self.has_table(RunStepStatsTable.name),
+        )
+
+    @cached_property
+    def _run_stats_tables_cache(self) -> Dict[Optional[str], Tuple[bool, float]]:
+        return {}
+
+    def _check_run_stats_tables(self, key: Optional[str], check_fn: Callable[[], bool]) -> bool:
+        """Returns whether the run stats tables exist in the database identified by `key`, caching
+        the answer. Tables are never dropped while a storage is in use, so a positive answer is
+        cached indefinitely, while a negative answer is rechecked once it is older than
+        RUN_STATS_TABLES_RECHECK_INTERVAL_SECONDS.
+        """
+        cached = self._run_stats_tables_cache.get(key)
+        now = time.monotonic()
+        if cached is not None:
+            has_tables, checked_at = cached
+            if has_tables or now - checked_at < RUN_STATS_TABLES_RECHECK_INTERVAL_SECONDS:
+                return has_tables
+
+        has_tables = check_fn()
+        self._run_stats_tables_cache[key] = (has_tables, now)
+        return has_tables
+
+    def _has_run_stats_tables_for_run(self, run_id: str) -> bool:
+        """Whether the run stats tables exist in the database storing the events of the given run.
+        Should be overridden by storages that shard based on run_id.
+        """
+        return self._has_run_stats_tables
+
+    def has_run_stats_index(self, run_id: str) -> bool:
+        """Whether the run stats and step stats of a run can be served from the incrementally
+        maintained `run_stats` and `run_step_stats` tables, instead of aggregating over the event
+        log of the run.
+        """
+        return self._has_run_stats_tables_for_run(run_id) and self.has_secondary_index(
+            SECONDARY_INDEX_RUN_STATS
+        )
+
+    def update_run_stats(self, run_id: str, events: Sequence[EventLogEntry]) -> None:
+        """Applies the given events of a run, which have just been stored, to the run stats and
+        step stats tables.
+        """
+        if not self._has_run_stats_tables_for_run(run_id):
+            return
+
+        run_stats_events = [
+            event
+            for event in events
+            if event.is_dagster_event and event.dagster_event_type in RUN_STATS_EVENT_TYPES
+        ]
+        step_stats_events = [event for event in events if is_step_stats_event(event)]
+        if not run_stats_events and not step_stats_events:
+            return
+
+        with self.run_connection(run_id) as conn:
+            self._update_run_stats_rows(conn, run_id, run_stats_events)
+            self._update_run_step_stats_rows(conn, run_id, step_stats_events)
+
+    def _update_run_stats_rows(
+        self, conn: Connection, run_id: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        events_by_type: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_type[event.get_dagster_event().event_type_value].append(event)
+
+        for dagster_event_type, type_events in events_by_type.items():
+            first_timestamp = self._event_insert_timestamp(
+                min(type_events, key=lambda e: e.timestamp)
+            )
+            last_timestamp = self._event_insert_timestamp(
+                max(type_events, key=lambda e: e.timestamp)
+            )
+            update_statement = (
+                RunStatsTable.update()
+                .where(
+                    db.and_(
+                        RunStatsTable.c.run_id == run_id,
+                        RunStatsTable.c.dagster_event_type == dagster_event_type,
+                    )
+                )
+                .values(
+                    event_count=RunStatsTable.c.event_count + len(type_events),
+                    first_event_timestamp=db_case(
+                        [
+                            (
+                                RunStatsTable.c.first_event_timestamp > first_timestamp,
+                                db.literal(first_timestamp, db.types.TIMESTAMP),
+                            )
+                        ],
+                        else_=RunStatsTable.c.first_event_timestamp,
+                    ),
+                    last_event_timestamp=db_case(
+                        [
+                            (
+                                RunStatsTable.c.last_event_timestamp < last_timestamp,
+                                db.literal(last_timestamp, db.types.TIMESTAMP),
+                            )
+                        ],
+                        else_=RunStatsTable.c.last_event_timestamp,
+                    ),
+                )
+            )
+            if conn.execute(update_statement).rowcount:
+                continue
+
+            try:
+                conn.execute(
+                    RunStatsTable.insert().values(
+                        run_id=run_id,
+                        dagster_event_type=dagster_event_type,
+                        event_count=len(type_events),
+                        first_event_timestamp=first_timestamp,
+                        last_event_timestamp=last_timestamp,
+                    )
+                )
+            except db_exc.IntegrityError:
+                # the row was inserted concurrently, since we tried to update it
+                conn.execute(update_statement)
+
+    def _update_run_step_stats_rows(
+        self, conn: Connection, run_id: str, events: Sequence[EventLogEntry]
+    ) -> None:
+        # Both the process executing a step and the orchestrating process write events for the
+        # step, so the stats of a step may be updated concurrently. The stored stats are read with
+        # a locking read where the database supports it, and written back with a compare-and-swap
+        # on the previously read value, so that a concurrent update is re-read and re-applied
+        # rather than lost.
+        #
+        # The stats of all steps in the batch are read in a single query, so storing a batch of
+        # events costs one read plus one write per step, and storing a single step event costs one
+        # read and one write.
+        pending_events_by_step_key: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            pending_events_by_step_key[check.not_none(event.get_dagster_event().step_key)].append(
+                event
+            )
+
+        for _ in range(MAX_RUN_STEP_STATS_UPDATE_ATTEMPTS):
+            if not pending_events_by_step_key:
+                return
+
+            stored_stats_bodies = self._get_run_step_stats_bodies(
+                conn, run_id, list(pending_events_by_step_key.keys()), for_update=True
+            )
+            for step_key, step_events in list(pending_events_by_step_key.items()):
+                stored_stats_body = stored_stats_bodies.get(step_key)
+                stats_data = (
+                    deserialize_value(stored_stats_body, RunStepStatsData)
+                    if stored_stats_body is not None
+                    else RunStepStatsData(step_key)
+                )
+                for event in step_events:
+                    stats_data = stats_data.with_event(event)
+
+                if stored_stats_body is None:
+                    try:
+                        conn.execute(
+                            RunStepStatsTable.insert().values(
+                                run_id=run_id,
+                                step_key=step_key,
+                                stats_body=serialize_value(stats_data),
+                            )
+                        )
+                    except db_exc.IntegrityError:
+                        # the row was inserted concurrently, so apply the events to the stored stats
+                        continue
+                else:
+                    result = conn.execute(
+                        RunStepStatsTable.update()
+                        .where(
+                            db.and_(
+                                RunStepStatsTable.c.run_id == run_id,
+                                RunStepStatsTable.c.step_key == step_key,
+                                RunStepStatsTable.c.stats_body == stored_stats_body,
+                            )
+                        )
+                        .values(
+                            stats_body=serialize_value(stats_data),
+                            update_timestamp=pendulum.now("UTC"),
+                        )
+                    )
+                    if not result.rowcount:
+                        # the row was updated concurrently, so apply the events to the stored stats
+                        continue
+
+                del pending_events_by_step_key[step_key]
+
+        if pending_events_by_step_key:
+            raise DagsterInvariantViolationError(
+                f"Could not update the step stats of run {run_id} for steps"
+                f" {sorted(pending_events_by_step_key.keys())}, which were updated concurrently"
+                f" {MAX_RUN_STEP_STATS_UPDATE_ATTEMPTS} times."
+            )
+
+    def _get_run_step_stats_bodies(
+        self,
+        conn: Connection,
+        run_id: str,
+        step_keys: Sequence[str],
+        for_update: bool = False,
+    ) -> Mapping[str, str]:
+        query = (
+            db_select([RunStepStatsTable.c.step_key, RunStepStatsTable.c.stats_body])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .where(RunStepStatsTable.c.step_key.in_(step_keys))
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        if for_update:
+            # locks the rows until the end of the transaction on databases that support it, and
+            # is ignored by SQLite, which locks the whole database for writes
+            query = query.with_for_update()
+
+        return {step_key: stats_body for step_key, stats_body in conn.execute(query).fetchall()}
+
+    def _get_run_step_stats_data(
+        self, conn: Connection, run_id: str, step_keys: Optional[Sequence[str]] = None
+    ) -> Mapping[str, RunStepStatsData]:
         query = (
+            db_select([RunStepStatsTable.c.step_key, RunStepStatsTable.c.stats_body])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(RunStepStatsTable.c.step_key.in_(step_keys))
+
+        return {
+            step_key: deserialize_value(stats_body, RunStepStatsData)
+            for step_key, stats_body in conn.execute(query).fetchall()
+        }
+
+    def backfill_run_stats(self, run_id: str) -> None:
+        """Rebuilds the run stats and step stats rows for a run from its event log."""
+        check.str_param(run_id, "run_id")
+
+        if not self._has_run_stats_tables_for_run(run_id):
+            return
+
+        # the rows are deleted and rebuilt in one transaction, so that the stats of the run are
+        # never read while they are missing or partially rebuilt
+        with self.run_transaction(run_id) as conn:
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
+
+            run_stats_rows = conn.execute(
+                self._run_stats_event_log_query(run_id).where(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in RUN_STATS_EVENT_TYPES]
+                    )
+                )
+            ).fetchall()
+            for (
+                dagster_event_type,
+                event_count,
+                first_event_timestamp,
+                last_event_timestamp,
+            ) in run_stats_rows:
+                conn.execute(
+                    RunStatsTable.insert().values(
+                        run_id=run_id,
+                        dagster_event_type=dagster_event_type,
+                        event_count=event_count,
+                        first_event_timestamp=first_event_timestamp,
+                        last_event_timestamp=last_event_timestamp,
+                    )
+                )
+
+            stats_data_by_step_key: Dict[str, RunStepStatsData] = {}
+            for (json_str,) in conn.execute(self._step_stats_event_log_query(run_id)).fetchall():
+                event = deserialize_value(json_str, EventLogEntry)
+                if not is_step_stats_event(event):
+                    continue
+                step_key = check.not_none(event.get_dagster_event().step_key)
+                stats_data = stats_data_by_step_key.get(step_key) or RunStepStatsData(step_key)
+                stats_data_by_step_key[step_key] = stats_data.with_event(event)
+
+            for step_key, stats_data in stats_data_by_step_key.items():
+                conn.execute(
+                    RunStepStatsTable.insert().values(
+                        run_id=run_id,
+                        step_key=step_key,
+                        stats_body=serialize_value(stats_data),
+                    )
+                )
+
+    def _run_stats_event_log_query(self, run_id: str) -> SqlAlchemyQuery:
+        return (
             db_select(
                 [
                     SqlEventLogStorageTable.c.dagster_event_type,
                     db.func.count().label("n_events_of_type"),
+                    db.func.min(SqlEventLogStorageTable.c.timestamp).label("first_event_timestamp"),
                     db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
                 ]
             )
@@ -580,6 +1102,42 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
             .group_by("dagster_event_type")
         )
 
+    def _step_stats_event_log_query(
+        self,
+        run_id: str,
+        step_keys: Optional[Sequence[str]] = None,
+        event_types: Iterable[DagsterEventType] = STEP_STATS_EVENT_TYPES,
+    ) -> SqlAlchemyQuery:
+        query = (
+            db_select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in event_types]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+        return query
+
+    def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
+        check.str_param(run_id, "run_id")
+
+        if self.has_run_stats_index(run_id):
+            query = db_select(
+                [
+                    RunStatsTable.c.dagster_event_type,
+                    RunStatsTable.c.event_count,
+                    RunStatsTable.c.first_event_timestamp,
+                    RunStatsTable.c.last_event_timestamp,
+                ]
+            ).where(RunStatsTable.c.run_id == run_id)
+        else:
+            query = self._run_stats_event_log_query(run_id)
+
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
@@ -587,7 +1145,7 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
             counts = {}
             times = {}
             for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
+                (dagster_event_type, n_events_of_type, _, last_event_timestamp) = result
                 check.invariant(dagster_event_type is not None)
                 counts[dagster_event_type] = n_events_of_type
                 times[dagster_event_type] = last_event_timestamp
@@ -623,6 +1181,9 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_run_stats_index(run_id):
+            return self._get_step_stats_for_run_from_index(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -635,32 +1196,10 @@ def get_step_stats_for_run(
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
-                )
-            )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
-        )
-        if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
+        #
+        # Storages with the run stats index instead read the per-step stats accumulated as events
+        # are stored, and only fetch the raw materialization events.
+        raw_event_query = self._step_stats_event_log_query(run_id, step_keys)
 
         with self.run_connection(run_id) as conn:
             results = conn.execute(raw_event_query).fetchall()
@@ -671,6 +1210,38 @@ def get_step_stats_for_run(
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_step_stats_for_run_from_index(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> Sequence[RunStepKeyStatsSnapshot]:
+        with self.run_connection(run_id) as conn:
+            try:
+                stats_data_by_step_key = {
+                    step_key: stats_data
+                    for step_key, stats_data in self._get_run_step_stats_data(
+                        conn, run_id, step_keys
+                    ).items()
+                    if stats_data.has_stats
+                }
+                if not stats_data_by_step_key:
+                    return []
+
+                materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+                materialization_query = self._step_stats_event_log_query(
+                    run_id,
+                    list(stats_data_by_step_key.keys()),
+                    event_types=[DagsterEventType.ASSET_MATERIALIZATION],
+                )
+                for (json_str,) in conn.execute(materialization_query).fetchall():
+                    event = deserialize_value(json_str, EventLogEntry)
+                    materialization_events[check.not_none(event.step_key)].append(event)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return [
+            stats_data.to_snapshot(run_id, materialization_events[step_key])
+            for step_key, stats_data in stats_data_by_step_key.items()
+        ]
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -687,6 +1258,13 @@ def _apply_migration(self, migration_name, migration_fn, print_fn, force):
     def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the event_log table."""
         for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
+            if migration_name == SECONDARY_INDEX_RUN_STATS and not self._has_run_stats_tables:
+                if print_fn:
+                    print_fn(
+                        f"Skipping data migration: {migration_name}, which requires a schema"
+                        " migration. Run `dagster instance migrate` first."
+                    )
+                continue
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
@@ -722,6 +1300,10 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self._has_run_stats_tables:
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -744,6 +1326,10 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self._has_run_stats_tables:
+                conn.execute(RunStatsTable.delete())
+                conn.execute(RunStepStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -771,6 +1357,9 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         conn.execute(
             SqlEventLogStorageTable.delete().where(SqlEventLogStorageTable.c.run_id == run_id)
         )
+        if db.inspect(conn).has_table(RunStatsTable.name):
+            conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+            conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
         if asset_event_ids:
             conn.execute(
                 AssetEventTagsTable.delete().where(
@@ -782,6 +1371,17 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
     def is_persistent(self) -> bool:
         return True
 
+    def get_all_run_ids(self) -> Sequence[str]:
+        """Returns the ids of all runs that have events stored in the event log."""
+        query = (
+            db_select([SqlEventLogStorageTable.c.run_id])
+            .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+            .where(SqlEventLogStorageTable.c.run_id != "")
+            .distinct()
+        )
+        with self.index_connection() as conn:
+            return [run_id for (run_id,) in conn.execute(query).fetchall()]
+
     def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
         """Utility method for migration scripts to update SQL representation of event records."""
         check.int_param(record_id, "record_id")
@@ -1823,15 +2423,37 @@ def _latest_event_ids_by_partition_subquery(
         """Subquery for locating the latest event ids by partition for a given asset key and set
         of event types.
         """
+        return self._latest_event_ids_by_asset_partition_subquery(
+            [asset_key],
+            event_types,
+            asset_partitions=asset_partitions,
+            before_cursor=before_cursor,
+            after_cursor=after_cursor,
+        )
+
+    def _latest_event_ids_by_asset_partition_subquery(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_types: Sequence[DagsterEventType],
+        asset_partitions: Optional[Sequence[str]] = None,
+        before_cursor: Optional[int] = None,
+        after_cursor: Optional[int] = None,
+    ):
+        """Subquery for locating the latest event ids by asset key and partition for a given set of
+        asset keys and event types.
+        """
         query = db_select(
             [
+                SqlEventLogStorageTable.c.asset_key,
                 SqlEventLogStorageTable.c.dagster_event_type,
                 SqlEventLogStorageTable.c.partition,
                 db.func.max(SqlEventLogStorageTable.c.id).label("id"),
             ]
         ).where(
             db.and_(
-                SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                SqlEventLogStorageTable.c.asset_key.in_(
+                    [asset_key.to_string() for asset_key in asset_keys]
+                ),
                 SqlEventLogStorageTable.c.partition != None,  # noqa: E711
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
                     [event_type.value for event_type in event_types]
@@ -1846,13 +2468,15 @@ def _latest_event_ids_by_partition_subquery(
             query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
 
         latest_event_ids_subquery = query.group_by(
-            SqlEventLogStorageTable.c.dagster_event_type, SqlEventLogStorageTable.c.partition
+            SqlEventLogStorageTable.c.asset_key,
+            SqlEventLogStorageTable.c.dagster_event_type,
+            SqlEventLogStorageTable.c.partition,
         )
 
-        assets_details = self._get_assets_details([asset_key])
+        assets_details = self._get_assets_details(asset_keys)
         return db_subquery(
             self._add_assets_wipe_filter_to_query(
-                latest_event_ids_subquery, assets_details, [asset_key]
+                latest_event_ids_subquery, assets_details, asset_keys
             ),
             "latest_event_ids_by_partition_subquery",
         )
@@ -1935,6 +2559,93 @@ def get_latest_tags_by_partition(
         # convert defaultdict to dict
         return dict(latest_tags_by_partition)
 
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self, asset_keys: Sequence[AssetKey], event_type: DagsterEventType
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+
+        if not asset_keys:
+            return {}
+
+        latest_event_ids_subquery = self._latest_event_ids_by_asset_partition_subquery(
+            asset_keys, [event_type]
+        )
+        latest_event_ids_by_asset_partition = db_select(
+            [
+                latest_event_ids_subquery.c.asset_key,
+                latest_event_ids_subquery.c.partition,
+                latest_event_ids_subquery.c.id,
+            ]
+        )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(latest_event_ids_by_asset_partition).fetchall()
+
+        latest_storage_id_by_partition_by_asset_key: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for row in rows:
+            asset_key = AssetKey.from_db_string(cast(str, row[0]))
+            if asset_key is not None and asset_key in latest_storage_id_by_partition_by_asset_key:
+                latest_storage_id_by_partition_by_asset_key[asset_key][cast(str, row[1])] = cast(
+                    int, row[2]
+                )
+        return latest_storage_id_by_partition_by_asset_key
+
+    def get_latest_tags_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+        tag_keys: Sequence[str],
+    ) -> Mapping[AssetKey, Mapping[str, Mapping[str, str]]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+
+        if not asset_keys:
+            return {}
+
+        latest_event_ids_subquery = self._latest_event_ids_by_asset_partition_subquery(
+            asset_keys, [event_type]
+        )
+        latest_tags_by_asset_partition_query = (
+            db_select(
+                [
+                    latest_event_ids_subquery.c.asset_key,
+                    latest_event_ids_subquery.c.partition,
+                    AssetEventTagsTable.c.key,
+                    AssetEventTagsTable.c.value,
+                ]
+            )
+            .select_from(
+                latest_event_ids_subquery.join(
+                    AssetEventTagsTable,
+                    AssetEventTagsTable.c.event_id == latest_event_ids_subquery.c.id,
+                )
+            )
+            .where(AssetEventTagsTable.c.key.in_(tag_keys))
+        )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(latest_tags_by_asset_partition_query).fetchall()
+
+        latest_tags_by_partition_by_asset_key: Dict[AssetKey, Dict[str, Dict[str, str]]] = {
+            asset_key: defaultdict(dict) for asset_key in asset_keys
+        }
+        for row in rows:
+            asset_key = AssetKey.from_db_string(cast(str, row[0]))
+            if asset_key is not None and asset_key in latest_tags_by_partition_by_asset_key:
+                latest_tags_by_partition_by_asset_key[asset_key][cast(str, row[1])][
+                    cast(str, row[2])
+                ] = cast(str, row[3])
+
+        # convert defaultdicts to dicts
+        return {
+            asset_key: dict(latest_tags_by_partition)
+            for asset_key, latest_tags_by_partition in latest_tags_by_partition_by_asset_key.items()
+        }
+
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: AssetKey, after_storage_id: Optional[int] = None
     ) -> Mapping[str, Tuple[str, int]]:
@@ -2433,9 +3144,15 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
         if not concurrency_keys:
             return
 
+        # a key may be repeated once per freed slot, so assign the pending steps for each distinct
+        # key in a single query
+        counts_by_key: Dict[str, int] = defaultdict(int)
+        for key in concurrency_keys:
+            counts_by_key[key] += 1
+
         with self.index_connection() as conn:
-            for key in concurrency_keys:
-                row = conn.execute(
+            for key, count in counts_by_key.items():
+                rows = conn.execute(
                     db_select([PendingStepsTable.c.id])
                     .where(
                         db.and_(
@@ -2447,12 +3164,12 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
                         PendingStepsTable.c.priority.desc(),
                         PendingStepsTable.c.create_timestamp.asc(),
                     )
-                    .limit(1)
-                ).fetchone()
-                if row:
+                    .limit(count)
+                ).fetchall()
+                if rows:
                     conn.execute(
                         PendingStepsTable.update()
-                        .where(PendingStepsTable.c.id == row[0])
+                        .where(PendingStepsTable.c.id.in_([row[0] for row in rows]))
                         .values(assigned_timestamp=db.func.now())
                     )
 
@@ -2483,7 +3200,9 @@ def add_pending_step(
                 # do nothing
                 pass
 
-    def _remove_pending_steps(self, run_id: str, step_key: Optional[str] = None) -> Sequence[str]:
+    def _remove_pending_steps(
+        self, run_id: str, step_keys: Optional[Sequence[str]] = None
+    ) -> Sequence[str]:
         # fetch the assigned steps to delete, while grabbing the concurrency keys so that we can
         # assign the next set of queued steps, if necessary
         select_query = (
@@ -2498,8 +3217,8 @@ def _remove_pending_steps(self, run_id: str, step_key: Optional[str] = None) ->
             .where(PendingStepsTable.c.run_id == run_id)
             .with_for_update()
         )
-        if step_key:
-            select_query = select_query.where(PendingStepsTable.c.step_key == step_key)
+        if step_keys is not None:
+            select_query = select_query.where(PendingStepsTable.c.step_key.in_(step_keys))
 
         with self.index_connection() as conn:
             rows = conn.execute(select_query).fetchall()
@@ -2591,6 +3310,215 @@ def _claim_concurrency_slot(
 
             return ConcurrencySlotStatus.CLAIMED
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        """Claim concurrency slots for many steps of a run at once.  This registers any new steps
+        in the pending queue with a single insert, and then claims slots for all of the assigned
+        steps in a single transaction, instead of issuing several queries per step.
+
+        Args:
+            run_id (str): The run id to claim for.
+            step_claims (Sequence[ConcurrencyStepClaim]): The concurrency key, step key, and
+                priority of each step to claim a slot for.
+
+        Returns:
+            Mapping[str, ConcurrencyClaimStatus]: The claim status for each step, by step key.
+        """
+        check.str_param(run_id, "run_id")
+        check.sequence_param(step_claims, "step_claims", of_type=ConcurrencyStepClaim)
+        if not step_claims:
+            return {}
+
+        # first, register the steps by adding them to the pending queue
+        self._add_pending_steps(run_id, step_claims)
+
+        step_keys = [claim.step_key for claim in step_claims]
+        with self.index_connection() as conn:
+            pending_rows = db_fetch_mappings(
+                conn,
+                db_select(
+                    [
+                        PendingStepsTable.c.concurrency_key,
+                        PendingStepsTable.c.step_key,
+                        PendingStepsTable.c.assigned_timestamp,
+                        PendingStepsTable.c.priority,
+                        PendingStepsTable.c.create_timestamp,
+                    ]
+                ).where(
+                    db.and_(
+                        PendingStepsTable.c.run_id == run_id,
+                        PendingStepsTable.c.step_key.in_(step_keys),
+                    )
+                ),
+            )
+            pending_by_key = {
+                (row["concurrency_key"], row["step_key"]): row for row in pending_rows
+            }
+            claimed_rows = conn.execute(
+                db_select(
+                    [ConcurrencySlotsTable.c.concurrency_key, ConcurrencySlotsTable.c.step_key]
+                ).where(
+                    db.and_(
+                        ConcurrencySlotsTable.c.run_id == run_id,
+                        ConcurrencySlotsTable.c.step_key.in_(step_keys),
+                    )
+                )
+            ).fetchall()
+            claimed = {(cast(str, row[0]), cast(str, row[1])) for row in claimed_rows}
+
+            claim_statuses: Dict[str, ConcurrencyClaimStatus] = {}
+            to_claim: Dict[str, List[str]] = defaultdict(list)
+            for claim in step_claims:
+                row = pending_by_key.get((claim.concurrency_key, claim.step_key))
+                if not row:
+                    claim_statuses[claim.step_key] = ConcurrencyClaimStatus(
+                        concurrency_key=claim.concurrency_key,
+                        slot_status=ConcurrencySlotStatus.BLOCKED,
+                    )
+                    continue
+
+                is_claimed = (claim.concurrency_key, claim.step_key) in claimed
+                claim_statuses[claim.step_key] = ConcurrencyClaimStatus(
+                    concurrency_key=claim.concurrency_key,
+                    slot_status=(
+                        ConcurrencySlotStatus.CLAIMED
+                        if is_claimed
+                        else ConcurrencySlotStatus.BLOCKED
+                    ),
+                    priority=row["priority"] if row["priority"] else None,
+                    assigned_timestamp=row["assigned_timestamp"],
+                    enqueued_timestamp=row["create_timestamp"],
+                )
+                if row["assigned_timestamp"] is not None and not is_claimed:
+                    to_claim[claim.concurrency_key].append(claim.step_key)
+
+            # claim a slot for each of the assigned steps, using the slot rows as a semaphore
+            for concurrency_key, claim_step_keys in to_claim.items():
+                slot_rows = conn.execute(
+                    db_select([ConcurrencySlotsTable.c.id])
+                    .select_from(ConcurrencySlotsTable)
+                    .where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                            ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                            ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                        )
+                    )
+                    .with_for_update(skip_locked=True)
+                    .limit(len(claim_step_keys))
+                ).fetchall()
+                for slot_row, step_key in zip(slot_rows, claim_step_keys):
+                    if conn.execute(
+                        ConcurrencySlotsTable.update()
+                        .values(run_id=run_id, step_key=step_key)
+                        .where(ConcurrencySlotsTable.c.id == slot_row[0])
+                    ).rowcount:
+                        claim_statuses[step_key] = claim_statuses[step_key].with_slot_status(
+                            ConcurrencySlotStatus.CLAIMED
+                        )
+
+        return claim_statuses
+
+    def _add_pending_steps(self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]) -> None:
+        """Adds the steps that are not yet in the pending queue, assigning as many of them as there
+        are unassigned slots for their concurrency key, in priority order.
+
+        The unassigned slots are counted and the steps are inserted in a single transaction, holding
+        a lock on the slot rows of the concurrency keys, so that concurrent claims cannot assign
+        more steps than there are slots.
+        """
+        step_keys = [claim.step_key for claim in step_claims]
+        try:
+            with self.index_transaction() as conn:
+                existing_rows = conn.execute(
+                    db_select(
+                        [PendingStepsTable.c.concurrency_key, PendingStepsTable.c.step_key]
+                    ).where(
+                        db.and_(
+                            PendingStepsTable.c.run_id == run_id,
+                            PendingStepsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+                existing = {(cast(str, row[0]), cast(str, row[1])) for row in existing_rows}
+                to_add = sorted(
+                    [
+                        claim
+                        for claim in step_claims
+                        if (claim.concurrency_key, claim.step_key) not in existing
+                    ],
+                    key=lambda claim: -(claim.priority or 0),
+                )
+                if not to_add:
+                    return
+
+                unassigned_slot_counts = self._get_unassigned_slot_counts(
+                    conn, {claim.concurrency_key for claim in to_add}
+                )
+                rows = []
+                for claim in to_add:
+                    should_assign = unassigned_slot_counts.get(claim.concurrency_key, 0) > 0
+                    if should_assign:
+                        unassigned_slot_counts[claim.concurrency_key] -= 1
+                    rows.append(
+                        dict(
+                            run_id=run_id,
+                            step_key=claim.step_key,
+                            concurrency_key=claim.concurrency_key,
+                            priority=claim.priority or 0,
+                            assigned_timestamp=db.func.now() if should_assign else None,
+                        )
+                    )
+                conn.execute(PendingStepsTable.insert().values(rows))
+        except db_exc.IntegrityError:
+            # some of the steps were concurrently added to the queue, fall back to adding the steps
+            # one at a time, ignoring the ones that already exist
+            for claim in step_claims:
+                if not self.has_pending_step(
+                    concurrency_key=claim.concurrency_key, run_id=run_id, step_key=claim.step_key
+                ):
+                    self.add_pending_step(
+                        concurrency_key=claim.concurrency_key,
+                        run_id=run_id,
+                        step_key=claim.step_key,
+                        priority=claim.priority,
+                        should_assign=self.has_unassigned_slots(claim.concurrency_key),
+                    )
+
+    def _get_unassigned_slot_counts(self, conn, concurrency_keys: Set[str]) -> Dict[str, int]:
+        # lock the slot rows, so that the counts hold until the end of the transaction
+        slot_rows = conn.execute(
+            db_select([ConcurrencySlotsTable.c.concurrency_key])
+            .select_from(ConcurrencySlotsTable)
+            .where(
+                db.and_(
+                    ConcurrencySlotsTable.c.concurrency_key.in_(concurrency_keys),
+                    ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                )
+            )
+            .with_for_update()
+        ).fetchall()
+        assigned_rows = conn.execute(
+            db_select([PendingStepsTable.c.concurrency_key, db.func.count()])
+            .select_from(PendingStepsTable)
+            .where(
+                db.and_(
+                    PendingStepsTable.c.concurrency_key.in_(concurrency_keys),
+                    PendingStepsTable.c.assigned_timestamp != None,  # noqa: E711
+                )
+            )
+            .group_by(PendingStepsTable.c.concurrency_key)
+        ).fetchall()
+        assigned_counts = {cast(str, row[0]): cast(int, row[1]) for row in assigned_rows}
+        slot_counts: Dict[str, int] = defaultdict(int)
+        for row in slot_rows:
+            slot_counts[cast(str, row[0])] += 1
+        return {
+            concurrency_key: slot_count - assigned_counts.get(concurrency_key, 0)
+            for concurrency_key, slot_count in slot_counts.items()
+        }
+
     def get_concurrency_keys(self) -> Set[str]:
         self._reconcile_concurrency_limits_from_slots()
 
@@ -2683,21 +3611,29 @@ def free_concurrency_slots_for_run(self, run_id: str) -> None:
             self.assign_pending_steps(removed_assigned_concurrency_keys)
 
     def free_concurrency_slot_for_step(self, run_id: str, step_key: str) -> None:
-        self._free_concurrency_slots(run_id=run_id, step_key=step_key)
+        self.free_concurrency_slots_for_steps(run_id, [step_key])
+
+    def free_concurrency_slots_for_steps(self, run_id: str, step_keys: Sequence[str]) -> None:
+        if not step_keys:
+            return
+
+        self._free_concurrency_slots(run_id=run_id, step_keys=step_keys)
         removed_assigned_concurrency_keys = self._remove_pending_steps(
-            run_id=run_id, step_key=step_key
+            run_id=run_id, step_keys=step_keys
         )
         if removed_assigned_concurrency_keys:
             # assign any pending steps that can now claim a slot
             self.assign_pending_steps(removed_assigned_concurrency_keys)
 
-    def _free_concurrency_slots(self, run_id: str, step_key: Optional[str] = None) -> Sequence[str]:
-        """Frees concurrency slots for a given run/step.
+    def _free_concurrency_slots(
+        self, run_id: str, step_keys: Optional[Sequence[str]] = None
+    ) -> Sequence[str]:
+        """Frees concurrency slots for a given run/steps.
 
         Args:
             run_id (str): The run id to free the slots for.
-            step_key (Optional[str]): The step key to free the slots for. If not provided, all the
-                slots for all the steps of the run will be freed.
+            step_keys (Optional[Sequence[str]]): The step keys to free the slots for. If not
+                provided, all the slots for all the steps of the run will be freed.
         """
         with self.index_connection() as conn:
             # first delete any rows that apply and are marked as deleted.  This happens when the
@@ -2709,8 +3645,8 @@ def _free_concurrency_slots(self, run_id: str, step_key: Optional[str] = None) -
                     ConcurrencySlotsTable.c.deleted == True,  # noqa: E712
                 )
             )
-            if step_key:
-                delete_query = delete_query.where(ConcurrencySlotsTable.c.step_key == step_key)
+            if step_keys is not None:
+                delete_query = delete_query.where(ConcurrencySlotsTable.c.step_key.in_(step_keys))
             conn.execute(delete_query)
 
             # next, fetch the slots to free up, while grabbing the concurrency keys so that we can
@@ -2721,8 +3657,8 @@ def _free_concurrency_slots(self, run_id: str, step_key: Optional[str] = None) -
                 .where(ConcurrencySlotsTable.c.run_id == run_id)
                 .with_for_update()
             )
-            if step_key:
-                select_query = select_query.where(ConcurrencySlotsTable.c.step_key == step_key)
+            if step_keys is not None:
+                select_query = select_query.where(ConcurrencySlotsTable.c.step_key.in_(step_keys))
             rows = conn.execute(select_query).fetchall()
             if not rows:
                 return []
@@ -2968,6 +3904,30 @@ def get_latest_planned_materialization_info(
         )
 
 
+def _group_events_by_run_id(
+    events: Sequence[EventLogEntry],
+) -> Mapping[str, Sequence[EventLogEntry]]:
+    events_by_run_id: Dict[str, List[EventLogEntry]] = OrderedDict()
+    for event in events:
+        events_by_run_id.setdefault(event.run_id, []).append(event)
+    return events_by_run_id
+
+
+def _chunk_events(events: Sequence[EventLogEntry]) -> Iterator[Sequence[EventLogEntry]]:
+    for i in range(0, len(events), MAX_EVENT_BATCH_INSERT_SIZE):
+        yield events[i : i + MAX_EVENT_BATCH_INSERT_SIZE]
+
+
+def _requires_storage_id_for_index(event: EventLogEntry) -> bool:
+    if not event.is_dagster_event:
+        return False
+
+    if event.dagster_event_type in ASSET_CHECK_EVENTS:
+        return True
+
+    return event.dagster_event_type in ASSET_EVENTS and bool(event.get_dagster_event().asset_key)
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
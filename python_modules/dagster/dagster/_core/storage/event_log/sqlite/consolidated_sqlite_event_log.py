@@ -106,10 +106,10 @@ def _connect(self):
                 yield conn
 
     def run_connection(self, run_id: Optional[str]) -> SqlDbConnection:
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     def index_connection(self):
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     def has_table(self, table_name: str) -> bool:
         engine = create_engine(self._conn_string, poolclass=NullPool)
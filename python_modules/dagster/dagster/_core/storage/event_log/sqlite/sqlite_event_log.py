@@ -23,7 +23,10 @@
 from dagster._config import StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
-from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.event_api import EventHandlerFn, EventRecordsResult, RunStatusChangeRecordsFilter
 from dagster._core.events import (
     ASSET_CHECK_EVENTS,
@@ -52,8 +55,8 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..schema import RunStatsTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage, _group_events_by_run_id
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
@@ -117,9 +120,12 @@ def upgrade(self) -> None:
         all_run_ids = self.get_all_run_ids()
         print(f"Updating event log storage for {len(all_run_ids)} runs on disk...")  # noqa: T201
         alembic_config = get_alembic_config(__file__)
+        run_ids_without_run_stats = []
         if all_run_ids:
             for run_id in tqdm(all_run_ids):
                 with self.run_connection(run_id) as conn:
+                    if not db.inspect(conn).has_table(RunStatsTable.name):
+                        run_ids_without_run_stats.append(run_id)
                     run_alembic_upgrade(alembic_config, conn, run_id)
 
         print("Updating event log storage for index db on disk...")  # noqa: T201
@@ -127,6 +133,14 @@ def upgrade(self) -> None:
             run_alembic_upgrade(alembic_config, conn, "index")
 
         self._initialized_dbs = set()
+        self._run_stats_tables_cache.clear()
+
+        if run_ids_without_run_stats:
+            print(  # noqa: T201
+                f"Building run stats for {len(run_ids_without_run_stats)} runs on disk..."
+            )
+            for run_id in tqdm(run_ids_without_run_stats):
+                self.backfill_run_stats(run_id)
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -222,6 +236,15 @@ def _connect(self, shard: str) -> Iterator[Connection]:
                     yield conn
             engine.dispose()
 
+    def _has_run_stats_tables_for_run(self, run_id: str) -> bool:
+        # Run shards created before the run stats tables were added will not have them until the
+        # storage is upgraded, so we check each shard
+        def _check_shard() -> bool:
+            with self.run_connection(run_id) as conn:
+                return db.inspect(conn).has_table(RunStatsTable.name)
+
+        return self._check_run_stats_tables(run_id, _check_shard)
+
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
 
@@ -242,6 +265,8 @@ def store_event(self, event: EventLogEntry) -> None:
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
 
+        self.update_run_stats(run_id, [event])
+
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
                 event.dagster_event_type in ASSET_EVENTS,
@@ -273,6 +298,75 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in a single transaction, and
+        to mirror the asset and run status change events in the index shard.
+
+        Since the events of different runs are stored in different databases, the batch cannot be
+        stored atomically. If storing it fails after the events of some runs have been stored,
+        raises DagsterEventBatchPartiallyStoredError with the events that were not stored.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        events_by_run_id = list(_group_events_by_run_id(events).items())
+
+        def _unstored_events(from_index: int) -> Sequence[EventLogEntry]:
+            return [
+                event for _, run_events in events_by_run_id[from_index:] for event in run_events
+            ]
+
+        for i, (run_id, run_events) in enumerate(events_by_run_id):
+            try:
+                with self.run_connection(run_id) as conn:
+                    self._insert_event_rows(conn, run_events)
+            except Exception as e:
+                if i == 0:
+                    raise
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Failed to store the events of run {run_id}.",
+                    unstored_events=_unstored_events(i),
+                ) from e
+
+            # the events of this run have been stored, so they must not be stored again even if
+            # indexing them fails
+            try:
+                self._index_run_event_batch(run_id, run_events)
+            except Exception as e:
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Failed to index the events of run {run_id}.",
+                    unstored_events=_unstored_events(i + 1),
+                ) from e
+
+    def _index_run_event_batch(self, run_id: str, run_events: Sequence[EventLogEntry]) -> None:
+        self.update_run_stats(run_id, run_events)
+
+        index_events = []
+        for event in run_events:
+            if not event.is_dagster_event:
+                continue
+            if event.dagster_event.asset_key:  # type: ignore
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database",
+                )
+                index_events.append(event)
+            elif event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                index_events.append(event)
+
+        if index_events:
+            with self.index_connection() as conn:
+                event_ids = self._insert_event_batch(conn, index_events)
+
+            self._store_asset_event_batch(index_events, event_ids)
+
+        for event in run_events:
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, None)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
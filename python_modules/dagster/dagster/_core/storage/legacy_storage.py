@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -23,10 +24,15 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import PrintFn
-from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
+from dagster._utils.concurrency import (
+    ConcurrencyClaimStatus,
+    ConcurrencyKeyInfo,
+    ConcurrencyStepClaim,
+)
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
+    DEFAULT_RECORDS_CHUNK_SIZE,
     AssetRecord,
     EventLogConnection,
     EventLogRecord,
@@ -41,7 +47,11 @@
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_check_spec import AssetCheckKey
     from dagster._core.definitions.run_request import InstigatorType
-    from dagster._core.event_api import AssetRecordsFilter, RunStatusChangeRecordsFilter
+    from dagster._core.event_api import (
+        AssetRecordsFilter,
+        LazyEventLogRecord,
+        RunStatusChangeRecordsFilter,
+    )
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -198,6 +208,9 @@ def from_config_value(
     def add_run(self, dagster_run: "DagsterRun") -> "DagsterRun":
         return self._storage.run_storage.add_run(dagster_run)
 
+    def add_runs(self, dagster_runs: Sequence["DagsterRun"]) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.add_runs(dagster_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -557,6 +570,23 @@ def get_latest_tags_by_partition(
             asset_key, event_type, tag_keys, asset_partitions, before_cursor, after_cursor
         )
 
+    def get_latest_storage_id_by_partition_for_asset_keys(
+        self, asset_keys: Sequence["AssetKey"], event_type: "DagsterEventType"
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        return self._storage.event_log_storage.get_latest_storage_id_by_partition_for_asset_keys(
+            asset_keys, event_type
+        )
+
+    def get_latest_tags_by_partition_for_asset_keys(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        event_type: "DagsterEventType",
+        tag_keys: Sequence[str],
+    ) -> Mapping["AssetKey", Mapping[str, Mapping[str, str]]]:
+        return self._storage.event_log_storage.get_latest_tags_by_partition_for_asset_keys(
+            asset_keys, event_type, tag_keys
+        )
+
     def get_latest_asset_partition_materialization_attempts_without_materializations(
         self, asset_key: "AssetKey", after_storage_id: Optional[int] = None
     ) -> Mapping[str, Tuple[str, int]]:
@@ -619,6 +649,25 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        ascending: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._storage.event_log_storage.get_lazy_records_for_run(run_id, of_type, ascending)
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        ascending: bool = True,
+        chunk_size: int = DEFAULT_RECORDS_CHUNK_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        return self._storage.event_log_storage.iter_records_for_run(
+            run_id, of_type, ascending, chunk_size
+        )
+
     def initialize_concurrency_limit_to_default(self, concurrency_key: str) -> bool:
         return self._storage.event_log_storage.initialize_concurrency_limit_to_default(
             concurrency_key
@@ -643,6 +692,11 @@ def claim_concurrency_slot(
             concurrency_key, run_id, step_key, priority
         )
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        return self._storage.event_log_storage.claim_concurrency_slots(run_id, step_claims)
+
     def check_concurrency_claim(self, concurrency_key: str, run_id: str, step_key: str):
         return self._storage.event_log_storage.check_concurrency_claim(
             concurrency_key, run_id, step_key
@@ -657,6 +711,9 @@ def free_concurrency_slots_for_run(self, run_id: str) -> None:
     def free_concurrency_slot_for_step(self, run_id: str, step_key: str) -> None:
         return self._storage.event_log_storage.free_concurrency_slot_for_step(run_id, step_key)
 
+    def free_concurrency_slots_for_steps(self, run_id: str, step_keys: Sequence[str]) -> None:
+        return self._storage.event_log_storage.free_concurrency_slots_for_steps(run_id, step_keys)
+
     def get_asset_check_execution_history(
         self,
         check_key: "AssetCheckKey",
@@ -493,3 +493,57 @@ def drop_run_job_index() -> None:
             "runs",
             postgresql_concurrently=True,
         )
+
+
+def add_run_partition_index() -> None:
+    """Replaces the idx_run_partitions index on runs (partition_set, partition) with
+    idx_runs_by_partition on (partition_set, partition, id), which serves the same lookups and also
+    the latest run id for each partition.
+    """
+    if not has_table("runs"):
+        return
+
+    if not has_index("runs", "idx_runs_by_partition"):
+        op.create_index(
+            "idx_runs_by_partition",
+            "runs",
+            ["partition_set", "partition", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            mysql_length={
+                "partition_set": 64,
+                "partition": 64,
+            },
+        )
+
+    if has_index("runs", "idx_run_partitions"):
+        op.drop_index(
+            "idx_run_partitions",
+            "runs",
+            postgresql_concurrently=True,
+        )
+
+
+def drop_run_partition_index() -> None:
+    if not has_table("runs"):
+        return
+
+    if not has_index("runs", "idx_run_partitions"):
+        op.create_index(
+            "idx_run_partitions",
+            "runs",
+            ["partition_set", "partition"],
+            unique=False,
+            postgresql_concurrently=True,
+            mysql_length={
+                "partition_set": 64,
+                "partition": 64,
+            },
+        )
+
+    if has_index("runs", "idx_runs_by_partition"):
+        op.drop_index(
+            "idx_runs_by_partition",
+            "runs",
+            postgresql_concurrently=True,
+        )
@@ -1,3 +1,4 @@
+import json
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
 
@@ -18,6 +19,7 @@
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
+    StaticPartitionsSubset,
 )
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
 from dagster._core.instance import DynamicPartitionsStore
@@ -67,7 +69,12 @@ def is_cacheable_partition_type(partitions_def: PartitionsDefinition) -> bool:
     )
 
 
-@whitelist_for_serdes
+# Stored under a new name since static partitions subsets started being serialized as bitmaps,
+# which older versions can't deserialize. Older versions fail to deserialize cache values stored
+# under this name, and rebuild them from scratch instead.
+@whitelist_for_serdes(
+    storage_name="AssetStatusCacheValueV2", old_storage_names={"AssetStatusCacheValue"}
+)
 class AssetStatusCacheValue(
     NamedTuple(
         "_AssetPartitionsStatusCacheValue",
@@ -231,6 +238,22 @@ def _get_last_planned_storage_id(instance: DagsterInstance, asset_key: AssetKey)
     return info.storage_id
 
 
+def _is_stored_in_current_format(
+    partitions_def: PartitionsDefinition, serialized_subset: Optional[str]
+) -> bool:
+    """Subsets of static partitions that were cached before they were serialized as bitmaps store
+    the full list of partition keys, which are parsed every time the cache is read. They are
+    converted to the bitmap format the next time the cache is refreshed.
+    """
+    if serialized_subset is None or not isinstance(partitions_def, StaticPartitionsDefinition):
+        return True
+    data = json.loads(serialized_subset)
+    return (
+        isinstance(data, dict)
+        and data.get("version") == StaticPartitionsSubset.SERIALIZATION_VERSION
+    )
+
+
 def _build_status_cache(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -239,8 +262,8 @@ def _build_status_cache(
     stored_cache_value: Optional[AssetStatusCacheValue] = None,
     last_materialization_storage_id: Optional[int] = None,
 ) -> Optional[AssetStatusCacheValue]:
-    """This method refreshes the asset status cache for a given asset key. It recalculates
-    the materialized partition subset for the asset key and updates the cache value.
+    """This method refreshes the asset status cache for a given asset key. If a stored cache value
+    is provided, only the events stored after it was computed are applied to its subsets.
     """
     latest_storage_id = max(
         last_materialization_storage_id if last_materialization_storage_id else 0,
@@ -252,40 +275,26 @@ def _build_status_cache(
     if not partitions_def or not is_cacheable_partition_type(partitions_def):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
-    cached_failed_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
-        if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
-        else partitions_def.empty_subset()
-    )
-    cached_in_progress_cursor = (
-        (
-            stored_cache_value.earliest_in_progress_materialization_event_id - 1
-            if stored_cache_value.earliest_in_progress_materialization_event_id
-            else stored_cache_value.latest_storage_id
+    if (
+        stored_cache_value
+        and stored_cache_value.latest_storage_id == latest_storage_id
+        and stored_cache_value.earliest_in_progress_materialization_event_id is None
+        and _is_stored_in_current_format(
+            partitions_def, stored_cache_value.serialized_materialized_partition_subset
         )
-        if stored_cache_value
-        else None
+        and _is_stored_in_current_format(
+            partitions_def, stored_cache_value.serialized_failed_partition_subset
+        )
+    ):
+        # No materialization or planned events have been stored for the asset since the cached
+        # value was computed and no runs were in progress, so the cached subsets are still valid.
+        return stored_cache_value
+
+    partitions_def_id = partitions_def.get_serializable_unique_identifier(
+        dynamic_partitions_store=dynamic_partitions_store
     )
 
-    if stored_cache_value:
-        # fetch the incremental new materialized partitions, and update the cached materialized
-        # subset
-        materialized_subset: PartitionsSubset = (
-            partitions_def.deserialize_subset(
-                stored_cache_value.serialized_materialized_partition_subset
-            )
-            if stored_cache_value.serialized_materialized_partition_subset
-            else partitions_def.empty_subset()
-        ).with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(
-                    asset_key, after_cursor=stored_cache_value.latest_storage_id
-                ),
-            )
-        )
-    else:
+    if not stored_cache_value:
         materialized_subset = partitions_def.empty_subset().with_partition_keys(
             get_validated_partition_keys(
                 dynamic_partitions_store,
@@ -293,7 +302,53 @@ def _build_status_cache(
                 instance.get_materialized_partitions(asset_key),
             )
         )
+        failed_subset, in_progress_subset, earliest_in_progress_materialization_event_id = (
+            build_failed_and_in_progress_partition_subset(
+                instance, asset_key, partitions_def, dynamic_partitions_store
+            )
+        )
+        return AssetStatusCacheValue(
+            latest_storage_id=latest_storage_id,
+            partitions_def_id=partitions_def_id,
+            serialized_materialized_partition_subset=materialized_subset.serialize(),
+            serialized_failed_partition_subset=failed_subset.serialize(),
+            serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+            earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+        )
+
+    # Apply only the events stored since the cached value was computed. Cached subsets are only
+    # deserialized if they need to be updated, and are otherwise stored back as-is, so refreshing
+    # the cache of an asset with a large number of partitions does not require parsing and
+    # reserializing all of its subsets.
+    serialized_materialized_subset = stored_cache_value.serialized_materialized_partition_subset
+    new_materialized_partitions = get_validated_partition_keys(
+        dynamic_partitions_store,
+        partitions_def,
+        instance.get_materialized_partitions(
+            asset_key, after_cursor=stored_cache_value.latest_storage_id
+        ),
+    )
+    if (
+        new_materialized_partitions
+        or serialized_materialized_subset is None
+        or not _is_stored_in_current_format(partitions_def, serialized_materialized_subset)
+    ):
+        serialized_materialized_subset = (
+            stored_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+            .with_partition_keys(new_materialized_partitions)
+            .serialize()
+        )
 
+    cached_failed_subset = (
+        stored_cache_value.deserialize_failed_partition_subsets(partitions_def)
+        if stored_cache_value.serialized_failed_partition_subset
+        else None
+    )
+    cached_in_progress_cursor = (
+        stored_cache_value.earliest_in_progress_materialization_event_id - 1
+        if stored_cache_value.earliest_in_progress_materialization_event_id
+        else stored_cache_value.latest_storage_id
+    )
     (
         failed_subset,
         in_progress_subset,
@@ -309,11 +364,17 @@ def _build_status_cache(
 
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
-        partitions_def_id=partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
+        partitions_def_id=partitions_def_id,
+        serialized_materialized_partition_subset=serialized_materialized_subset,
+        serialized_failed_partition_subset=(
+            stored_cache_value.serialized_failed_partition_subset
+            if cached_failed_subset is not None
+            and failed_subset is cached_failed_subset
+            and _is_stored_in_current_format(
+                partitions_def, stored_cache_value.serialized_failed_partition_subset
+            )
+            else failed_subset.serialize()
         ),
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
     )
@@ -327,17 +388,27 @@ def build_failed_and_in_progress_partition_subset(
     failed_partitions_subset: Optional[PartitionsSubset] = None,
     after_storage_id: Optional[int] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    failed_partitions: Set[str] = (
-        set(failed_partitions_subset.get_partition_keys()) if failed_partitions_subset else set()
+    failed_subset = (
+        failed_partitions_subset
+        if failed_partitions_subset is not None
+        else partitions_def.empty_subset()
     )
+    failed_partitions: Set[str] = set()
     in_progress_partitions: Set[str] = set()
-    if failed_partitions:
+    if len(failed_subset) > 0:
         # These partitions were cached as having been failed.  If they have since been materialized,
         # then we can remove them from the set of failed partitions.
-        materialized_partitions = instance.event_log_storage.get_materialized_partitions(
-            asset_key, after_cursor=after_storage_id
+        materialized_partitions = get_validated_partition_keys(
+            dynamic_partitions_store,
+            partitions_def,
+            instance.event_log_storage.get_materialized_partitions(
+                asset_key, after_cursor=after_storage_id
+            ),
         )
-        failed_partitions.difference_update(materialized_partitions)
+        if materialized_partitions:
+            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
+                materialized_partitions
+            )
 
     incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
         asset_key, after_storage_id=after_storage_id
@@ -368,15 +439,24 @@ def build_failed_and_in_progress_partition_subset(
                 if cursor is None or event_id < cursor:
                     cursor = event_id
 
+    # Only newly failed partitions are validated and added, so the cached failed subset is not
+    # expanded into its partition keys.
+    new_failed_partitions = (
+        {
+            partition_key
+            for partition_key in get_validated_partition_keys(
+                dynamic_partitions_store, partitions_def, failed_partitions
+            )
+            if partition_key not in failed_subset
+        }
+        if failed_partitions
+        else set()
+    )
     return (
         (
-            partitions_def.empty_subset().with_partition_keys(
-                get_validated_partition_keys(
-                    dynamic_partitions_store, partitions_def, failed_partitions
-                )
-            )
-            if failed_partitions
-            else partitions_def.empty_subset()
+            failed_subset.with_partition_keys(new_failed_partitions)
+            if new_failed_partitions
+            else failed_subset
         ),
         (
             partitions_def.empty_subset().with_partition_keys(
@@ -53,6 +53,18 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             dagster_run (DagsterRun): The run to add.
         """
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        """Add several runs to storage. Storages that can insert many runs at once should override
+        this method.
+
+        If a run already exists with the same ID, raise DagsterRunAlreadyExists
+        If a run's snapshot ID does not exist raise DagsterSnapshotDoesNotExist
+
+        Args:
+            dagster_runs (Sequence[DagsterRun]): The runs to add.
+        """
+        return [self.add_run(dagster_run) for dagster_run in dagster_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         """Update run storage in accordance to a pipeline run related DagsterEvent.
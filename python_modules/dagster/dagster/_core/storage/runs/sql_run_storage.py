@@ -3,14 +3,17 @@
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (
     Any,
     Callable,
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -49,6 +52,7 @@
 )
 from dagster._core.storage.sql import SqlAlchemyQuery
 from dagster._core.storage.sqlalchemy_compat import (
+    IS_SQLALCHEMY_VERSION_1,
     db_fetch_mappings,
     db_scalar_subquery,
     db_select,
@@ -68,6 +72,7 @@
 )
 from dagster._seven import JSONDecodeError
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
+from dagster._utils.lru_cache import LRUCache
 from dagster._utils.merger import merge_dicts
 
 from ..dagster_run import (
@@ -97,6 +102,12 @@
     SnapshotsTable,
 )
 
+# Bounds on the in-memory cache of deserialized snapshots. The weight bound applies to the total
+# size of the compressed snapshot bodies; deserialized snapshots take up roughly 10-50x as much
+# memory as their compressed bodies.
+SNAPSHOT_CACHE_MAX_SIZE = 256
+SNAPSHOT_CACHE_MAX_WEIGHT = 2 * 1024 * 1024
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -110,6 +121,16 @@ class SqlRunStorage(RunStorage):
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
 
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """Context manager yielding a connection that has begun a transaction."""
+        with self.connect() as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                with conn.begin():
+                    yield conn
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema or data migrations necessary to bring an
@@ -166,6 +187,54 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
 
         return dagster_run
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        check.sequence_param(dagster_runs, "dagster_runs", of_type=DagsterRun)
+        if not dagster_runs:
+            return []
+
+        for job_snapshot_id in {
+            dagster_run.job_snapshot_id
+            for dagster_run in dagster_runs
+            if dagster_run.job_snapshot_id
+        }:
+            if not self.has_job_snapshot(job_snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    f"Snapshot {job_snapshot_id} does not exist in run storage"
+                )
+
+        run_rows = []
+        tag_rows = []
+        for dagster_run in dagster_runs:
+            has_tags = dagster_run.tags and len(dagster_run.tags) > 0
+            run_rows.append(
+                dict(
+                    run_id=dagster_run.run_id,
+                    pipeline_name=dagster_run.job_name,
+                    status=dagster_run.status.value,
+                    run_body=serialize_value(dagster_run),
+                    snapshot_id=dagster_run.job_snapshot_id,
+                    partition=dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None,
+                    partition_set=dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None,
+                )
+            )
+            tag_rows.extend(
+                dict(run_id=dagster_run.run_id, key=k, value=v)
+                for k, v in dagster_run.tags_for_storage().items()
+            )
+
+        # insert the runs and their tags atomically, so that a failure never leaves runs without
+        # their tags
+        with self.transaction() as conn:
+            try:
+                conn.execute(RunsTable.insert(), run_rows)
+            except db_exc.IntegrityError as exc:
+                raise DagsterRunAlreadyExists from exc
+
+            if tag_rows:
+                conn.execute(RunTagsTable.insert(), tag_rows)
+
+        return dagster_runs
+
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         from dagster._core.events import JobFailureData
 
@@ -564,6 +633,10 @@ def delete_run(self, run_id: str) -> None:
 
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
+        # snapshots are immutable once stored, so a cached snapshot is known to exist. Misses are
+        # not cached, since the snapshot may be added by another process at any time.
+        if job_snapshot_id in self.snapshot_cache:
+            return True
         return self._has_snapshot_id(job_snapshot_id)
 
     def add_job_snapshot(self, job_snapshot: JobSnapshot, snapshot_id: Optional[str] = None) -> str:
@@ -645,61 +718,150 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
 
         return bool(row)
 
+    @cached_property
+    def snapshot_cache(self) -> LRUCache[str, Union[JobSnapshot, ExecutionPlanSnapshot]]:
+        """In-memory cache of deserialized job and execution plan snapshots, keyed by snapshot id.
+        Entries are weighted by the size of their compressed snapshot body, to bound the memory
+        held by large snapshots.
+        """
+        return LRUCache(max_size=SNAPSHOT_CACHE_MAX_SIZE, max_weight=SNAPSHOT_CACHE_MAX_WEIGHT)
+
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnapshot]:
+        cached_snapshot = self.snapshot_cache.get(snapshot_id)
+        if cached_snapshot is not None:
+            return cached_snapshot  # type: ignore
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
-            if row
-            else None
-        )
+        snapshot = defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])
+        if snapshot is not None:
+            self.snapshot_cache.set(snapshot_id, snapshot, weight=len(row["snapshot_body"]))
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
+        """Returns the data of the most recent run matching the filter for each partition. The
+        latest run per partition is selected in the database, so only one row per partition is
+        returned, regardless of how many times each partition has been run.
+        """
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
-            query = self._runs_query(
-                filters=runs_filter,
-                columns=["run_id", "status", "start_time", "end_time", "partition"],
-            )
-            rows = self.fetchall(query)
+            query = self._latest_run_per_partition_query(runs_filter)
+            with self.connect() as conn:
+                return [
+                    RunPartitionData(
+                        run_id=row["run_id"],
+                        partition=row["partition"],
+                        status=DagsterRunStatus[row["status"]],
+                        start_time=row["start_time"],
+                        end_time=row["end_time"],
+                    )
+                    for row in self._stream_mappings(conn, query)
+                ]
+        else:
+            # the partition columns have not been backfilled, so read partitions from run tags
+            query = self._latest_run_per_partition_tag_query(runs_filter)
+            with self.connect() as conn:
+                return [
+                    RunPartitionData(
+                        run_id=row["run_id"],
+                        partition=row["partition"],
+                        status=DagsterRunStatus[row["status"]],
+                        start_time=None,
+                        end_time=None,
+                    )
+                    for row in self._stream_mappings(conn, query)
+                ]
+
+    def _latest_run_per_partition_query(self, runs_filter: RunsFilter) -> SqlAlchemyQuery:
+        # filter on the partition_set column rather than on run tags when possible, so that the
+        # lookup can be served by the partition index
+        tags = dict(runs_filter.tags)
+        partition_set = tags.pop(PARTITION_SET_TAG, None)
+
+        latest_ids_query = (
+            db_select([db.func.max(RunsTable.c.id)])
+            .select_from(RunsTable)
+            .where(RunsTable.c.partition.isnot(None))
+            .where(RunsTable.c.partition != "")
+        )
+        if isinstance(partition_set, str):
+            latest_ids_query = latest_ids_query.where(RunsTable.c.partition_set == partition_set)
+        elif partition_set is not None:
+            latest_ids_query = latest_ids_query.where(RunsTable.c.partition_set.in_(partition_set))
+        latest_ids_query = self._add_filters_to_query(
+            latest_ids_query, runs_filter._replace(tags=tags)
+        ).group_by(RunsTable.c.partition)
 
-            # dedup by partition
-            _partition_data_by_partition = {}
-            for row in rows:
-                if not row["partition"] or row["partition"] in _partition_data_by_partition:
-                    continue
+        return (
+            db_select(
+                [
+                    RunsTable.c.run_id,
+                    RunsTable.c.status,
+                    RunsTable.c.start_time,
+                    RunsTable.c.end_time,
+                    RunsTable.c.partition,
+                ]
+            )
+            .where(RunsTable.c.id.in_(latest_ids_query))
+            .order_by(RunsTable.c.id.desc())
+        )
 
-                _partition_data_by_partition[row["partition"]] = RunPartitionData(
-                    run_id=row["run_id"],
-                    partition=row["partition"],
-                    status=DagsterRunStatus[row["status"]],
-                    start_time=row["start_time"],
-                    end_time=row["end_time"],
-                )
+    def _latest_run_per_partition_tag_query(self, runs_filter: RunsFilter) -> SqlAlchemyQuery:
+        # aliased so that the run tag filters applied to the runs table are not correlated with it
+        partition_tags = RunTagsTable.alias("partition_tags")
+        runs_with_partition_tags = RunsTable.join(
+            partition_tags,
+            (RunsTable.c.run_id == partition_tags.c.run_id)
+            & (partition_tags.c.key == PARTITION_NAME_TAG),
+        )
 
-            return list(_partition_data_by_partition.values())
-        else:
-            query = self._runs_query(filters=runs_filter)
-            rows = self.fetchall(query)
-            _partition_data_by_partition = {}
-            for row in rows:
-                run = self._row_to_run(row)
-                partition = run.tags.get(PARTITION_NAME_TAG)
-                if not partition or partition in _partition_data_by_partition:
-                    continue
+        latest_ids_query = (
+            db_select([db.func.max(RunsTable.c.id)])
+            .select_from(runs_with_partition_tags)
+            .where(partition_tags.c.value.isnot(None))
+            .where(partition_tags.c.value != "")
+        )
+        latest_ids_query = self._add_filters_to_query(latest_ids_query, runs_filter).group_by(
+            partition_tags.c.value
+        )
 
-                _partition_data_by_partition[partition] = RunPartitionData(
-                    run_id=run.run_id,
-                    partition=partition,
-                    status=run.status,
-                    start_time=None,
-                    end_time=None,
-                )
+        return (
+            db_select(
+                [
+                    RunsTable.c.run_id,
+                    RunsTable.c.status,
+                    partition_tags.c.value.label("partition"),
+                ]
+            )
+            .select_from(runs_with_partition_tags)
+            .where(RunsTable.c.id.in_(latest_ids_query))
+            .order_by(RunsTable.c.id.desc())
+        )
 
-            return list(_partition_data_by_partition.values())
+    def _stream_mappings(
+        self, conn: Connection, query: SqlAlchemyQuery, chunk_size: int = 1000
+    ) -> Iterator[Any]:
+        """Yields the rows of a query as mappings, fetching `chunk_size` rows at a time rather than
+        loading the full result into memory.
+        """
+        result = conn.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(
+            query
+        )
+        if not IS_SQLALCHEMY_VERSION_1:
+            result = result.mappings()
+        try:
+            while True:
+                rows = result.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            result.close()
 
     def _get_partition_runs(
         self, partition_set_name: str, partition_name: str
@@ -832,6 +994,7 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+        self.snapshot_cache.clear()
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
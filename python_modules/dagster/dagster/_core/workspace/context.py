@@ -592,6 +592,16 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
         location_name = origin.location_name
         location = None
         error = None
+
+        # reuse the job data that the current copy of the location has loaded for any jobs that
+        # have not changed. If it has not loaded any, there is nothing to reuse.
+        previous_entry = self._location_entry_dict.get(location_name)
+        job_data_by_snapshot_id = (
+            previous_entry.code_location.get_loaded_job_data_by_snapshot_id() or None
+            if previous_entry and isinstance(previous_entry.code_location, GrpcServerCodeLocation)
+            else None
+        )
+
         try:
             if isinstance(origin, ManagedGrpcPythonEnvCodeLocationOrigin):
                 endpoint = (
@@ -609,6 +619,17 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
                     watch_server=False,
                     grpc_server_registry=self._grpc_server_registry,
                     instance=self._instance,
+                    job_data_by_snapshot_id=job_data_by_snapshot_id,
+                )
+            elif isinstance(origin, GrpcServerCodeLocationOrigin):
+                location = (
+                    origin.reload_location(
+                        self.instance, job_data_by_snapshot_id=job_data_by_snapshot_id
+                    )
+                    if reload
+                    else origin.create_location(
+                        self.instance, job_data_by_snapshot_id=job_data_by_snapshot_id
+                    )
                 )
             else:
                 location = (
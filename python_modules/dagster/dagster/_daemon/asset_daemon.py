@@ -36,7 +36,10 @@
     DagsterCodeLocationLoadError,
     DagsterUserCodeUnreachableError,
 )
-from dagster._core.execution.submit_asset_runs import submit_asset_run
+from dagster._core.execution.submit_asset_runs import (
+    prefetch_job_execution_data,
+    submit_asset_run,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._core.remote_representation import (
     ExternalSensor,
@@ -68,6 +71,7 @@
 from dagster._utils import (
     SingleInstigatorDebugCrashFlags,
     check_for_debug_crash,
+    traced_counter_scope,
 )
 
 _LEGACY_PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR"
@@ -89,6 +93,9 @@
 
 MIN_INTERVAL_LOOP_SECONDS = 5
 
+# How many of the slowest asset evaluations to log at the end of each tick
+NUM_SLOWEST_ASSET_EVALUATIONS_TO_LOG = 5
+
 
 def get_has_migrated_to_sensors(instance: DagsterInstance) -> bool:
     return bool(
@@ -332,6 +339,37 @@ def __init__(self, settings: Mapping[str, Any], pre_sensor_interval_seconds: int
     def daemon_type(cls) -> str:
         return "ASSET"
 
+    def _log_slowest_asset_evaluations(
+        self, evaluation_duration_by_asset_key: Mapping[AssetKey, float]
+    ) -> None:
+        slowest = sorted(
+            evaluation_duration_by_asset_key.items(), key=lambda item: item[1], reverse=True
+        )[:NUM_SLOWEST_ASSET_EVALUATIONS_TO_LOG]
+        if not slowest:
+            return
+
+        self._logger.info(
+            "Slowest asset evaluations: "
+            + ", ".join(
+                f"{asset_key.to_user_string()} ({format(duration, '.3f')} seconds)"
+                for asset_key, duration in slowest
+            )
+        )
+
+    def _log_instance_query_counts(self, query_counts: Mapping[str, int]) -> None:
+        if not query_counts:
+            return
+
+        self._logger.info(
+            f"Made {sum(query_counts.values())} instance queries: "
+            + ", ".join(
+                f"{method_name} ({count})"
+                for method_name, count in sorted(
+                    query_counts.items(), key=lambda item: item[1], reverse=True
+                )
+            )
+        )
+
     def _get_print_sensor_name(self, sensor: Optional[ExternalSensor]) -> str:
         if not sensor:
             return ""
@@ -872,24 +910,39 @@ def _evaluate_auto_materialize_tick(
         else:
             sensor_tags = {SENSOR_NAME_TAG: sensor.name, **sensor.run_tags} if sensor else {}
 
-            run_requests, new_cursor, evaluations = AssetDaemonContext(
-                evaluation_id=evaluation_id,
-                asset_graph=asset_graph,
-                auto_materialize_asset_keys=auto_materialize_asset_keys,
-                instance=instance,
-                cursor=stored_cursor,
-                materialize_run_tags={
-                    **instance.auto_materialize_run_tags,
-                    **DagsterRun.tags_for_tick_id(
-                        str(tick.tick_id),
-                    ),
-                    **sensor_tags,
-                },
-                observe_run_tags={AUTO_OBSERVE_TAG: "true", **sensor_tags},
-                auto_observe_asset_keys=auto_observe_asset_keys,
-                respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
-                logger=self._logger,
-            ).evaluate()
+            # the context prefetches asset data when constructed, so its queries are counted too
+            with traced_counter_scope() as query_counter:
+                asset_daemon_context = AssetDaemonContext(
+                    evaluation_id=evaluation_id,
+                    asset_graph=asset_graph,
+                    auto_materialize_asset_keys=auto_materialize_asset_keys,
+                    instance=instance,
+                    cursor=stored_cursor,
+                    materialize_run_tags={
+                        **instance.auto_materialize_run_tags,
+                        **DagsterRun.tags_for_tick_id(
+                            str(tick.tick_id),
+                        ),
+                        **sensor_tags,
+                    },
+                    observe_run_tags={AUTO_OBSERVE_TAG: "true", **sensor_tags},
+                    auto_observe_asset_keys=auto_observe_asset_keys,
+                    respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
+                    logger=self._logger,
+                    max_evaluation_workers=instance.auto_materialize_num_evaluation_workers,
+                )
+                run_requests, new_cursor, evaluations = asset_daemon_context.evaluate()
+                self._log_slowest_asset_evaluations(
+                    asset_daemon_context.evaluation_duration_by_asset_key
+                )
+                self._log_instance_query_counts(query_counter.counts())
+            partition_mapping_resolver = (
+                asset_daemon_context.instance_queryer.partition_mapping_resolver
+            )
+            self._logger.debug(
+                f"Partition mapping cache: {partition_mapping_resolver.num_hits} hits,"
+                f" {partition_mapping_resolver.num_misses} misses"
+            )
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
 
@@ -954,6 +1007,14 @@ def _evaluate_auto_materialize_tick(
         updated_evaluation_asset_keys = set()
 
         run_request_execution_data_cache = {}
+        prefetch_job_execution_data(
+            run_requests,
+            instance,
+            workspace_process_context,
+            asset_graph,
+            run_request_execution_data_cache,
+            self._logger,
+        )
         for i, (run_request, reserved_run_id) in enumerate(zip(run_requests, reserved_run_ids)):
             submitted_run = submit_asset_run(
                 run_id=reserved_run_id,
@@ -1,3 +1,5 @@
+import heapq
+import itertools
 import logging
 import sys
 import threading
@@ -13,6 +15,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -68,6 +71,10 @@
 
 MIN_INTERVAL_LOOP_TIME = 5
 
+# how often the sensor daemon reloads the states of all sensors and checks the workspace for
+# sensors that have been started or stopped, when the workspace has not changed
+SENSOR_STATE_REFRESH_INTERVAL_SECONDS = 30
+
 FINISHED_TICK_STATES = [TickStatus.SKIPPED, TickStatus.SUCCESS, TickStatus.FAILURE]
 
 
@@ -242,6 +249,143 @@ def __exit__(
             )
 
 
+class SensorTickScheduler:
+    """Tracks the next time that each running sensor is due to be evaluated, so that each iteration
+    of the sensor daemon only processes the sensors that are due rather than checking the minimum
+    interval of every sensor. Due sensors are returned interleaved across code locations, so that a
+    code location with many sensors does not delay the ticks of sensors in other code locations.
+    Also tracks the lag of each tick relative to the time that it was due.
+
+    The running sensors are kept between iterations, so that the states of all sensors only need
+    to be reloaded and the workspace only needs to be walked when the workspace has changed, or
+    every SENSOR_STATE_REFRESH_INTERVAL_SECONDS to pick up sensors that have been started or
+    stopped.
+    """
+
+    def __init__(self):
+        self._due_heap: List[Tuple[float, str]] = []
+        self._due_timestamp_by_selector_id: Dict[str, float] = {}
+        self._min_interval_by_selector_id: Dict[str, Optional[int]] = {}
+        self._last_tick_lag_by_selector_id: Dict[str, float] = {}
+        self._sensors: Dict[str, ExternalSensor] = {}
+        self._location_name_by_selector_id: Dict[str, str] = {}
+        self._update_timestamp_by_location_name: Optional[Mapping[str, float]] = None
+        self._last_refresh_timestamp: Optional[float] = None
+
+    @property
+    def sensors(self) -> Mapping[str, ExternalSensor]:
+        """The running sensors as of the last refresh, keyed by selector id."""
+        return self._sensors
+
+    @property
+    def location_name_by_selector_id(self) -> Mapping[str, str]:
+        """The code location names of the running sensors as of the last refresh."""
+        return self._location_name_by_selector_id
+
+    def needs_refresh(
+        self, now_timestamp: float, update_timestamp_by_location_name: Mapping[str, float]
+    ) -> bool:
+        """Whether the running sensors should be reloaded from the workspace and the instance,
+        because the workspace has changed or the last refresh is too old.
+        """
+        return (
+            self._last_refresh_timestamp is None
+            or now_timestamp - self._last_refresh_timestamp >= SENSOR_STATE_REFRESH_INTERVAL_SECONDS
+            or update_timestamp_by_location_name != self._update_timestamp_by_location_name
+        )
+
+    def refresh(
+        self,
+        now_timestamp: float,
+        update_timestamp_by_location_name: Mapping[str, float],
+        sensors: Mapping[str, ExternalSensor],
+        sensor_states: Mapping[str, InstigatorState],
+    ) -> None:
+        self._last_refresh_timestamp = now_timestamp
+        self._update_timestamp_by_location_name = dict(update_timestamp_by_location_name)
+        self._sensors = dict(sensors)
+        self._location_name_by_selector_id = {
+            selector_id: external_sensor.handle.location_name
+            for selector_id, external_sensor in sensors.items()
+        }
+        self.update_sensors(sensors, sensor_states)
+
+    @property
+    def last_tick_lag_by_selector_id(self) -> Mapping[str, float]:
+        """The number of seconds between when each sensor was last due and when it was last
+        returned as due.
+        """
+        return self._last_tick_lag_by_selector_id
+
+    def schedule(self, selector_id: str, due_timestamp: float) -> None:
+        self._due_timestamp_by_selector_id[selector_id] = due_timestamp
+        heapq.heappush(self._due_heap, (due_timestamp, selector_id))
+
+    def update_sensors(
+        self,
+        sensors: Mapping[str, ExternalSensor],
+        sensor_states: Mapping[str, InstigatorState],
+    ) -> None:
+        """Starts tracking newly running sensors and stops tracking sensors that are no longer
+        running. Sensors whose minimum interval has changed are rescheduled.
+        """
+        for selector_id in list(self._min_interval_by_selector_id.keys()):
+            if selector_id not in sensors:
+                del self._min_interval_by_selector_id[selector_id]
+                self._due_timestamp_by_selector_id.pop(selector_id, None)
+                self._last_tick_lag_by_selector_id.pop(selector_id, None)
+
+        for selector_id, external_sensor in sensors.items():
+            if (
+                selector_id in self._due_timestamp_by_selector_id
+                and self._min_interval_by_selector_id[selector_id]
+                == external_sensor.min_interval_seconds
+            ):
+                continue
+            self._min_interval_by_selector_id[selector_id] = external_sensor.min_interval_seconds
+            sensor_state = sensor_states.get(selector_id)
+            self.schedule(
+                selector_id,
+                get_next_tick_due_timestamp(sensor_state, external_sensor) if sensor_state else 0.0,
+            )
+
+        # drop stale heap entries if they make up most of the heap
+        if len(self._due_heap) > 2 * len(self._due_timestamp_by_selector_id) + 1:
+            self._due_heap = [
+                (due_timestamp, selector_id)
+                for selector_id, due_timestamp in self._due_timestamp_by_selector_id.items()
+            ]
+            heapq.heapify(self._due_heap)
+
+    def pop_due_selector_ids(
+        self, now_timestamp: float, location_name_by_selector_id: Mapping[str, str]
+    ) -> Sequence[str]:
+        """Returns the selector ids of the sensors that are due at the given time, interleaved
+        across code locations. The returned sensors must be rescheduled to be returned again.
+        """
+        due_selector_ids_by_location_name: Dict[str, List[str]] = defaultdict(list)
+        while self._due_heap and self._due_heap[0][0] <= now_timestamp:
+            due_timestamp, selector_id = heapq.heappop(self._due_heap)
+            # skip entries for sensors that have since been rescheduled or removed
+            if self._due_timestamp_by_selector_id.get(selector_id) != due_timestamp:
+                continue
+            del self._due_timestamp_by_selector_id[selector_id]
+            # sensors that have never ticked are due immediately and have no lag
+            self._last_tick_lag_by_selector_id[selector_id] = (
+                max(0.0, now_timestamp - due_timestamp) if due_timestamp else 0.0
+            )
+            due_selector_ids_by_location_name[location_name_by_selector_id[selector_id]].append(
+                selector_id
+            )
+
+        return [
+            selector_id
+            for selector_ids in itertools.zip_longest(*due_selector_ids_by_location_name.values())
+            for selector_id in selector_ids
+            if selector_id is not None
+        ]
+
+
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -258,6 +402,7 @@ def execute_sensor_iteration_loop(
     from dagster._daemon.daemon import SpanMarker
 
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_tick_scheduler = SensorTickScheduler()
     while True:
         start_time = pendulum.now("UTC").timestamp()
         if until and start_time >= until:
@@ -271,6 +416,7 @@ def execute_sensor_iteration_loop(
             threadpool_executor=threadpool_executor,
             submit_threadpool_executor=submit_threadpool_executor,
             sensor_tick_futures=sensor_tick_futures,
+            sensor_tick_scheduler=sensor_tick_scheduler,
         )
         # Yield to check for heartbeats in case there were no yields within
         # execute_sensor_iteration
@@ -292,6 +438,7 @@ def execute_sensor_iteration(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_tick_futures: Optional[Dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    sensor_tick_scheduler: Optional[SensorTickScheduler] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -301,41 +448,88 @@ def execute_sensor_iteration(
         .get_workspace_snapshot()
         .values()
     }
-
-    all_sensor_states = {
-        sensor_state.selector_id: sensor_state
-        for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
-        if (
-            not sensor_state.instigator_data
-            or sensor_state.instigator_data.sensor_type != SensorType.AUTO_MATERIALIZE  # type: ignore
-        )
+    update_timestamp_by_location_name = {
+        location_name: location_entry.update_timestamp
+        for location_name, location_entry in workspace_snapshot.items()
     }
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
 
-    sensors: Dict[str, ExternalSensor] = {}
-    for location_entry in workspace_snapshot.values():
-        code_location = location_entry.code_location
-        if code_location:
-            for repo in code_location.get_repositories().values():
-                for sensor in repo.get_external_sensors():
-                    if sensor.sensor_type == SensorType.AUTO_MATERIALIZE:
-                        continue
-
-                    selector_id = sensor.selector_id
-                    if sensor.get_current_instigator_state(
-                        all_sensor_states.get(selector_id)
-                    ).is_running:
-                        sensors[selector_id] = sensor
+    # Between refreshes, the running sensors are reused from the tick scheduler and only the
+    # states of the sensors that are due are loaded.
+    all_sensor_states: Optional[Mapping[str, InstigatorState]] = None
+    sensors: Mapping[str, ExternalSensor]
+    now_timestamp = pendulum.now("UTC").timestamp()
+    if sensor_tick_scheduler is None or sensor_tick_scheduler.needs_refresh(
+        now_timestamp, update_timestamp_by_location_name
+    ):
+        all_sensor_states = {
+            sensor_state.selector_id: sensor_state
+            for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
+            if (
+                not sensor_state.instigator_data
+                or sensor_state.instigator_data.sensor_type != SensorType.AUTO_MATERIALIZE  # type: ignore
+            )
+        }
+
+        running_sensors: Dict[str, ExternalSensor] = {}
+        for location_entry in workspace_snapshot.values():
+            code_location = location_entry.code_location
+            if code_location:
+                for repo in code_location.get_repositories().values():
+                    for sensor in repo.get_external_sensors():
+                        if sensor.sensor_type == SensorType.AUTO_MATERIALIZE:
+                            continue
+
+                        selector_id = sensor.selector_id
+                        if sensor.get_current_instigator_state(
+                            all_sensor_states.get(selector_id)
+                        ).is_running:
+                            running_sensors[selector_id] = sensor
+        sensors = running_sensors
+
+        if sensor_tick_scheduler is not None:
+            sensor_tick_scheduler.refresh(
+                now_timestamp, update_timestamp_by_location_name, sensors, all_sensor_states
+            )
+    else:
+        sensors = sensor_tick_scheduler.sensors
 
     if not sensors:
         yield
         return
 
-    for external_sensor in sensors.values():
+    if sensor_tick_scheduler is None:
+        sensors_to_evaluate = list(sensors.values())
+    else:
+        due_selector_ids = sensor_tick_scheduler.pop_due_selector_ids(
+            now_timestamp, sensor_tick_scheduler.location_name_by_selector_id
+        )
+        sensors_to_evaluate = [sensors[selector_id] for selector_id in due_selector_ids]
+        if due_selector_ids:
+            tick_lags = [
+                sensor_tick_scheduler.last_tick_lag_by_selector_id[selector_id]
+                for selector_id in due_selector_ids
+            ]
+            logger.debug(
+                f"{len(due_selector_ids)} of {len(sensors)} sensors are due. Tick lag relative to"
+                f" minimum interval: max {max(tick_lags):.3f} seconds, mean"
+                f" {sum(tick_lags) / len(tick_lags):.3f} seconds."
+            )
+
+    for external_sensor in sensors_to_evaluate:
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        sensor_state = all_sensor_states.get(external_sensor.selector_id)
+        if all_sensor_states is not None:
+            sensor_state = all_sensor_states.get(external_sensor.selector_id)
+        else:
+            sensor_state = instance.get_instigator_state(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            if not external_sensor.get_current_instigator_state(sensor_state).is_running:
+                # the sensor was stopped since the last refresh, which stops tracking it
+                continue
+
         if not sensor_state:
             assert external_sensor.default_status == DefaultSensorStatus.RUNNING
             sensor_state = InstigatorState(
@@ -350,8 +544,21 @@ def execute_sensor_iteration(
             )
             instance.add_instigator_state(sensor_state)
         elif is_under_min_interval(sensor_state, external_sensor):
+            if sensor_tick_scheduler is not None:
+                sensor_tick_scheduler.schedule(
+                    external_sensor.selector_id,
+                    get_next_tick_due_timestamp(sensor_state, external_sensor),
+                )
             continue
 
+        if sensor_tick_scheduler is not None:
+            # the tick start timestamp is set when the tick is evaluated, so the next tick is due
+            # one minimum interval from now
+            sensor_tick_scheduler.schedule(
+                external_sensor.selector_id,
+                pendulum.now("UTC").timestamp() + (external_sensor.min_interval_seconds or 0),
+            )
+
         if threadpool_executor:
             if sensor_tick_futures is None:
                 check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
@@ -361,6 +568,11 @@ def execute_sensor_iteration(
                 external_sensor.selector_id in sensor_tick_futures
                 and not sensor_tick_futures[external_sensor.selector_id].done()
             ):
+                if sensor_tick_scheduler is not None:
+                    # check again on the next iteration
+                    sensor_tick_scheduler.schedule(
+                        external_sensor.selector_id, pendulum.now("UTC").timestamp()
+                    )
                 continue
 
             future = threadpool_executor.submit(
@@ -868,22 +1080,31 @@ def submit_run_request(run_request) -> SubmitRunRequestResult:
     yield
 
 
-def is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+def get_next_tick_due_timestamp(state: InstigatorState, external_sensor: ExternalSensor) -> float:
+    """Returns the timestamp at which the given sensor is next due to be evaluated, i.e. the
+    earliest time at which it is no longer under its minimum interval.
+    """
     instigator_data = _sensor_instigator_data(state)
     if not instigator_data:
-        return False
+        return 0.0
 
     if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
-        return False
+        return 0.0
 
     if not external_sensor.min_interval_seconds:
-        return False
+        return 0.0
 
-    elapsed = pendulum.now("UTC").timestamp() - max(
-        instigator_data.last_tick_timestamp or 0,
-        instigator_data.last_tick_start_timestamp or 0,
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + external_sensor.min_interval_seconds
     )
-    return elapsed < external_sensor.min_interval_seconds
+
+
+def is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+    return pendulum.now("UTC").timestamp() < get_next_tick_due_timestamp(state, external_sensor)
 
 
 def _fetch_existing_runs(
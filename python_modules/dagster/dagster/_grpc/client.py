@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from contextlib import contextmanager
 from threading import Event
 from typing import Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
@@ -18,6 +19,7 @@
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._serdes import serialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.lru_cache import LRUCache
 
 from .__generated__ import DagsterApiStub, api_pb2
 from .server import GrpcServerProcess
@@ -34,6 +36,7 @@
     SensorExecutionArgs,
 )
 from .utils import (
+    default_grpc_compression,
     default_grpc_timeout,
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
@@ -49,6 +52,41 @@
 DEFAULT_SENSOR_GRPC_TIMEOUT = default_sensor_grpc_timeout()
 DEFAULT_REPOSITORY_GRPC_TIMEOUT = default_repository_grpc_timeout()
 
+# Send keepalive pings on open connections no more often than servers allow by default, so that
+# connections to servers that have gone away are detected without being rejected for pinging
+GRPC_KEEPALIVE_TIME_MS = 5 * 60 * 1000
+GRPC_KEEPALIVE_TIMEOUT_MS = 20 * 1000
+
+GRPC_CHANNEL_POOL_SIZE = 64
+
+
+class _PooledChannel:
+    """A channel in the channel pool, along with the number of calls that are using it. Channels
+    that are removed from the pool are closed once the last call using them has finished.
+    """
+
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.num_active_calls = 0
+        self.is_removed = False
+
+
+def _close_evicted_channel(pool_key: Tuple, pooled_channel: _PooledChannel) -> None:
+    # The pool is only written to while _channel_pool_lock is held, so this is called with it held.
+    # Channels created before a fork belong to the parent process, which may still be using them.
+    pooled_channel.is_removed = True
+    if pool_key[0] == os.getpid() and pooled_channel.num_active_calls == 0:
+        pooled_channel.channel.close()
+
+
+# Channels are thread-safe and multiplex calls over a single connection, so clients for the same
+# server share a channel rather than connecting to the server for each call. Channels that are
+# evicted from the pool are closed once any calls still using them have finished.
+_channel_pool: LRUCache[Tuple, _PooledChannel] = LRUCache(
+    GRPC_CHANNEL_POOL_SIZE, on_evict=_close_evicted_channel
+)
+_channel_pool_lock = threading.Lock()
+
 
 def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event) -> None:
     while True:
@@ -70,6 +108,7 @@ def __init__(
         host: str = "localhost",
         use_ssl: bool = False,
         metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        compression: Optional[grpc.Compression] = None,
     ):
         self.port = check.opt_int_param(port, "port")
 
@@ -100,6 +139,13 @@ def __init__(
             socket = check.not_none(socket)
             self._server_address = "unix:" + os.path.abspath(socket)
 
+        compression = check.opt_inst_param(compression, "compression", grpc.Compression)
+        self._compression = (
+            compression
+            if compression is not None
+            else default_grpc_compression(is_unix_socket=not port)
+        )
+
     @property
     def metadata(self) -> Sequence[Tuple[str, str]]:
         return self._metadata
@@ -108,27 +154,59 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
+    @property
+    def compression(self) -> grpc.Compression:
+        return self._compression
+
+    def _create_channel(self) -> grpc.Channel:
         options = [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
+            ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
         ]
-        with (
+        return (
             grpc.secure_channel(
                 self._server_address,
                 self._ssl_creds,
                 options=options,
-                compression=grpc.Compression.Gzip,
+                compression=self._compression,
             )
             if self._use_ssl
             else grpc.insecure_channel(
                 self._server_address,
                 options=options,
-                compression=grpc.Compression.Gzip,
+                compression=self._compression,
             )
-        ) as channel:
-            yield channel
+        )
+
+    @contextmanager
+    def _channel(self) -> Iterator[grpc.Channel]:
+        # channels can't be used across a fork, so each process has its own channels
+        pool_key = (os.getpid(), self._server_address, self._use_ssl, self._compression)
+        with _channel_pool_lock:
+            pooled_channel = _channel_pool.get(pool_key)
+            if pooled_channel is None:
+                pooled_channel = _PooledChannel(self._create_channel())
+                _channel_pool.set(pool_key, pooled_channel)
+            pooled_channel.num_active_calls += 1
+
+        try:
+            yield pooled_channel.channel
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE:  # type: ignore  # (bad stubs)
+                # the server may have restarted or moved, so connect again on the next call
+                with _channel_pool_lock:
+                    if _channel_pool.get(pool_key) is pooled_channel:
+                        _channel_pool.discard(pool_key)
+                    pooled_channel.is_removed = True
+            raise
+        finally:
+            with _channel_pool_lock:
+                pooled_channel.num_active_calls -= 1
+                should_close = pooled_channel.is_removed and pooled_channel.num_active_calls == 0
+            if should_close:
+                pooled_channel.channel.close()
 
     def _get_response(
         self,
@@ -125,6 +125,15 @@
 
 STREAMING_CHUNK_SIZE = 4000000
 
+
+def _split_serialized_data(serialized_data: str) -> Sequence[str]:
+    num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
+    return [
+        serialized_data[i * STREAMING_CHUNK_SIZE : (i + 1) * STREAMING_CHUNK_SIZE]
+        for i in range(num_chunks)
+    ]
+
+
 UTILIZATION_METRICS_RETRIEVAL_INTERVAL = 30
 
 _METRICS_LOCK = threading.Lock()
@@ -372,6 +381,16 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Definitions don't change until the code is reloaded, so the serialized repository and
+        # job data that clients fetch when they load or refresh the code location are cached
+        self._serialized_external_repository_data_chunks: Dict[Tuple[str, bool], Sequence[str]] = {}
+        self._serialized_external_job_data: Dict[Tuple[str, str], str] = {}
+        # Data is serialized outside of the lock, so that a slow repository does not hold up
+        # requests for others. The generation is bumped whenever the caches are cleared, so that
+        # data serialized before then is not cached afterwards.
+        self._serialized_data_lock = threading.Lock()
+        self._serialized_data_generation = 0
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -514,6 +533,13 @@ def _get_repo_for_origin(
     def ReloadCode(
         self, _request: api_pb2.ReloadCodeRequest, _context: grpc.ServicerContext
     ) -> api_pb2.ReloadCodeReply:
+        # repository data that is loaded dynamically may change even though the code is not
+        # reloaded, so serialize it again the next time that it is requested
+        with self._serialized_data_lock:
+            self._serialized_external_repository_data_chunks.clear()
+            self._serialized_external_job_data.clear()
+            self._serialized_data_generation += 1
+
         self._logger.warn(
             "Reloading definitions from a code server launched via `dagster api grpc` "
             "without restarting the process is not currently supported. To enable this functionality, "
@@ -754,30 +780,50 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
-    def _get_serialized_external_repository_data(
+    def _get_serialized_external_repository_data_chunks(
         self, request: api_pb2.ExternalRepositoryRequest
-    ) -> str:
+    ) -> Sequence[str]:
         try:
             repository_origin = deserialize_value(
                 request.serialized_repository_python_origin,
                 RemoteRepositoryOrigin,
             )
-
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
+            cache_key = (repository_origin.repository_name, request.defer_snapshots)
+
+            with self._serialized_data_lock:
+                chunks = self._serialized_external_repository_data_chunks.get(cache_key)
+                generation = self._serialized_data_generation
+
+            if chunks is None:
+                chunks = _split_serialized_data(
+                    serialize_value(
+                        external_repository_data_from_def(
+                            self._get_repo_for_origin(repository_origin),
+                            defer_snapshots=request.defer_snapshots,
+                        )
+                    )
                 )
-            )
+                with self._serialized_data_lock:
+                    if generation == self._serialized_data_generation:
+                        chunks = self._serialized_external_repository_data_chunks.setdefault(
+                            cache_key, chunks
+                        )
+            return chunks
         except Exception:
-            return serialize_value(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return _split_serialized_data(
+                serialize_value(
+                    ExternalRepositoryErrorData(
+                        serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                )
             )
 
     def ExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> api_pb2.ExternalRepositoryReply:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data = "".join(
+            self._get_serialized_external_repository_data_chunks(request)
+        )
 
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
@@ -791,11 +837,22 @@ def ExternalJob(
                 request.serialized_repository_origin,
                 RemoteRepositoryOrigin,
             )
+            cache_key = (repository_origin.repository_name, request.job_name)
 
-            job_def = self._get_repo_for_origin(repository_origin).get_job(request.job_name)
-            ser_job_data = serialize_value(
-                external_job_data_from_def(job_def, include_parent_snapshot=True)
-            )
+            with self._serialized_data_lock:
+                ser_job_data = self._serialized_external_job_data.get(cache_key)
+                generation = self._serialized_data_generation
+
+            if ser_job_data is None:
+                job_def = self._get_repo_for_origin(repository_origin).get_job(request.job_name)
+                ser_job_data = serialize_value(
+                    external_job_data_from_def(job_def, include_parent_snapshot=True)
+                )
+                with self._serialized_data_lock:
+                    if generation == self._serialized_data_generation:
+                        ser_job_data = self._serialized_external_job_data.setdefault(
+                            cache_key, ser_job_data
+                        )
             return api_pb2.ExternalJobReply(serialized_job_data=ser_job_data)
         except Exception:
             return api_pb2.ExternalJobReply(
@@ -807,40 +864,19 @@ def ExternalJob(
     def StreamingExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
-
-        num_chunks = int(
-            math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
-        )
-
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_external_repository_data),
-            )
-
+        for i, chunk in enumerate(self._get_serialized_external_repository_data_chunks(request)):
             yield api_pb2.StreamingExternalRepositoryEvent(
                 sequence_number=i,
-                serialized_external_repository_chunk=serialized_external_repository_data[
-                    start_index:end_index
-                ],
+                serialized_external_repository_chunk=chunk,
             )
 
     def _split_serialized_data_into_chunk_events(
         self, serialized_data: str
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
-        num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_data),
-            )
-
+        for i, chunk in enumerate(_split_serialized_data(serialized_data)):
             yield api_pb2.StreamingChunkEvent(
                 sequence_number=i,
-                serialized_chunk=serialized_data[start_index:end_index],
+                serialized_chunk=chunk,
             )
 
     def ExternalScheduleExecution(
@@ -18,7 +18,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
 from enum import Enum
-from functools import partial
+from functools import cached_property, partial
 from inspect import Parameter, signature
 from typing import (
     TYPE_CHECKING,
@@ -513,6 +513,9 @@ def get_storage_name(self) -> str:
 
 EMPTY_VALUES_TO_SKIP: Tuple[None, List[Any], Dict[Any, Any], Set[Any]] = (None, [], {}, set())
 
+# Types that are packed as is, checked by exact type on hot code paths
+_SCALAR_TYPES: Final = (int, float, str, bool)
+
 
 class ObjectSerializer(Serializer, Generic[T]):
     # NOTE: See `whitelist_for_serdes` docstring for explanations of parameters.
@@ -533,6 +536,40 @@ def __init__(
         self.old_fields = old_fields or {}
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
+        self._pack_plan = self._build_pack_plan()
+
+    # Packing plan, computed once at registration so that packing does a single lookup per field:
+    # maps each field that needs special handling to its storage key, custom field serializer and
+    # whether it is skipped when empty. All other fields are stored as is, under their own name.
+    def _build_pack_plan(self) -> Mapping[str, Tuple[str, Optional["FieldSerializer"], bool]]:
+        return {
+            key: (
+                self.storage_field_names.get(key, key),
+                self.field_serializers.get(key),
+                key in self.skip_when_empty_fields,
+            )
+            for key in {
+                *self.storage_field_names,
+                *self.field_serializers,
+                *self.skip_when_empty_fields,
+            }
+        }
+
+    # Unpacking plan, computed once on first unpack since constructor params are not always
+    # available at registration: maps every storage key that is loaded into the constructor to its
+    # loaded field name and custom field serializer. Stored keys that are not in the plan are not
+    # constructor params of the current version of the class, and are ignored.
+    @cached_property
+    def _unpack_plan(self) -> Mapping[str, Tuple[str, Optional["FieldSerializer"]]]:
+        param_names = set(self.constructor_param_names)
+        loaded_names_by_key = {
+            **{name: name for name in param_names if name not in self.loaded_field_names},
+            **{key: name for key, name in self.loaded_field_names.items() if name in param_names},
+        }
+        return {
+            key: (name, self.field_serializers.get(name))
+            for key, name in loaded_names_by_key.items()
+        }
 
     @abstractmethod
     def object_as_mapping(self, value: T) -> Mapping[str, PackableValue]: ...
@@ -546,27 +583,28 @@ def unpack(
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
             unpacked: Dict[str, PackableValue] = {}
+            unpack_plan = self._unpack_plan
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                field_plan = unpack_plan.get(key)
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
-                    # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
-                    if custom:
-                        unpacked[loaded_name] = custom.unpack(
-                            value,
-                            whitelist_map=whitelist_map,
-                            context=context,
-                        )
-                    elif context.observed_unknown_serdes_values:
-                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
-                    else:
-                        unpacked[loaded_name] = cast(PackableValue, value)
-
-                else:
+                if field_plan is None:
                     context.clear_ignored_unknown_values(value)
+                    continue
+
+                loaded_name, custom = field_plan
+                # custom unpack regardless of hook vs recursive descent
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                else:
+                    unpacked[loaded_name] = cast(PackableValue, value)
 
             return self.klass(**unpacked)
         except Exception as exc:
@@ -603,11 +641,24 @@ def pack(
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
+        pack_plan = self._pack_plan
         for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+            field_plan = pack_plan.get(key)
+            if field_plan is None:
+                # fast path for fields without special handling, skipping the call for scalars
+                if inner_value is None or type(inner_value) in _SCALAR_TYPES:
+                    packed[key] = inner_value
+                else:
+                    packed[key] = _pack_value(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=f"{descent_path}.{key}",
+                    )
+                continue
+
+            storage_key, custom, skip_when_empty = field_plan
+            if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 packed[storage_key] = custom.pack(
                     inner_value,
@@ -798,7 +849,7 @@ def _pack_value(
 ) -> JsonSerializableValue:
     # this is a hot code path so we handle the common base cases without isinstance
     tval = type(val)
-    if tval in (int, float, str, bool) or val is None:
+    if tval in _SCALAR_TYPES or val is None:
         return cast(JsonSerializableValue, val)
     if tval is list:
         return [
@@ -810,6 +861,10 @@ def _pack_value(
             key: _pack_value(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in cast(dict, val).items()
         }
+    # registered object classes are looked up directly, skipping the instance checks below
+    serializer = whitelist_map.object_serializers.get(tval.__name__)
+    if serializer is not None and serializer.klass is tval:
+        return serializer.pack(val, whitelist_map, descent_path)
     if tval is SerializableNonScalarKeyMapping:
         return {
             "__mapping_items__": [
@@ -954,7 +1009,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext) -> UnpackedValue:
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_object_deserializer(klass_name):
+        deserializer = whitelist_map.object_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -963,7 +1019,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_object_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
@@ -657,6 +657,20 @@ def counts(self) -> Mapping[str, int]:
     default=None,
 )
 
+
+@contextlib.contextmanager
+def traced_counter_scope() -> Iterator[Counter]:
+    """Counts the calls made to traced functions within the scope with a new Counter, restoring the
+    previously active counter on exit.
+    """
+    counter = Counter()
+    token = traced_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        traced_counter.reset(token)
+
+
 T_Callable = TypeVar("T_Callable", bound=Callable)
 
 
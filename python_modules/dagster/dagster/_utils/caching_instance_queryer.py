@@ -6,6 +6,7 @@
     AbstractSet,
     Dict,
     Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -30,6 +31,7 @@
 from dagster._core.definitions.partition import (
     PartitionsSubset,
 )
+from dagster._core.definitions.partition_mapping import CachingPartitionMappingResolver
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsDefinition,
     get_time_partition_key,
@@ -82,9 +84,15 @@ def __init__(
         self._asset_partition_versions_updated_after_cursor_cache: Dict[
             AssetKeyPartitionKey, int
         ] = {}
+        self._latest_storage_id_by_partition_cache: Dict[AssetKey, Mapping[str, int]] = {}
+        self._latest_data_version_by_partition_cache: Dict[
+            AssetKey, Mapping[str, Optional[DataVersion]]
+        ] = {}
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
+        self._partition_mapping_resolver = CachingPartitionMappingResolver(self)
+
         self._evaluation_time = evaluation_time if evaluation_time else pendulum.now("UTC")
 
         self._respect_materialization_data_versions = (
@@ -103,6 +111,10 @@ def asset_graph(self) -> BaseAssetGraph:
     def evaluation_time(self) -> datetime:
         return self._evaluation_time
 
+    @property
+    def partition_mapping_resolver(self) -> CachingPartitionMappingResolver:
+        return self._partition_mapping_resolver
+
     ####################
     # QUERY BATCHING
     ####################
@@ -120,6 +132,53 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
             if key not in self._asset_record_cache:
                 self._asset_record_cache[key] = None
 
+    def prefetch_asset_partition_data(self, asset_keys: Iterable[AssetKey]) -> None:
+        """For performance, batches together queries for the asset records of the selected assets
+        and, for partitioned assets, the latest storage id and data version of each partition. Data
+        versions are only fetched for assets whose updates are filtered by data version.
+        """
+        asset_keys = list(asset_keys)
+        self.prefetch_asset_records(asset_keys)
+
+        keys_to_fetch_by_event_type: Dict[DagsterEventType, List[AssetKey]] = defaultdict(list)
+        for asset_key in asset_keys:
+            if (
+                asset_key in self._latest_storage_id_by_partition_cache
+                or not self.asset_graph.has(asset_key)
+                or not self.asset_graph.get(asset_key).is_partitioned
+            ):
+                continue
+            keys_to_fetch_by_event_type[self._event_type_for_key(asset_key)].append(asset_key)
+
+        for event_type, keys_to_fetch in keys_to_fetch_by_event_type.items():
+            self._latest_storage_id_by_partition_cache.update(
+                self.instance.get_latest_storage_id_by_partition_for_asset_keys(
+                    keys_to_fetch, event_type
+                )
+            )
+            keys_to_fetch_versions = [
+                asset_key
+                for asset_key in keys_to_fetch
+                if self.asset_graph.get(asset_key).is_observable
+                or self._respect_materialization_data_versions
+            ]
+            if not keys_to_fetch_versions:
+                continue
+            latest_tags_by_partition_by_asset_key = (
+                self.instance.get_latest_tags_by_partition_for_asset_keys(
+                    keys_to_fetch_versions, event_type, [DATA_VERSION_TAG]
+                )
+            )
+            for asset_key in keys_to_fetch_versions:
+                self._latest_data_version_by_partition_cache[asset_key] = {
+                    partition_key: (
+                        DataVersion(tags[DATA_VERSION_TAG]) if tags.get(DATA_VERSION_TAG) else None
+                    )
+                    for partition_key, tags in latest_tags_by_partition_by_asset_key.get(
+                        asset_key, {}
+                    ).items()
+                }
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -244,12 +303,17 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.get(asset_key).is_partitioned:
+            latest_storage_id_by_partition = self._latest_storage_id_by_partition_cache.get(
+                asset_key
+            )
+            if latest_storage_id_by_partition is None:
+                latest_storage_id_by_partition = self.instance.get_latest_storage_id_by_partition(
+                    asset_key, event_type=self._event_type_for_key(asset_key)
+                )
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in latest_storage_id_by_partition.items()
                 }
             )
         return latest_storage_ids
@@ -405,9 +469,9 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
-        materializations_planned = self.instance.get_records_for_run(
+        materializations_planned = self.instance.get_lazy_records_for_run(
             run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
-        ).records
+        )
         return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
 
     def get_planned_materializations_for_run(self, run_id: str) -> AbstractSet[AssetKey]:
@@ -449,10 +513,10 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
-        materializations = self.instance.get_records_for_run(
+        materializations = self.instance.get_lazy_records_for_run(
             run_id=run_id,
             of_type=DagsterEventType.ASSET_MATERIALIZATION,
-        ).records
+        )
         return set(cast(AssetKey, record.asset_key) for record in materializations)
 
     ####################
@@ -626,11 +690,11 @@ def asset_partitions_with_newly_updated_parents_and_new_cursor(
                 )
                 try:
                     child_partitions_subset = (
-                        partition_mapping.get_downstream_partitions_for_partitions(
+                        self.partition_mapping_resolver.get_downstream_partitions_for_partitions(
+                            partition_mapping,
                             parent_partitions_subset,
                             upstream_partitions_def=parent_partitions_def,
                             downstream_partitions_def=child_asset.partitions_def,
-                            dynamic_partitions_store=self,
                             current_time=self.evaluation_time,
                         )
                     )
@@ -701,6 +765,28 @@ def _asset_partitions_data_versions(
                 if latest_record is not None
                 else {}
             )
+        elif before_cursor is None and asset_key in self._latest_data_version_by_partition_cache:
+            # the latest event after the cursor is the latest event overall, if there is one
+            latest_storage_id_by_partition = self._latest_storage_id_by_partition_cache[asset_key]
+            latest_data_version_by_partition = self._latest_data_version_by_partition_cache[
+                asset_key
+            ]
+            partition_keys = (
+                latest_data_version_by_partition.keys()
+                if asset_partitions is None
+                else {
+                    asset_partition.partition_key
+                    for asset_partition in asset_partitions
+                    if asset_partition.partition_key in latest_data_version_by_partition
+                }
+            )
+            return {
+                AssetKeyPartitionKey(asset_key, partition_key): latest_data_version_by_partition[
+                    partition_key
+                ]
+                for partition_key in partition_keys
+                if latest_storage_id_by_partition.get(partition_key, 0) > (after_cursor or 0)
+            }
         else:
             query_result = self.instance._event_storage.get_latest_tags_by_partition(  # noqa
                 asset_key,
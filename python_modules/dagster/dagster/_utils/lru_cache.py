@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+import dagster._check as check
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe, bounded mapping that evicts the least recently used entries once it holds
+    more than max_size entries, or, if max_weight is set, once the total weight of its entries is
+    more than max_weight. Keeps counts of hits and misses so that callers can report how effective
+    the cache is.
+
+    Unlike `functools.lru_cache`, values are explicitly read and written, which allows caching the
+    results of calls whose arguments are not all hashable, or only some of whose results should
+    be cached.
+
+    If on_evict is set, it is called with the key and value of each entry that is evicted to make
+    room for others, after the cache's lock has been released. It is not called for entries that
+    are removed with discard or clear.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        max_weight: Optional[int] = None,
+        on_evict: Optional[Callable[[K, V], None]] = None,
+    ):
+        self._max_size = check.int_param(max_size, "max_size")
+        check.invariant(self._max_size > 0, "max_size must be positive")
+        self._max_weight = check.opt_int_param(max_weight, "max_weight")
+        self._on_evict = check.opt_callable_param(on_evict, "on_evict")
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._weights: Dict[K, int] = {}
+        self._total_weight = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def max_weight(self) -> Optional[int]:
+        return self._max_weight
+
+    @property
+    def total_weight(self) -> int:
+        return self._total_weight
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found a value, or 0.0 if there have been no lookups."""
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: K, value: V, weight: int = 0) -> None:
+        """Adds an entry to the cache. An entry whose weight is more than max_weight is not added,
+        and the entries already in the cache are kept. Any earlier entry for the same key is
+        removed, since its value is out of date.
+        """
+        evicted: List[Tuple[K, V]] = []
+        with self._lock:
+            if self._max_weight is not None and weight > self._max_weight:
+                if key in self._entries:
+                    del self._entries[key]
+                    self._total_weight -= self._weights.pop(key)
+                return
+
+            self._total_weight += weight - self._weights.get(key, 0)
+            self._entries[key] = value
+            self._weights[key] = weight
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size or (
+                self._max_weight is not None and self._total_weight > self._max_weight
+            ):
+                evicted_key, evicted_value = self._entries.popitem(last=False)
+                self._total_weight -= self._weights.pop(evicted_key)
+                self._evictions += 1
+                evicted.append((evicted_key, evicted_value))
+
+        if self._on_evict:
+            for evicted_key, evicted_value in evicted:
+                self._on_evict(evicted_key, evicted_value)
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+                self._total_weight -= self._weights.pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._total_weight = 0
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
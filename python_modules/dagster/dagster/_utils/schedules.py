@@ -147,6 +147,21 @@ def _replace_date_fields(
     return new_time
 
 
+def get_schedule_time_on_date(
+    date: datetime.date, hour: int, minute: int, timezone_str: str
+) -> PendulumDateTime:
+    """Returns the time at which a daily or weekly schedule that runs at the given hour and minute
+    ticks on the given date, resolving times that are skipped or repeated by daylight savings time
+    transitions the same way that cron_string_iterator does.
+    """
+    return _replace_date_fields(
+        create_pendulum_time(date.year, date.month, date.day, tz=timezone_str),
+        hour,
+        minute,
+        date.day,
+    )
+
+
 SECONDS_PER_MINUTE = 60
 MINUTES_PER_HOUR = 60
 
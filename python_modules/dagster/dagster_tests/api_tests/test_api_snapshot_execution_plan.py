@@ -89,3 +89,25 @@ def test_execution_plan_with_subset_snapshot_api_grpc(instance: DagsterInstance)
             "do_input",
         ]
         assert len(execution_plan_snapshot.steps) == 1
+
+
+def test_execution_plan_snapshot_cached_by_code_location(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        external_job = code_location.get_repository("bar_repo").get_full_external_job("foo")
+
+        first = code_location.get_external_execution_plan(
+            external_job, run_config={}, step_keys_to_execute=None, known_state=None
+        )
+        second = code_location.get_external_execution_plan(
+            external_job, run_config={}, step_keys_to_execute=None, known_state=None
+        )
+        assert second.execution_plan_snapshot is first.execution_plan_snapshot
+
+        subset = code_location.get_external_execution_plan(
+            external_job, run_config={}, step_keys_to_execute=["do_something"], known_state=None
+        )
+        assert subset.execution_plan_snapshot.step_keys_to_execute == ["do_something"]
+
+        cache = code_location._execution_plan_snapshot_cache  # noqa: SLF001
+        assert cache.hits == 1
+        assert cache.misses == 2
@@ -1,10 +1,15 @@
+import logging
 import sys
+import threading
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
-from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster import IntMetadataValue, TextMetadataValue, file_relative_path, job, op, repository
+from dagster._api.snapshot_job import sync_get_external_job_data_grpc
 from dagster._api.snapshot_repository import (
     sync_get_streaming_external_repositories_data_grpc,
+    sync_get_streaming_external_repository_data_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.instance import DagsterInstance
@@ -12,13 +17,20 @@
     ExternalRepositoryData,
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
+from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
 from dagster._core.remote_representation.external import ExternalRepository
-from dagster._core.remote_representation.external_data import ExternalJobData
+from dagster._core.remote_representation.external_data import (
+    ExternalJobData,
+    external_repository_data_from_def,
+)
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._core.utils import FuturesAwareThreadPoolExecutor
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.server import DagsterApiServer
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 from .utils import get_bar_repo_code_location
 
@@ -167,3 +179,136 @@ def _ref_to_data(ref):
         job = repo.get_all_external_jobs()[0]
         _ = job.job_snapshot
         assert _state.get("cnt", 0) == 1
+
+
+def test_serialized_repository_data_cached_until_reload():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        attribute="bar_repo",
+        python_file=file_relative_path(__file__, "api_tests_repo.py"),
+    )
+    server = DagsterApiServer(
+        server_termination_event=threading.Event(),
+        logger=logging.getLogger("dagster.code_server"),
+        server_threadpool_executor=FuturesAwareThreadPoolExecutor(),
+        loadable_target_origin=loadable_target_origin,
+    )
+    try:
+        repo_origin = RemoteRepositoryOrigin(
+            ManagedGrpcPythonEnvCodeLocationOrigin(loadable_target_origin, "bar_location"),
+            "bar_repo",
+        )
+        request = api_pb2.ExternalRepositoryRequest(
+            serialized_repository_python_origin=serialize_value(repo_origin),
+            defer_snapshots=False,
+        )
+
+        with mock.patch(
+            "dagster._grpc.server.external_repository_data_from_def",
+            wraps=external_repository_data_from_def,
+        ) as external_repository_data_mock:
+            serialized_data = server.ExternalRepository(
+                request, None
+            ).serialized_external_repository_data
+            assert deserialize_value(serialized_data, ExternalRepositoryData).name == "bar_repo"
+
+            chunks = [
+                event.serialized_external_repository_chunk
+                for event in server.StreamingExternalRepository(request, None)
+            ]
+            assert "".join(chunks) == serialized_data
+            assert external_repository_data_mock.call_count == 1
+
+            server.ReloadCode(api_pb2.ReloadCodeRequest(), None)
+            assert (
+                server.ExternalRepository(request, None).serialized_external_repository_data
+                == serialized_data
+            )
+            assert external_repository_data_mock.call_count == 2
+
+        server.ReloadCode(api_pb2.ReloadCodeRequest(), None)
+
+        def _reload_while_serializing(*args, **kwargs):
+            # data is serialized without holding the cache lock, so the code can be reloaded
+            server.ReloadCode(api_pb2.ReloadCodeRequest(), None)
+            return external_repository_data_from_def(*args, **kwargs)
+
+        with mock.patch(
+            "dagster._grpc.server.external_repository_data_from_def",
+            side_effect=_reload_while_serializing,
+        ) as external_repository_data_mock:
+            server.ExternalRepository(request, None)
+            server.ExternalRepository(request, None)
+            # data serialized before the reload was returned but not cached
+            assert external_repository_data_mock.call_count == 2
+    finally:
+        server.cleanup()
+
+
+def test_reloaded_code_location_reuses_loaded_job_data(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        assert code_location.get_loaded_job_data_by_snapshot_id() == {}
+
+        foo_job = code_location.get_repository("bar_repo").get_full_external_job("foo")
+        job_data_by_snapshot_id = code_location.get_loaded_job_data_by_snapshot_id()
+        assert job_data_by_snapshot_id == {
+            foo_job.computed_job_snapshot_id: foo_job.external_job_data
+        }
+
+        with mock.patch(
+            "dagster._core.remote_representation.code_location.sync_get_streaming_external_repository_data_grpc",
+            wraps=sync_get_streaming_external_repository_data_grpc,
+        ) as repository_data_mock:
+            reloaded_code_location = GrpcServerCodeLocation(
+                origin=code_location.origin,
+                instance=instance,
+                host=code_location.client.host,
+                port=code_location.client.port,
+                socket=code_location.client.socket,
+                server_id=code_location.server_id,
+                job_data_by_snapshot_id=job_data_by_snapshot_id,
+            )
+            # the jobs that were not loaded by the previous copy of the code location are fetched
+            # together, with a single call for the repository
+            assert repository_data_mock.call_count == 1
+        try:
+            with mock.patch(
+                "dagster._core.remote_representation.code_location.sync_get_external_job_data_grpc",
+                wraps=sync_get_external_job_data_grpc,
+            ) as job_data_mock:
+                reloaded_repo = reloaded_code_location.get_repository("bar_repo")
+                reloaded_foo_job = reloaded_repo.get_full_external_job("foo")
+                assert reloaded_foo_job.external_job_data is foo_job.external_job_data
+
+                bar_job = reloaded_repo.get_full_external_job("bar")
+                assert bar_job.external_job_data.name == "bar"
+                assert job_data_mock.call_count == 0
+
+            # the data for every job of the repository is carried over to the next reload
+            assert set(reloaded_code_location.get_loaded_job_data_by_snapshot_id()) == {
+                job_ref.snapshot_id
+                for job_ref in reloaded_repo.external_repository_data.get_external_job_refs()
+            }
+            assert {
+                foo_job.computed_job_snapshot_id,
+                bar_job.computed_job_snapshot_id,
+            } <= set(reloaded_code_location.get_loaded_job_data_by_snapshot_id())
+        finally:
+            reloaded_code_location.cleanup()
+
+        # with no loaded job data to reuse, job snapshots are not deferred
+        reloaded_code_location = GrpcServerCodeLocation(
+            origin=code_location.origin,
+            instance=instance,
+            host=code_location.client.host,
+            port=code_location.client.port,
+            socket=code_location.client.socket,
+            server_id=code_location.server_id,
+            job_data_by_snapshot_id={},
+        )
+        try:
+            assert reloaded_code_location.get_repository(
+                "bar_repo"
+            ).external_repository_data.has_job_data()
+        finally:
+            reloaded_code_location.cleanup()
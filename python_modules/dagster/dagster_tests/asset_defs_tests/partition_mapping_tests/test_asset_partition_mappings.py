@@ -44,6 +44,7 @@
 )
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.partition_mapping import (
+    CachingPartitionMappingResolver,
     PartitionMapping,
     UpstreamPartitionsResult,
     get_builtin_partition_mapping_types,
@@ -873,3 +874,91 @@ def test_last_partition_mapping_get_downstream_partitions():
         )
         == downstream_partitions_def.empty_subset()
     )
+
+
+def test_caching_partition_mapping_resolver():
+    upstream_partitions_def = DailyPartitionsDefinition("2023-10-01")
+    downstream_partitions_def = DailyPartitionsDefinition("2023-10-01")
+    partition_mapping = TimeWindowPartitionMapping(start_offset=-1)
+    current_time = datetime(2023, 10, 5, 1)
+
+    with instance_for_test() as instance:
+        resolver = CachingPartitionMappingResolver(instance)
+        upstream_subset = resolver.get_subset_for_partition_key(
+            upstream_partitions_def, "2023-10-02"
+        )
+        assert upstream_subset is resolver.get_subset_for_partition_key(
+            upstream_partitions_def, "2023-10-02"
+        )
+
+        downstream_subset = resolver.get_downstream_partitions_for_partitions(
+            partition_mapping,
+            upstream_subset,
+            upstream_partitions_def,
+            downstream_partitions_def,
+            current_time,
+        )
+        assert downstream_subset == partition_mapping.get_downstream_partitions_for_partitions(
+            upstream_subset, upstream_partitions_def, downstream_partitions_def, current_time
+        )
+        assert (resolver.num_hits, resolver.num_misses) == (0, 1)
+
+        assert (
+            resolver.get_downstream_partitions_for_partitions(
+                partition_mapping,
+                upstream_subset,
+                upstream_partitions_def,
+                downstream_partitions_def,
+                current_time,
+            )
+            is downstream_subset
+        )
+        assert (resolver.num_hits, resolver.num_misses) == (1, 1)
+
+        upstream_result = resolver.get_upstream_mapped_partitions_result_for_partitions(
+            partition_mapping,
+            downstream_subset,
+            downstream_partitions_def,
+            upstream_partitions_def,
+            current_time,
+        )
+        assert list(upstream_result.partitions_subset.get_partition_keys()) == [
+            "2023-10-01",
+            "2023-10-02",
+            "2023-10-03",
+        ]
+        assert (resolver.num_hits, resolver.num_misses) == (1, 2)
+
+        # results for a different evaluation time are computed separately
+        resolver.get_downstream_partitions_for_partitions(
+            partition_mapping,
+            upstream_subset,
+            upstream_partitions_def,
+            downstream_partitions_def,
+            datetime(2023, 10, 6, 1),
+        )
+        assert (resolver.num_hits, resolver.num_misses) == (1, 3)
+
+
+def test_caching_partition_mapping_resolver_bounded():
+    partitions_def = DailyPartitionsDefinition("2023-10-01")
+    partition_mapping = TimeWindowPartitionMapping(start_offset=-1)
+    current_time = datetime(2023, 10, 5, 1)
+
+    with instance_for_test() as instance:
+        resolver = CachingPartitionMappingResolver(instance, max_size=1)
+        subsets = [
+            resolver.get_subset_for_partition_key(partitions_def, partition_key)
+            for partition_key in ["2023-10-02", "2023-10-03"]
+        ]
+        # the first subset was evicted to make room for the second
+        assert resolver.get_subset_for_partition_key(partitions_def, "2023-10-02") is not subsets[0]
+
+        for subset in subsets:
+            resolver.get_downstream_partitions_for_partitions(
+                partition_mapping, subset, partitions_def, partitions_def, current_time
+            )
+        resolver.get_downstream_partitions_for_partitions(
+            partition_mapping, subsets[0], partitions_def, partitions_def, current_time
+        )
+        assert (resolver.num_hits, resolver.num_misses) == (0, 3)
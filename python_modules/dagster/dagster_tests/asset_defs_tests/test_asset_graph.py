@@ -578,6 +578,91 @@ def include_all(asset_key, partitions_subset):
     )
 
 
+def test_bfs_filter_asset_graph_subset(
+    asset_graph_from_assets: Callable[..., BaseAssetGraph],
+):
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset0(): ...
+
+    @asset
+    def unpartitioned(): ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def asset1(asset0, unpartitioned): ...
+
+    @asset(
+        partitions_def=daily_partitions_def,
+        ins={
+            "asset2": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            )
+        },
+    )
+    def asset2(asset1, asset2): ...
+
+    @asset(partitions_def=HourlyPartitionsDefinition(start_date="2022-01-01-00:00"))
+    def asset3(asset2): ...
+
+    asset_graph = asset_graph_from_assets([asset0, unpartitioned, asset1, asset2, asset3])
+    current_time = create_pendulum_time(2022, 1, 10)
+    excluded_asset_partitions = {
+        AssetKeyPartitionKey(asset1.key, "2022-01-05"),
+        AssetKeyPartitionKey(asset2.key, "2022-01-04"),
+    }
+
+    def asset_partition_condition(asset_partitions, _):
+        return all(
+            asset_partition not in excluded_asset_partitions for asset_partition in asset_partitions
+        )
+
+    def subset_condition(candidates_unit, _):
+        return AssetGraphSubset.from_asset_partition_set(
+            set(candidates_unit.iterate_asset_partitions()) - excluded_asset_partitions,
+            asset_graph,
+        )
+
+    initial_asset_partitions = {
+        AssetKeyPartitionKey(asset0.key, "2022-01-02"),
+        AssetKeyPartitionKey(asset0.key, "2022-01-05"),
+        AssetKeyPartitionKey(asset1.key, "2022-01-07"),
+    }
+
+    # matches the asset partition at a time implementation, including for the self-dependent asset
+    expected_asset_partitions = asset_graph.bfs_filter_asset_partitions(
+        dynamic_partitions_store=MagicMock(),
+        condition_fn=asset_partition_condition,
+        initial_asset_partitions=initial_asset_partitions,
+        evaluation_time=current_time,
+    )
+    assert AssetKeyPartitionKey(asset2.key, "2022-01-03") in expected_asset_partitions
+    assert AssetKeyPartitionKey(asset2.key, "2022-01-05") not in expected_asset_partitions
+    assert AssetKeyPartitionKey(asset2.key, "2022-01-09") in expected_asset_partitions
+    assert asset_graph.bfs_filter_asset_graph_subset(
+        dynamic_partitions_store=MagicMock(),
+        condition_fn=subset_condition,
+        initial_subset=AssetGraphSubset.from_asset_partition_set(
+            initial_asset_partitions, asset_graph
+        ),
+        current_time=current_time,
+    ) == AssetGraphSubset.from_asset_partition_set(expected_asset_partitions, asset_graph)
+
+    # an unpartitioned parent maps to all partitions of its children
+    assert asset_graph.bfs_filter_asset_graph_subset(
+        dynamic_partitions_store=MagicMock(),
+        condition_fn=lambda candidates_unit, _: candidates_unit
+        if asset3.key not in candidates_unit.asset_keys and asset2.key not in candidates_unit
+        else AssetGraphSubset(),
+        initial_subset=AssetGraphSubset(non_partitioned_asset_keys={unpartitioned.key}),
+        current_time=current_time,
+    ).get_partitions_subset(
+        asset1.key, asset_graph
+    ) == daily_partitions_def.subset_with_partition_keys(
+        daily_partitions_def.get_partition_keys(current_time=current_time)
+    )
+
+
 def test_asset_graph_subset_contains(
     asset_graph_from_assets: Callable[..., BaseAssetGraph],
 ) -> None:
@@ -8,7 +8,11 @@
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    StaticPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     TimeWindowPartitionsDefinition,
@@ -86,7 +90,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is StaticPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is PartitionKeysTimeWindowPartitionsSubset
 
 
@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -27,6 +28,7 @@
 from dagster._core.definitions.events import AssetMaterialization, AssetObservation
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
 from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
     DagsterHomeNotSetError,
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
@@ -43,6 +45,7 @@
     create_job_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import (
     AssetPartitionStatus,
     AssetStatusCacheValue,
@@ -244,6 +247,135 @@ def test_in_memory_persist_one_run():
         do_test_single_write_read(instance)
 
 
+def test_event_write_buffer():
+    with environ(
+        {
+            "DAGSTER_EVENT_WRITE_BUFFER_SIZE": "3",
+            "DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS": "1000",
+        }
+    ):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            received = []
+            instance.add_event_listener(run.run_id, received.append)
+
+            instance.report_engine_event("one", run)
+            instance.report_engine_event("two", run)
+            assert len(instance.all_logs(run.run_id)) == 0
+            assert received == []
+
+            # size-bounded flush
+            instance.report_engine_event("three", run)
+            assert [event.message for event in instance.all_logs(run.run_id)] == [
+                "one",
+                "two",
+                "three",
+            ]
+            assert [event.message for event in received] == ["one", "two", "three"]
+
+            # run lifecycle events are written immediately along with anything buffered
+            instance.report_engine_event("four", run)
+            instance.report_run_failed(run)
+            logs = instance.all_logs(run.run_id)
+            assert len(logs) == 5
+            assert logs[-1].dagster_event_type == DagsterEventType.RUN_FAILURE
+            assert instance.get_run_by_id(run.run_id).status == DagsterRunStatus.FAILURE
+
+            instance.report_engine_event("five", run)
+            assert len(instance.all_logs(run.run_id)) == 5
+            instance.flush_event_write_buffer()
+            assert len(instance.all_logs(run.run_id)) == 6
+
+
+def test_event_write_buffer_flushes_on_interval():
+    with environ(
+        {
+            "DAGSTER_EVENT_WRITE_BUFFER_SIZE": "100",
+            "DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS": "0.1",
+        }
+    ):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            instance.report_engine_event("one", run)
+
+            # buffered events are written once the interval passes, without any further events
+            start = time.time()
+            while not instance.all_logs(run.run_id):
+                assert time.time() - start < 10
+                time.sleep(0.05)
+            assert [event.message for event in instance.all_logs(run.run_id)] == ["one"]
+
+
+def test_event_write_buffer_partially_stored_batch():
+    with environ({"DAGSTER_EVENT_WRITE_BUFFER_SIZE": "3"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            event_storage = instance.event_log_storage
+            original_store_event_batch = event_storage.store_event_batch
+
+            def _store_first_event(events):
+                original_store_event_batch(events[:1])
+                raise DagsterEventBatchPartiallyStoredError(
+                    "failed", unstored_events=list(events[1:])
+                )
+
+            with patch.object(event_storage, "store_event_batch", side_effect=_store_first_event):
+                instance.report_engine_event("one", run)
+                instance.report_engine_event("two", run)
+                instance.report_engine_event("three", run)
+
+            # only the events that were not stored are retried
+            assert [event.message for event in instance.all_logs(run.run_id)] == [
+                "one",
+                "two",
+                "three",
+            ]
+
+
+def test_event_write_buffer_keeps_unstored_events():
+    with environ(
+        {
+            "DAGSTER_EVENT_WRITE_BUFFER_SIZE": "100",
+            "DAGSTER_EVENT_WRITE_BUFFER_FLUSH_INTERVAL_SECONDS": "1000",
+        }
+    ):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            received = []
+            instance.add_event_listener(run.run_id, received.append)
+            event_storage = instance.event_log_storage
+            original_store_event = event_storage.store_event
+
+            def _store_event_until_second(event):
+                if event.message == "two":
+                    raise Exception("storage unavailable")
+                original_store_event(event)
+
+            instance.report_engine_event("one", run)
+            instance.report_engine_event("two", run)
+            instance.report_engine_event("three", run)
+            with patch.object(event_storage, "store_event_batch", side_effect=Exception("down")):
+                with patch.object(
+                    event_storage, "store_event", side_effect=_store_event_until_second
+                ):
+                    with pytest.raises(DagsterEventBatchPartiallyStoredError):
+                        instance.flush_event_write_buffer()
+
+            # the stored event is delivered, and the unstored events stay in the buffer
+            assert [event.message for event in instance.all_logs(run.run_id)] == ["one"]
+            assert [event.message for event in received] == ["one"]
+
+            instance.report_engine_event("four", run)
+            instance.flush_event_write_buffer()
+            assert [event.message for event in instance.all_logs(run.run_id)] == [
+                "one",
+                "two",
+                "three",
+                "four",
+            ]
+            assert [event.message for event in received] == ["one", "two", "three", "four"]
+
+
 @op
 def noop_op(_):
     pass
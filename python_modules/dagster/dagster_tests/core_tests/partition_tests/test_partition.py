@@ -1,3 +1,4 @@
+import json
 import re
 from typing import Sequence
 
@@ -15,8 +16,10 @@
     job,
 )
 from dagster._check import CheckError
+from dagster._core.definitions.partition import DefaultPartitionsSubset, StaticPartitionsSubset
+from dagster._core.errors import DagsterInvalidDeserializationVersionError
 from dagster._core.test_utils import instance_for_test
-from dagster._serdes import serialize_value
+from dagster._serdes import deserialize_value, serialize_value
 
 
 @pytest.mark.parametrize(
@@ -164,6 +167,86 @@ def test_static_partitions_subset_identical_serialization():
     assert serialize_value(in_order_subset) == serialize_value(reverse_order_subset)
 
 
+def test_static_partitions_subset_operations():
+    partitions = StaticPartitionsDefinition([str(i) for i in range(100)])
+    keys_1 = {str(i) for i in range(0, 60)}
+    keys_2 = {str(i) for i in range(0, 100, 3)}
+
+    subset_1 = partitions.subset_with_partition_keys(keys_1)
+    subset_2 = partitions.subset_with_partition_keys(keys_2)
+    assert isinstance(subset_1, StaticPartitionsSubset)
+    assert subset_1 == DefaultPartitionsSubset(keys_1)
+    assert DefaultPartitionsSubset(keys_1) == subset_1
+
+    assert set((subset_1 | subset_2).get_partition_keys()) == keys_1 | keys_2
+    assert set((subset_1 & subset_2).get_partition_keys()) == keys_1 & keys_2
+    assert set((subset_1 - subset_2).get_partition_keys()) == keys_1 - keys_2
+    assert len(subset_1 | subset_2) == len(keys_1 | keys_2)
+    assert set((subset_1 - DefaultPartitionsSubset(keys_2)).get_partition_keys()) == (
+        keys_1 - keys_2
+    )
+
+    assert subset_1.get_partition_key_ranges(partitions) == [PartitionKeyRange("0", "59")]
+    assert (subset_2 - subset_1).get_partition_key_ranges(partitions)[0] == PartitionKeyRange(
+        "60", "60"
+    )
+
+    # keys that are not in the partitions definition are retained
+    with_unknown_key = subset_1.with_partition_keys(["unknown"])
+    assert "unknown" in with_unknown_key
+    assert len(with_unknown_key) == len(keys_1) + 1
+    assert partitions.deserialize_subset(with_unknown_key.serialize()) == with_unknown_key
+
+
+def test_static_partitions_subset_serialization_backcompat():
+    partitions = StaticPartitionsDefinition([str(i) for i in range(1000)])
+    partition_keys = {str(i) for i in range(0, 1000, 2)}
+    subset = partitions.subset_with_partition_keys(partition_keys)
+
+    # subsets serialized in the previous format can be deserialized
+    for serialized in [
+        DefaultPartitionsSubset(partition_keys).serialize(),
+        json.dumps(sorted(partition_keys)),
+    ]:
+        assert partitions.can_deserialize_subset(
+            serialized,
+            serialized_partitions_def_unique_id=None,
+            serialized_partitions_def_class_name=StaticPartitionsDefinition.__name__,
+        )
+        assert partitions.deserialize_subset(serialized) == subset
+
+    serialized_bitmap = subset.serialize()
+    assert json.loads(serialized_bitmap)["version"] == StaticPartitionsSubset.SERIALIZATION_VERSION
+    assert len(serialized_bitmap) < len(DefaultPartitionsSubset(partition_keys).serialize()) / 5
+    assert partitions.can_deserialize_subset(
+        serialized_bitmap,
+        serialized_partitions_def_unique_id=None,
+        serialized_partitions_def_class_name=StaticPartitionsDefinition.__name__,
+    )
+    assert partitions.deserialize_subset(serialized_bitmap) == subset
+
+    # older versions only understand version 1, and reject bitmaps as an unknown version
+    assert not DefaultPartitionsSubset.can_deserialize(
+        partitions,
+        serialized_bitmap,
+        serialized_partitions_def_unique_id=None,
+        serialized_partitions_def_class_name=None,
+    )
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        DefaultPartitionsSubset.from_serialized(partitions, serialized_bitmap)
+
+    # bitmaps can't be deserialized once the partition keys have changed
+    changed_partitions = StaticPartitionsDefinition([str(i) for i in range(1001)])
+    assert not changed_partitions.can_deserialize_subset(
+        serialized_bitmap,
+        serialized_partitions_def_unique_id=None,
+        serialized_partitions_def_class_name=StaticPartitionsDefinition.__name__,
+    )
+
+    # serdes-serialized subsets use the DefaultPartitionsSubset format
+    assert deserialize_value(serialize_value(subset)) == DefaultPartitionsSubset(partition_keys)
+
+
 def test_static_partitions_invalid_chars():
     with pytest.raises(DagsterInvalidDefinitionError):
         StaticPartitionsDefinition(["foo...bar"])
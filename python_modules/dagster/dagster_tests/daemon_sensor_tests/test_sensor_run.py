@@ -89,7 +89,11 @@
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorTickScheduler,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._seven.compat.pendulum import (
     _IS_PENDULUM_3,
     create_pendulum_time,
@@ -1582,6 +1586,139 @@ def test_custom_interval_sensor(executor, instance, workspace_context, external_
         validate_tick(ticks[0], external_sensor, expected_datetime, TickStatus.SKIPPED)
 
 
+def test_sensor_tick_scheduler(instance, external_repo):
+    freeze_datetime = create_pendulum_time(year=2019, month=2, day=28, tz="UTC")
+    now = freeze_datetime.timestamp()
+
+    always_on_sensor = external_repo.get_external_sensor("always_on_sensor")
+    run_key_sensor = external_repo.get_external_sensor("run_key_sensor")
+    custom_interval_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+    sensors = {
+        sensor.selector_id: sensor
+        for sensor in [always_on_sensor, run_key_sensor, custom_interval_sensor]
+    }
+    location_names = {
+        always_on_sensor.selector_id: "location_a",
+        run_key_sensor.selector_id: "location_a",
+        custom_interval_sensor.selector_id: "location_b",
+    }
+
+    with pendulum_freeze_time(freeze_datetime):
+        instance.start_sensor(custom_interval_sensor)
+    custom_interval_state = instance.get_instigator_state(
+        custom_interval_sensor.get_external_origin_id(), custom_interval_sensor.selector_id
+    )
+    custom_interval_state = custom_interval_state.with_data(
+        custom_interval_state.instigator_data._replace(last_tick_start_timestamp=now)
+    )
+
+    scheduler = SensorTickScheduler()
+    scheduler.update_sensors(sensors, {custom_interval_sensor.selector_id: custom_interval_state})
+
+    # sensors that have never ticked are due immediately, and the custom interval sensor is due
+    # one minimum interval after its last tick
+    assert scheduler.pop_due_selector_ids(now, location_names) == [
+        always_on_sensor.selector_id,
+        run_key_sensor.selector_id,
+    ]
+    assert scheduler.pop_due_selector_ids(now + 59, location_names) == []
+
+    scheduler.schedule(always_on_sensor.selector_id, now + 30)
+    scheduler.schedule(run_key_sensor.selector_id, now + 30)
+
+    # due sensors are interleaved across code locations
+    assert scheduler.pop_due_selector_ids(now + 65, location_names) == [
+        always_on_sensor.selector_id,
+        custom_interval_sensor.selector_id,
+        run_key_sensor.selector_id,
+    ]
+    assert scheduler.last_tick_lag_by_selector_id == {
+        always_on_sensor.selector_id: 35,
+        run_key_sensor.selector_id: 35,
+        custom_interval_sensor.selector_id: 5,
+    }
+
+    # rescheduling a sensor replaces its previous due time
+    scheduler.schedule(always_on_sensor.selector_id, now + 90)
+    scheduler.schedule(always_on_sensor.selector_id, now + 120)
+    scheduler.schedule(run_key_sensor.selector_id, now + 90)
+    assert scheduler.pop_due_selector_ids(now + 100, location_names) == [run_key_sensor.selector_id]
+
+    # sensors that are no longer running are no longer tracked
+    scheduler.update_sensors({run_key_sensor.selector_id: run_key_sensor}, {})
+    assert scheduler.pop_due_selector_ids(now + 200, location_names) == [run_key_sensor.selector_id]
+    assert scheduler.last_tick_lag_by_selector_id.keys() == {run_key_sensor.selector_id}
+
+    # the running sensors are refreshed when the workspace changes or the refresh interval passes
+    scheduler.refresh(now, {"location_a": now, "location_b": now}, sensors, {})
+    assert scheduler.sensors == sensors
+    assert scheduler.location_name_by_selector_id == {
+        selector_id: sensor.handle.location_name for selector_id, sensor in sensors.items()
+    }
+    assert not scheduler.needs_refresh(now + 29, {"location_a": now, "location_b": now})
+    assert scheduler.needs_refresh(now + 29, {"location_a": now + 1, "location_b": now})
+    assert scheduler.needs_refresh(now + 29, {"location_a": now})
+    assert scheduler.needs_refresh(now + 30, {"location_a": now, "location_b": now})
+
+
+def test_sensor_tick_scheduler_refresh(executor, instance, workspace_context, external_repo):
+    freeze_datetime = create_pendulum_time(year=2019, month=2, day=28, tz="UTC")
+    external_sensor = external_repo.get_external_sensor("always_on_sensor")
+    scheduler = SensorTickScheduler()
+
+    def _evaluate_sensors():
+        futures = {}
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                get_default_daemon_logger("SensorDaemon"),
+                threadpool_executor=executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=futures,
+                sensor_tick_scheduler=scheduler,
+            )
+        )
+        wait_for_futures(futures)
+
+    def _get_ticks():
+        return instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+
+    with mock.patch(
+        "dagster._daemon.sensor.SENSOR_STATE_REFRESH_INTERVAL_SECONDS", 120
+    ), mock.patch.object(
+        instance, "all_instigator_state", wraps=instance.all_instigator_state
+    ) as all_instigator_state_mock:
+        with pendulum_freeze_time(freeze_datetime):
+            instance.start_sensor(external_sensor)
+            _evaluate_sensors()
+            assert len(_get_ticks()) == 1
+            assert all_instigator_state_mock.call_count == 1
+            assert scheduler.sensors.keys() == {external_sensor.selector_id}
+
+        # the states of all sensors are not reloaded until the refresh interval has passed
+        with pendulum_freeze_time(freeze_datetime.add(seconds=30)):
+            _evaluate_sensors()
+            assert len(_get_ticks()) == 2
+            assert all_instigator_state_mock.call_count == 1
+
+        # sensors that were stopped since the last refresh are not evaluated when they are due
+        instance.stop_sensor(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id, external_sensor
+        )
+        with pendulum_freeze_time(freeze_datetime.add(seconds=60)):
+            _evaluate_sensors()
+            assert len(_get_ticks()) == 2
+            assert all_instigator_state_mock.call_count == 1
+
+        with pendulum_freeze_time(freeze_datetime.add(seconds=120)):
+            _evaluate_sensors()
+            assert len(_get_ticks()) == 2
+            assert all_instigator_state_mock.call_count == 2
+            assert scheduler.sensors == {}
+
+
 def test_sensor_spans(workspace_context):
     loop = execute_sensor_iteration_loop(
         workspace_context,
@@ -1070,16 +1070,28 @@ def test_asset_backfill_submit_runs_in_chunks(
     assert backfill
     assert backfill.status == BulkActionStatus.REQUESTED
 
-    assert all(
-        not error
-        for error in list(
-            execute_backfill_iteration(
-                workspace_context, get_default_daemon_logger("BackfillDaemon")
+    with mock.patch.object(
+        instance, "create_runs_from_template", wraps=instance.create_runs_from_template
+    ) as create_runs_from_template_mock:
+        assert all(
+            not error
+            for error in list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
             )
         )
-    )
 
     assert instance.get_runs_count() == num_partitions
+    # in each chunk, the first run is created from scratch and the rest are copied from it in bulk
+    chunk_sizes = [
+        min(RUN_CHUNK_SIZE, num_partitions - chunk_start)
+        for chunk_start in range(0, num_partitions, RUN_CHUNK_SIZE)
+    ]
+    assert [
+        len(call.kwargs["run_ids_and_tags"])
+        for call in create_runs_from_template_mock.call_args_list
+    ] == [chunk_size - 1 for chunk_size in chunk_sizes if chunk_size > 1]
 
 
 def test_asset_backfill_mid_iteration_cancel(
@@ -53,6 +53,33 @@ def sort_run_request_key_fn(run_request):
         assert run_request.partition_key == expected_run_request.partition_key
 
 
+@pytest.mark.parametrize(
+    "scenario",
+    list(ASSET_RECONCILIATION_SCENARIOS.values()),
+    ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
+)
+def test_reconciliation_parallel_evaluation(scenario):
+    if scenario.requires_respect_materialization_data_versions:
+        pytest.skip("requires respect_materialization_data_versions to be True")
+
+    run_requests, _, evaluations = scenario.do_sensor_scenario(DagsterInstance.ephemeral())
+    parallel_run_requests, _, parallel_evaluations = scenario.do_sensor_scenario(
+        DagsterInstance.ephemeral(), max_evaluation_workers=4
+    )
+
+    # evaluating independent assets in parallel produces the same results in the same order
+    assert [
+        (sorted(run_request.asset_selection), run_request.partition_key)
+        for run_request in parallel_run_requests
+    ] == [
+        (sorted(run_request.asset_selection), run_request.partition_key)
+        for run_request in run_requests
+    ]
+    assert [
+        (evaluation.asset_key, evaluation.true_subset) for evaluation in parallel_evaluations
+    ] == [(evaluation.asset_key, evaluation.true_subset) for evaluation in evaluations]
+
+
 @pytest.mark.parametrize(
     "scenario",
     [ASSET_RECONCILIATION_SCENARIOS["freshness_complex_subsettable"]],
@@ -22,7 +22,11 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster._core.storage.tags import get_multidimensional_partition_tag
@@ -466,6 +470,122 @@ def test_get_num_partitions():
     )
 
 
+def test_partition_keys_sequence():
+    static_keys = ["a", "b", "c", "d"]
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-02-01")
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": daily_partitions_def,
+            "static": StaticPartitionsDefinition(static_keys),
+        }
+    )
+    partition_keys = multipartitions_def.get_partition_keys()
+    expected_partition_keys = [
+        MultiPartitionKey({"date": date_key, "static": static_key})
+        for date_key in daily_partitions_def.get_partition_keys()
+        for static_key in static_keys
+    ]
+
+    assert len(partition_keys) == len(expected_partition_keys) == 31 * 4
+    assert list(partition_keys) == expected_partition_keys
+    assert [partition_keys[i] for i in range(len(partition_keys))] == expected_partition_keys
+    assert partition_keys[-1] == expected_partition_keys[-1]
+    assert partition_keys[5:9] == expected_partition_keys[5:9]
+    assert partition_keys[-1].keys_by_dimension == {"date": "2015-01-31", "static": "d"}
+    assert MultiPartitionKey({"date": "2015-01-10", "static": "c"}) in partition_keys
+    assert "2015-01-10|c" in partition_keys
+    assert "2015-02-01|c" not in partition_keys
+    assert "2015-01-10" not in partition_keys
+
+    with pytest.raises(IndexError):
+        partition_keys[len(expected_partition_keys)]
+
+
+def test_multipartitions_subset_operations():
+    static_keys = ["a", "b", "c", "d"]
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-01-11")
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": daily_partitions_def,
+            "static": StaticPartitionsDefinition(static_keys),
+        }
+    )
+    all_keys = set(multipartitions_def.get_partition_keys())
+    keys_1 = {key for key in all_keys if key.keys_by_dimension["date"] < "2015-01-06"}
+    keys_2 = {key for key in all_keys if key.keys_by_dimension["static"] in {"a", "b"}}
+
+    all_subset = multipartitions_def.subset_with_all_partitions()
+    assert len(all_subset) == len(all_keys) == 40
+    assert set(all_subset.get_partition_keys()) == all_keys
+    assert all(key in all_subset for key in all_keys)
+
+    subset_1 = all_subset.empty_subset().with_partition_keys(keys_1)
+    subset_2 = all_subset - multipartitions_def.empty_subset().with_partition_keys(
+        all_keys - keys_2
+    )
+    assert subset_1 == multipartitions_def.empty_subset().with_partition_keys(keys_1)
+    assert multipartitions_def.empty_subset().with_partition_keys(keys_2) == subset_2
+    # the five dates of subset_1 share the same static keys, so they merge into one product
+    assert len(subset_1.products) == 1
+    assert len(subset_2.products) == 1
+    with pytest.raises(TypeError):
+        hash(subset_1)
+
+    assert set((subset_1 | subset_2).get_partition_keys()) == keys_1 | keys_2
+    assert set((subset_1 & subset_2).get_partition_keys()) == keys_1 & keys_2
+    assert set((subset_1 - subset_2).get_partition_keys()) == keys_1 - keys_2
+    assert len(subset_1 | subset_2) == len(keys_1 | keys_2)
+    assert len(all_subset - subset_1 - subset_2) == len(all_keys - keys_1 - keys_2)
+    assert set(subset_1.get_partition_keys_not_in_subset(multipartitions_def)) == (
+        all_keys - keys_1
+    )
+
+    default_subset_2 = multipartitions_def.empty_subset().with_partition_keys(keys_2)
+    assert set((default_subset_2 | subset_1).get_partition_keys()) == keys_1 | keys_2
+    assert set((default_subset_2 & subset_1).get_partition_keys()) == keys_1 & keys_2
+    assert set((default_subset_2 - subset_1).get_partition_keys()) == keys_2 - keys_1
+
+    assert multipartitions_def.deserialize_subset(
+        (subset_1 | subset_2).serialize()
+    ).get_partition_keys() == (keys_1 | keys_2)
+
+
+def test_multipartitions_subset_scattered_keys():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2020-01-01", end_date="2024-01-01"),
+            "static": StaticPartitionsDefinition([f"key_{i}" for i in range(200)]),
+        }
+    )
+    partition_keys = multipartitions_def.get_partition_keys()
+    keys_1 = {partition_keys[i] for i in range(0, len(partition_keys), 97)}
+    keys_2 = {partition_keys[i] for i in range(0, len(partition_keys), 89)}
+
+    all_subset = multipartitions_def.subset_with_all_partitions()
+    subset_1 = all_subset.empty_subset().with_partition_keys(keys_1)
+    subset_2 = all_subset.empty_subset().with_partition_keys(keys_2)
+    remaining_subset = all_subset - subset_1
+
+    assert len(remaining_subset) == len(partition_keys) - len(keys_1)
+    assert not any(key in remaining_subset for key in keys_1)
+    assert set((subset_1 | subset_2).get_partition_keys()) == keys_1 | keys_2
+    assert set((subset_1 & subset_2).get_partition_keys()) == keys_1 & keys_2
+    assert len(remaining_subset | subset_1) == len(partition_keys)
+
+    assert isinstance(remaining_subset, MultiPartitionsSubset)
+
+    # keys that share no partitions of either dimension are stored as plain keys
+    diagonal_keys = {
+        MultiPartitionKey({"date": "2020-01-01", "static": "key_0"}),
+        MultiPartitionKey({"date": "2020-01-02", "static": "key_1"}),
+    }
+    diagonal_subset = all_subset.empty_subset().with_partition_keys(diagonal_keys)
+    assert isinstance(diagonal_subset, DefaultPartitionsSubset)
+    assert set((all_subset - diagonal_subset).get_partition_keys()) == (
+        set(partition_keys) - diagonal_keys
+    )
+
+
 def test_dynamic_dimension_in_multipartitioned_asset():
     multipartitions_def = MultiPartitionsDefinition(
         {
@@ -1,8 +1,9 @@
 import pickle
 import random
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import NamedTuple, Optional, Sequence, cast
 
+import dagster._check as check
 import pendulum.parser
 import pytest
 from dagster import (
@@ -1229,6 +1230,100 @@ def my_partitioned_config_2(_start, _end):
     )
 
 
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2021-05-05-01:00", minute_offset=15),
+        HourlyPartitionsDefinition(start_date="2021-05-05-01:00", end_offset=2),
+        HourlyPartitionsDefinition(start_date="2021-05-05-01:00", end_date="2021-05-07-05:00"),
+        DailyPartitionsDefinition(start_date="2021-05-01", end_offset=-2),
+        DailyPartitionsDefinition(start_date="2021-05-01", hour_offset=7, end_offset=1),
+        WeeklyPartitionsDefinition(start_date="2021-05-01", day_offset=3),
+        TimeWindowPartitionsDefinition(
+            start="2021-05-05-01:00", fmt="%Y-%m-%d-%H:%M", cron_schedule="*/15 * * * *"
+        ),
+        HourlyPartitionsDefinition(start_date="2021-03-13-01:00", timezone="US/Central"),
+        DailyPartitionsDefinition(start_date="2020-10-01", timezone="US/Central"),
+        DailyPartitionsDefinition(
+            start_date="2021-03-01", hour_offset=2, minute_offset=30, timezone="America/New_York"
+        ),
+        WeeklyPartitionsDefinition(start_date="2020-10-01", timezone="Europe/London"),
+    ],
+)
+def test_fixed_cadence_partitions(partitions_def: TimeWindowPartitionsDefinition):
+    assert partitions_def.has_fixed_cadence
+    current_time = datetime.strptime("2021-06-20-03:20", "%Y-%m-%d-%H:%M")
+    partition_keys = partitions_def.get_partition_keys(current_time)
+
+    assert partitions_def.get_num_partitions(current_time) == len(partition_keys)
+    for start_idx, end_idx in [
+        (0, 3),
+        (50, 53),
+        (len(partition_keys) - 2, len(partition_keys) + 2),
+    ]:
+        assert (
+            partitions_def.get_partition_keys_between_indexes(
+                start_idx, end_idx, current_time=current_time
+            )
+            == partition_keys[start_idx:end_idx]
+        )
+
+    last_partition_window = check.not_none(partitions_def.get_last_partition_window(current_time))
+    assert (
+        partitions_def.get_partition_key_for_timestamp(last_partition_window.start.timestamp())
+        == partition_keys[-1]
+    )
+    assert (
+        partitions_def.get_partition_key_for_timestamp(
+            last_partition_window.start.timestamp(), end_closed=True
+        )
+        == partition_keys[-2]
+    )
+    assert partitions_def.has_partition_key(partition_keys[-1], current_time=current_time)
+
+    subset = partitions_def.empty_subset().with_partition_keys(
+        partition_keys[10:20] + partition_keys[30:31]
+    )
+    assert TimeWindowPartitionsSubset(
+        partitions_def, num_partitions=None, included_time_windows=subset.included_time_windows
+    ).num_partitions == len(subset.get_partition_keys())
+
+
+def test_fixed_cadence_partitions_non_utc_timezone():
+    assert (
+        HourlyPartitionsDefinition(
+            start_date="2021-05-05-01:00", timezone="US/Central"
+        ).fixed_cadence_period_seconds
+        == 60 * 60
+    )
+
+    # daily time windows that span a daylight savings time transition are 23 or 25 hours long
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2021-03-01", timezone="US/Central")
+    assert daily_partitions_def.fixed_cadence_period_seconds is None
+    assert daily_partitions_def.fixed_cadence_period_days == 1
+    assert daily_partitions_def.get_num_partitions_in_time_window(
+        time_window("2021-03-13T12:00:00", "2021-03-15T00:00:00")
+    ) == len(
+        daily_partitions_def.get_partition_keys_in_time_window(
+            time_window("2021-03-13T12:00:00", "2021-03-15T00:00:00")
+        )
+    )
+    dst_time_window = daily_partitions_def.get_last_partition_window(
+        pendulum.datetime(2021, 3, 15, 12, tz="US/Central")
+    )
+    assert dst_time_window == daily_partitions_def.time_window_for_partition_key("2021-03-14")
+    assert dst_time_window.end - dst_time_window.start == timedelta(hours=23)
+    assert (
+        daily_partitions_def.get_partition_key_for_timestamp(
+            pendulum.datetime(2021, 3, 14, 23, 30, tz="US/Central").timestamp()
+        )
+        == "2021-03-14"
+    )
+
+    assert MonthlyPartitionsDefinition(start_date="2021-05-01").fixed_cadence_period_seconds is None
+    assert not MonthlyPartitionsDefinition(start_date="2021-05-01").has_fixed_cadence
+
+
 def test_get_first_partition_window():
     assert DailyPartitionsDefinition(
         start_date="2023-01-01"
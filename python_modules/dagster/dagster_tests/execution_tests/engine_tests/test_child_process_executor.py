@@ -10,7 +10,9 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    wait_for_child_process_events,
 )
 from dagster._utils import segfault
 
@@ -44,6 +46,11 @@ def execute(self):
         segfault()
 
 
+class PidCommand(ChildProcessCommand):
+    def execute(self):
+        yield os.getpid()
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):
         time.sleep(0.5)
@@ -77,6 +84,23 @@ def test_basic_child_process_command_with_process_events():
     assert events[2].pid == child_pid
 
 
+def test_child_process_command_wait_handles():
+    wait_handles = []
+    events = []
+    for event in execute_child_process_command(
+        multiprocessing, DoubleAStringChildProcessCommand("aa"), wait_handles
+    ):
+        if event is None:
+            assert len(wait_handles) == 2
+            wait_for_child_process_events(wait_handles, timeout=5)
+        else:
+            events.append(event)
+
+    assert wait_handles == []
+    assert "aaaa" in events
+    assert isinstance(events[-1], ChildProcessDoneEvent)
+
+
 def test_child_process_uncaught_exception():
     results = list(
         filter(
@@ -105,3 +129,77 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def _command_results(events):
+    return [event for event in events if event and not isinstance(event, ChildProcessEvent)]
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=2) as pool:
+        pids = set()
+        for _ in range(3):
+            worker = pool.acquire()
+            pids.update(_command_results(worker.execute(PidCommand())))
+
+        assert len(pids) == 1
+        assert os.getpid() not in pids
+
+        worker = pool.acquire()
+        assert _command_results(worker.execute(DoubleAStringChildProcessCommand("aa"))) == ["aaaa"]
+
+
+def test_worker_pool_wait_handles():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        wait_handles = []
+        events = []
+        for event in pool.acquire().execute(DoubleAStringChildProcessCommand("aa"), wait_handles):
+            if event is None:
+                wait_for_child_process_events(wait_handles, timeout=5)
+            else:
+                events.append(event)
+
+        assert wait_handles == []
+        assert _command_results(events) == ["aaaa"]
+
+
+def test_worker_pool_recycles_workers():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1, max_commands_per_worker=2) as pool:
+        pids = []
+        for _ in range(4):
+            worker = pool.acquire()
+            pids.extend(_command_results(worker.execute(PidCommand())))
+
+        assert pids[0] == pids[1]
+        assert pids[2] == pids[3]
+        assert pids[0] != pids[2]
+
+
+def test_worker_pool_uncaught_exception():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        worker = pool.acquire()
+        results = [
+            event
+            for event in worker.execute(ThrowAnErrorCommand())
+            if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        assert len(results) == 1
+        assert "AnError" in str(results[0].error_info.message)
+
+        # the worker survives errors raised by commands
+        assert _command_results(pool.acquire().execute(DoubleAStringChildProcessCommand("b"))) == [
+            "bb"
+        ]
+
+
+def test_worker_pool_crashy_process():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        worker = pool.acquire()
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(worker.execute(CrashyCommand()))
+        assert exc.value.exit_code == 1
+
+        # a crashed worker is replaced by a new one
+        assert _command_results(pool.acquire().execute(DoubleAStringChildProcessCommand("c"))) == [
+            "cc"
+        ]
@@ -62,6 +62,23 @@ def test_diamond_multi_execution():
             assert result.output_for_node("adder") == 11
 
 
+def test_step_dispatch_latency_metadata():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(recon_job, instance=instance) as result:
+            assert result.success
+            exit_event = next(
+                event
+                for event in result.all_events
+                if event.event_type == DagsterEventType.ENGINE_EVENT
+                and "parent process exiting" in (event.message or "")
+            )
+            metadata = exit_event.engine_event_data.metadata
+            latencies = metadata["step_dispatch_latency_ms"].value
+            assert set(latencies.keys()) == {"return_two", "add_three", "mult_three", "adder"}
+            assert metadata["max_step_dispatch_latency_ms"].value == max(latencies.values())
+
+
 def test_explicit_spawn():
     with instance_for_test() as instance:
         recon_job = reconstructable(define_diamond_job)
@@ -110,6 +127,52 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def _worker_pids(result) -> set:
+    return {
+        event.engine_event_data.metadata["pid"].text
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 2, "worker_pool": {}}}},
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            # four steps, but at most two worker processes
+            assert 1 <= len(_worker_pids(result)) <= 2
+
+
+def test_worker_pool_recycling():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            assert len(_worker_pids(result)) == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -443,6 +506,21 @@ def test_crash_multiprocessing():
             # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @op
 def segfault_op(context):
@@ -94,7 +94,11 @@ def write_a_file_job():
 
 
 @pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize(
+    "multiprocess_config",
+    [{"max_concurrent": 4}, {"max_concurrent": 4, "worker_pool": {}}],
+)
+def test_interrupt_multiproc(multiprocess_config):
     with tempfile.TemporaryDirectory() as tempdir:
         with instance_for_test(temp_dir=tempdir) as instance:
             file_1 = os.path.join(tempdir, "file_1")
@@ -117,7 +121,7 @@ def test_interrupt_multiproc():
                         "write_3": {"config": {"tempfile": file_3}},
                         "write_4": {"config": {"tempfile": file_4}},
                     },
-                    "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+                    "execution": {"config": {"multiprocess": multiprocess_config}},
                 },
                 instance=instance,
             ) as result:
@@ -1288,3 +1288,22 @@ def test_known_execution_state_step_output_version_serialization() -> None:
     ]
 
     assert deserialize_value(serialized, KnownExecutionState) == known_state
+
+
+def test_add_run_partition_index():
+    src_dir = file_relative_path(__file__, "snapshot_0_14_16_bulk_actions_columns/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+        assert "idx_runs_by_partition" not in get_sqlite3_indexes(db_path, "runs")
+        assert "idx_run_partitions" in get_sqlite3_indexes(db_path, "runs")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            instance.upgrade()
+            assert "idx_runs_by_partition" in get_sqlite3_indexes(db_path, "runs")
+            assert "idx_run_partitions" not in get_sqlite3_indexes(db_path, "runs")
+
+            instance._run_storage._alembic_downgrade(rev="7f2b1c9e4d5a")
+            assert get_current_alembic_version(db_path) == "7f2b1c9e4d5a"
+            assert "idx_runs_by_partition" not in get_sqlite3_indexes(db_path, "runs")
+            assert "idx_run_partitions" in get_sqlite3_indexes(db_path, "runs")
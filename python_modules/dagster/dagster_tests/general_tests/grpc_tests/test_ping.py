@@ -9,11 +9,13 @@
 
 import dagster._check as check
 import dagster._seven as seven
+import grpc
 import pytest
 from dagster._core.errors import DagsterUserCodeUnreachableError
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._core.utils import FuturesAwareThreadPoolExecutor
 from dagster._grpc import DagsterGrpcClient, DagsterGrpcServer, ephemeral_grpc_api_client
+from dagster._grpc.client import _close_evicted_channel
 from dagster._grpc.server import (
     DagsterCodeServerUtilizationMetrics,
     GrpcServerProcess,
@@ -21,6 +23,7 @@
 )
 from dagster._serdes.ipc import interrupt_ipc_subprocess_pid
 from dagster._utils import find_free_port, safe_tempfile_path
+from dagster._utils.lru_cache import LRUCache
 
 
 def _cleanup_process(process):
@@ -255,3 +258,85 @@ def test_ping_metrics_retrieval():
             )
         finally:
             _cleanup_process(server_process)
+
+
+def test_channel_reused_and_reconnected_after_server_restart():
+    port = find_free_port()
+    with instance_for_test() as instance:
+        server_process = open_server_process(instance.get_ref(), port=port, socket=None)
+        try:
+            api_client = DagsterGrpcClient(port=port)
+            with api_client._channel() as channel:  # noqa: SLF001
+                pass
+            server_id_one = DagsterGrpcClient(port=port).get_server_id()
+            with api_client._channel() as same_channel:  # noqa: SLF001
+                assert same_channel is channel
+        finally:
+            _cleanup_process(server_process)
+
+        seven.wait_for_process(server_process, timeout=5)
+        with pytest.raises(DagsterUserCodeUnreachableError):
+            api_client.get_server_id()
+
+        server_process = open_server_process(instance.get_ref(), port=port, socket=None)
+        try:
+            server_id_two = api_client.get_server_id()
+            assert server_id_two != server_id_one
+            with api_client._channel() as new_channel:  # noqa: SLF001
+                assert new_channel is not channel
+        finally:
+            _cleanup_process(server_process)
+
+
+def test_client_compression():
+    assert DagsterGrpcClient(port=find_free_port()).compression == grpc.Compression.Gzip
+    assert (
+        DagsterGrpcClient(
+            port=find_free_port(), compression=grpc.Compression.NoCompression
+        ).compression
+        == grpc.Compression.NoCompression
+    )
+    with environ({"DAGSTER_GRPC_COMPRESSION": "none"}):
+        assert DagsterGrpcClient(port=find_free_port()).compression == (
+            grpc.Compression.NoCompression
+        )
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Unix-only test")
+def test_client_socket_compression():
+    with safe_tempfile_path() as skt:
+        assert DagsterGrpcClient(socket=skt).compression == grpc.Compression.NoCompression
+        with environ({"DAGSTER_GRPC_COMPRESSION": "gzip"}):
+            assert DagsterGrpcClient(socket=skt).compression == grpc.Compression.Gzip
+
+
+class _UnavailableError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+def test_channel_pool_closes_removed_channels():
+    with mock.patch(
+        "dagster._grpc.client._channel_pool", LRUCache(1, on_evict=_close_evicted_channel)
+    ), mock.patch.object(
+        DagsterGrpcClient, "_create_channel", side_effect=lambda: mock.MagicMock()
+    ):
+        client_one = DagsterGrpcClient(port=find_free_port())
+        client_two = DagsterGrpcClient(port=find_free_port())
+
+        with client_one._channel() as channel_one:  # noqa: SLF001
+            # evicts the first channel while a call is still using it
+            with client_two._channel() as channel_two:  # noqa: SLF001
+                pass
+            channel_one.close.assert_not_called()
+        channel_one.close.assert_called_once()
+        channel_two.close.assert_not_called()
+
+        with pytest.raises(_UnavailableError):
+            with client_two._channel():  # noqa: SLF001
+                raise _UnavailableError()
+        channel_two.close.assert_called_once()
+
+        with client_two._channel() as new_channel:  # noqa: SLF001
+            assert new_channel is not channel_two
+        new_channel.close.assert_not_called()
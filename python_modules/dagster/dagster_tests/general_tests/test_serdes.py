@@ -569,6 +569,40 @@ class Foo(NamedTuple):
     assert deserialized == val
 
 
+def test_named_tuple_combined_field_options() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_field_names={"colors": "colours"},
+        field_serializers={"colors": SetToSequenceFieldSerializer},
+        skip_when_empty_fields={"colors", "shape"},
+    )
+    class Foo(NamedTuple):
+        name: str
+        colors: Optional[AbstractSet[str]] = None
+        shape: Optional[str] = None
+
+    val = Foo("a", {"red", "green"}, "round")
+    serialized = serialize_value(val, whitelist_map=test_env)
+    assert (
+        serialized
+        == '{"__class__": "Foo", "colours": ["green", "red"], "name": "a", "shape": "round"}'
+    )
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+
+    empty_val = Foo("b")
+    serialized = serialize_value(empty_val, whitelist_map=test_env)
+    assert serialized == '{"__class__": "Foo", "name": "b"}'
+    assert deserialize_value(serialized, whitelist_map=test_env) == empty_val
+
+    # stored values are loaded under either the storage name or the field name, and unknown fields
+    # are ignored
+    assert deserialize_value(
+        '{"__class__": "Foo", "name": "c", "colors": ["red"], "size": 3}', whitelist_map=test_env
+    ) == Foo("c", {"red"})
+
+
 def test_named_tuple_skip_when_empty_fields() -> None:
     test_map = WhitelistMap.create()
 
@@ -0,0 +1,79 @@
+import pytest
+from dagster._check import CheckError
+from dagster._utils.lru_cache import LRUCache
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    assert cache.get("a") is None
+    assert cache.hit_rate == 0.0
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is the least recently used entry
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    assert cache.hits == 3
+    assert cache.misses == 1
+    assert cache.evictions == 1
+    assert cache.hit_rate == 0.75
+
+    cache.discard("a")
+    assert "a" not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_max_weight():
+    cache: LRUCache[str, str] = LRUCache(max_size=10, max_weight=10)
+    cache.set("a", "a", weight=4)
+    cache.set("b", "b", weight=4)
+    assert cache.total_weight == 8
+
+    cache.set("c", "c", weight=4)
+    assert "a" not in cache
+    assert cache.total_weight == 8
+
+    # replacing an entry replaces its weight
+    cache.set("b", "b", weight=1)
+    assert cache.total_weight == 5
+
+    # entries heavier than the max weight are not added, and don't evict other entries
+    cache.set("d", "d", weight=11)
+    assert "d" not in cache
+    assert len(cache) == 2
+    assert cache.total_weight == 5
+    assert cache.evictions == 1
+
+    # an oversized entry removes the earlier entry for its key
+    cache.set("c", "c2", weight=11)
+    assert "c" not in cache
+    assert len(cache) == 1
+    assert cache.total_weight == 1
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(CheckError):
+        LRUCache(max_size=0)
+
+
+def test_lru_cache_on_evict():
+    evicted = []
+    cache: LRUCache[str, int] = LRUCache(
+        max_size=2, on_evict=lambda key, value: evicted.append((key, value))
+    )
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert evicted == [("a", 1)]
+
+    # entries that are removed explicitly are not reported as evicted
+    cache.discard("b")
+    cache.clear()
+    assert evicted == [("a", 1)]
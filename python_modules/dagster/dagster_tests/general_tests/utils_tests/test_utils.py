@@ -2,7 +2,15 @@
 
 import pytest
 from dagster._check import CheckError, ParameterCheckError
-from dagster._utils import EventGenerationManager, ensure_dir, ensure_gen, ensure_single_item
+from dagster._utils import (
+    EventGenerationManager,
+    ensure_dir,
+    ensure_gen,
+    ensure_single_item,
+    traced,
+    traced_counter,
+    traced_counter_scope,
+)
 
 
 def test_ensure_single_item():
@@ -56,3 +64,22 @@ def basic_generator():
     assert result == 2
     teardown_events = list(basic_manager.generate_teardown_events())
     assert teardown_events == ["C"]
+
+
+def test_traced_counter_scope():
+    @traced
+    def query():
+        pass
+
+    assert traced_counter.get() is None
+    with traced_counter_scope() as outer_counter:
+        query()
+        with traced_counter_scope() as inner_counter:
+            query()
+            query()
+        assert traced_counter.get() is outer_counter
+        query()
+
+    assert traced_counter.get() is None
+    assert inner_counter.counts() == {query.__qualname__: 2}
+    assert outer_counter.counts() == {query.__qualname__: 2}
@@ -1,3 +1,4 @@
+import json
 import time
 
 from dagster import (
@@ -15,6 +16,7 @@
     define_asset_job,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import HourlyPartitionsDefinition
 from dagster._core.events import (
     AssetMaterializationPlannedData,
@@ -30,6 +32,7 @@
 )
 from dagster._core.test_utils import create_run_for_test, instance_for_test
 from dagster._core.utils import make_new_run_id
+from dagster._serdes import serialize_value
 from dagster._utils import Counter, traced_counter
 
 from .utils.event_log_storage import (
@@ -209,6 +212,104 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
         )
 
 
+def test_cached_partition_status_incremental_update():
+    partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_job = define_asset_job("asset_job").resolve(asset_graph=AssetGraph.from_assets([asset1]))
+
+    with instance_for_test() as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+
+        # no new events, so the stored value is returned without querying for new materializations
+        traced_counter.set(Counter())
+        assert (
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+            == cached_status
+        )
+        assert (
+            traced_counter.get().counts().get("DagsterInstance.get_materialized_partitions") is None
+        )
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+        updated_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, partitions_def
+        )
+        assert updated_status
+        assert updated_status.latest_storage_id > cached_status.latest_storage_id
+        assert set(
+            updated_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02"}
+        # unchanged subsets are stored back without being reserialized
+        assert (
+            updated_status.serialized_failed_partition_subset
+            == cached_status.serialized_failed_partition_subset
+        )
+
+        # the incrementally updated value matches a value built from scratch
+        instance.wipe_asset_cached_status([asset_key])
+        assert (
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+            == updated_status
+        )
+
+
+def test_cached_partition_status_static_partitions_bitmap():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(1000)])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_job = define_asset_job("asset_job").resolve(asset_graph=AssetGraph.from_assets([asset1]))
+
+    with instance_for_test() as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="10")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert cached_status.serialized_materialized_partition_subset
+        assert json.loads(cached_status.serialized_materialized_partition_subset)[
+            "bitmap"
+        ] == format(1 << 10, "x")
+        assert set(
+            cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"10"}
+
+        # values are stored under a new name, which older versions fail to deserialize and rebuild,
+        # and values stored under the previous name can still be read
+        serialized = serialize_value(cached_status)
+        assert '"AssetStatusCacheValueV2"' in serialized
+        assert (
+            AssetStatusCacheValue.from_db_string(
+                serialized.replace('"AssetStatusCacheValueV2"', '"AssetStatusCacheValue"')
+            )
+            == cached_status
+        )
+
+        # subsets cached in the previous format are converted to bitmaps on the next refresh
+        instance.update_asset_cached_status_data(
+            asset_key,
+            cached_status._replace(
+                serialized_materialized_partition_subset=DefaultPartitionsSubset({"10"}).serialize()
+            ),
+        )
+        assert (
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+            == cached_status
+        )
+
+
 def test_multipartition_get_cached_partition_status():
     partitions_def = MultiPartitionsDefinition(
         {
@@ -54,8 +54,17 @@
     PartitionKeysTimeWindowPartitionsSubset,
 )
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
-from dagster._core.errors import DagsterInvalidInvocationError, DagsterInvariantViolationError
-from dagster._core.event_api import EventLogCursor, EventRecordsResult, RunStatusChangeRecordsFilter
+from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
+    DagsterInvalidInvocationError,
+    DagsterInvariantViolationError,
+)
+from dagster._core.event_api import (
+    EventLogCursor,
+    EventRecordsResult,
+    LazyEventLogRecord,
+    RunStatusChangeRecordsFilter,
+)
 from dagster._core.events import (
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
     AssetMaterializationPlannedData,
@@ -71,7 +80,12 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import (
+    RunStepStatsData,
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.instance import RUNLESS_JOB_NAME, RUNLESS_RUN_ID
 from dagster._core.remote_representation.external_data import (
     external_partitions_definition_from_def,
@@ -90,7 +104,11 @@
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
-from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.event_log.schema import (
+    RunStatsTable,
+    RunStepStatsTable,
+    SqlEventLogStorageTable,
+)
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.io_manager import IOManager
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -103,9 +121,9 @@
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._loggers import colored_console_logger
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import deserialize_value, serialize_value
 from dagster._utils import datetime_as_float
-from dagster._utils.concurrency import ConcurrencySlotStatus
+from dagster._utils.concurrency import ConcurrencySlotStatus, ConcurrencyStepClaim
 
 TEST_TIMEOUT = 5
 
@@ -501,6 +519,74 @@ def test_event_log_storage_store_events_and_wipe(self, test_run_id, storage: Eve
             storage.wipe()
             assert len(storage.get_logs_for_run(test_run_id)) == 0
 
+    def test_get_lazy_records_for_run(self, test_run_id: str, storage: EventLogStorage):
+        @op
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key="lazy_asset", partition="a")
+            yield Output(1)
+
+        events, _ = _synthesize_events(lambda: materialize_one(), run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        records = storage.get_lazy_records_for_run(
+            test_run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+        )
+        assert len(records) == 1
+        record = records[0]
+        assert isinstance(record, LazyEventLogRecord)
+        assert record.run_id == test_run_id
+        assert record.asset_key == AssetKey("lazy_asset")
+        assert record.partition_key == "a"
+        if isinstance(storage, SqlEventLogStorage):
+            # indexed columns are read without deserializing the entry
+            assert not record.is_loaded
+
+        eager_record = storage.get_records_for_run(
+            test_run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+        ).records[0]
+        assert record.storage_id == eager_record.storage_id
+        assert record.to_event_log_record() == eager_record
+        assert record.is_loaded
+        assert record.event_log_entry == eager_record.event_log_entry
+
+    def test_iter_records_for_run(self, test_run_id: str, storage: EventLogStorage):
+        @op
+        def materialize_many(_):
+            for i in range(5):
+                yield AssetMaterialization(asset_key="iter_asset", partition=str(i))
+            yield Output(1)
+
+        events, _ = _synthesize_events(lambda: materialize_many(), run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        all_records = storage.get_records_for_run(test_run_id).records
+        assert len(all_records) > 3
+
+        for chunk_size in [1, 3, len(all_records), 1000]:
+            records = list(storage.iter_records_for_run(test_run_id, chunk_size=chunk_size))
+            assert [record.storage_id for record in records] == [
+                record.storage_id for record in all_records
+            ]
+            assert [record.event_log_entry for record in records] == [
+                record.event_log_entry for record in all_records
+            ]
+
+        descending = list(storage.iter_records_for_run(test_run_id, ascending=False, chunk_size=2))
+        assert [record.storage_id for record in descending] == [
+            record.storage_id for record in reversed(all_records)
+        ]
+
+        materializations = list(
+            storage.iter_records_for_run(
+                test_run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION, chunk_size=2
+            )
+        )
+        assert [record.partition_key for record in materializations] == [str(i) for i in range(5)]
+
+        assert list(storage.iter_records_for_run(make_new_run_id())) == []
+
     def test_event_log_storage_store_with_multiple_runs(
         self,
         instance: DagsterInstance,
@@ -765,6 +851,95 @@ def test_event_log_step_stats(
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_run_stats_index(self, test_run_id: str, storage: EventLogStorage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_index(
+            test_run_id
+        ):
+            pytest.skip("This test is for storages with the run stats index")
+
+        storage.store_event_batch(_stats_records(run_id=test_run_id)[:6])
+        for record in _stats_records(run_id=test_run_id)[6:]:
+            storage.store_event(record)
+
+        def _assert_stats_match_event_log():
+            logs = storage.get_logs_for_run(test_run_id)
+            run_stats = storage.get_stats_for_run(test_run_id)
+            assert run_stats.steps_succeeded == 2
+            assert run_stats.steps_failed == 1
+            assert run_stats.materializations == 3
+            assert run_stats.expectations == 2
+            assert run_stats == build_run_stats_from_events(test_run_id, logs)
+            assert storage.get_step_stats_for_run(test_run_id) == (
+                build_run_step_stats_from_events(test_run_id, logs)
+            )
+            assert storage.get_step_stats_for_run(test_run_id, step_keys=["D"]) == [
+                step_stats
+                for step_stats in build_run_step_stats_from_events(test_run_id, logs)
+                if step_stats.step_key == "D"
+            ]
+
+        _assert_stats_match_event_log()
+
+        # runs stored before the run stats tables existed are indexed by the data migration
+        with storage.run_connection(test_run_id) as conn:
+            conn.execute(RunStatsTable.delete())
+            conn.execute(RunStepStatsTable.delete())
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
+        storage.backfill_run_stats(test_run_id)
+        _assert_stats_match_event_log()
+
+        # a rebuild that fails part way through leaves the existing stats in place
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        with mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.serialize_value",
+            side_effect=Exception("failed to serialize"),
+        ):
+            with pytest.raises(Exception, match="failed to serialize"):
+                storage.backfill_run_stats(test_run_id)
+        assert storage.get_step_stats_for_run(test_run_id) == step_stats
+        _assert_stats_match_event_log()
+
+        storage.delete_events(test_run_id)
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
+    def test_run_step_stats_concurrent_update(self, test_run_id: str, storage: EventLogStorage):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_run_stats_index(
+            test_run_id
+        ):
+            pytest.skip("This test is for storages with the run stats index")
+
+        records = _stats_records(run_id=test_run_id)
+        step_start, materialization, expectation = records[6], records[7], records[8]
+        storage.store_event(step_start)
+
+        read_step_stats_bodies = storage._get_run_step_stats_bodies  # noqa: SLF001
+        raced = []
+
+        def _racing_read(conn, run_id, step_keys, for_update=False):
+            bodies = read_step_stats_bodies(conn, run_id, step_keys, for_update=for_update)
+            if not raced:
+                raced.append(True)
+                # another writer applies an event to the stats after they have been read
+                stats_data = deserialize_value(bodies["D"], RunStepStatsData).with_event(
+                    expectation
+                )
+                conn.execute(
+                    RunStepStatsTable.update()
+                    .where(RunStepStatsTable.c.run_id == run_id)
+                    .values(stats_body=serialize_value(stats_data))
+                )
+            return bodies
+
+        with mock.patch.object(storage, "_get_run_step_stats_bodies", side_effect=_racing_read):
+            storage.store_event(materialization)
+
+        assert raced
+        [d_stats] = storage.get_step_stats_for_run(test_run_id, step_keys=["D"])
+        assert len(d_stats.materialization_events) == 1
+        assert len(d_stats.expectation_results) == 1
+
     def test_secondary_index(self, storage: EventLogStorage):
         if not isinstance(storage, SqlEventLogStorage) or isinstance(
             storage, InMemoryEventLogStorage
@@ -1158,6 +1333,91 @@ def foo():
             result = storage.fetch_materializations(foo.key, limit=100)
             assert len(result.records) == 2
 
+    def test_store_event_batch(self, storage, test_run_id):
+        asset_one = AssetKey("batch_asset_one")
+        asset_two = AssetKey("batch_asset_two")
+
+        @op
+        def materialize_assets(_):
+            yield AssetMaterialization(asset_key=asset_one, partition="a")
+            yield AssetObservation(asset_key=asset_one)
+            yield AssetMaterialization(asset_key=asset_two)
+            yield AssetMaterialization(asset_key=asset_one, partition="b")
+            yield Output(1)
+
+        def _ops():
+            materialize_assets()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+            storage.store_event_batch(events)
+
+            stored = storage.get_records_for_run(test_run_id).records
+            assert [record.event_log_entry.dagster_event_type for record in stored] == [
+                event.dagster_event_type for event in events
+            ]
+            storage_ids = [record.storage_id for record in stored]
+            assert storage_ids == sorted(storage_ids)
+            assert len(set(storage_ids)) == len(storage_ids)
+
+            result = storage.fetch_materializations(asset_one, limit=100)
+            assert [
+                record.event_log_entry.dagster_event.partition for record in result.records
+            ] == ["b", "a"]
+            assert len(storage.fetch_observations(asset_one, limit=100).records) == 1
+            assert len(storage.fetch_materializations(asset_two, limit=100).records) == 1
+
+            asset_records = {
+                record.asset_entry.asset_key: record
+                for record in storage.get_asset_records([asset_one, asset_two])
+            }
+            last_materialization = asset_records[asset_one].asset_entry.last_materialization
+            assert last_materialization
+            assert last_materialization.dagster_event.partition == "b"
+            assert asset_records[asset_two].asset_entry.last_materialization
+
+    def test_store_event_batch_failure(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        asset_key = AssetKey("batch_failure_asset")
+
+        @op
+        def materialize_asset(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _ops():
+            materialize_asset()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+
+            with mock.patch.object(
+                storage, "store_asset_event", side_effect=Exception("failed to index")
+            ):
+                if self.is_sqlite(storage):
+                    # the run shard is written before the index shard, so the events are stored
+                    with pytest.raises(DagsterEventBatchPartiallyStoredError) as exc_info:
+                        storage.store_event_batch(events)
+                    assert exc_info.value.unstored_events == []
+                else:
+                    with pytest.raises(Exception, match="failed to index"):
+                        storage.store_event_batch(events)
+
+            if self.is_sqlite(storage):
+                assert len(storage.get_records_for_run(test_run_id).records) == len(events)
+            else:
+                # the batch is stored in a single transaction, so none of it was stored
+                assert storage.get_records_for_run(test_run_id).records == []
+                assert not storage.get_asset_records([asset_key])
+
     def test_asset_materialization_null_key_fails(self):
         with pytest.raises(check.CheckError):
             AssetMaterialization(asset_key=None)
@@ -2481,6 +2741,100 @@ def _store_partition_event(asset_key, partition, tags) -> int:
                     "p1": {"dagster/a": "3", "dagster/b": "3"},
                 }
 
+    @pytest.mark.parametrize(
+        "dagster_event_type",
+        [DagsterEventType.ASSET_OBSERVATION, DagsterEventType.ASSET_MATERIALIZATION],
+    )
+    def test_get_latest_storage_id_and_tags_by_partition_for_asset_keys(
+        self, storage, instance, dagster_event_type
+    ):
+        a = AssetKey(["a"])
+        b = AssetKey(["b"])
+        c = AssetKey(["c"])
+        run_id = make_new_run_id()
+
+        def _store_partition_event(asset_key, partition, tags) -> int:
+            if dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                dagster_event = DagsterEvent(
+                    dagster_event_type.value,
+                    "nonce",
+                    event_specific_data=StepMaterializationData(
+                        AssetMaterialization(asset_key=asset_key, partition=partition, tags=tags)
+                    ),
+                )
+            else:
+                dagster_event = DagsterEvent(
+                    dagster_event_type.value,
+                    "nonce",
+                    event_specific_data=AssetObservationData(
+                        AssetObservation(asset_key=asset_key, partition=partition, tags=tags)
+                    ),
+                )
+
+            storage.store_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message="",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=dagster_event,
+                )
+            )
+            # get the storage id of the event we just stored
+            return storage.get_event_records(
+                EventRecordsFilter(dagster_event_type),
+                limit=1,
+                ascending=False,
+            )[0].storage_id
+
+        def _assert_storage_matches(asset_keys):
+            assert storage.get_latest_storage_id_by_partition_for_asset_keys(
+                asset_keys, dagster_event_type
+            ) == {
+                asset_key: storage.get_latest_storage_id_by_partition(asset_key, dagster_event_type)
+                for asset_key in asset_keys
+            }
+            assert storage.get_latest_tags_by_partition_for_asset_keys(
+                asset_keys, dagster_event_type, tag_keys=["dagster/a"]
+            ) == {
+                asset_key: storage.get_latest_tags_by_partition(
+                    asset_key, dagster_event_type, tag_keys=["dagster/a"]
+                )
+                for asset_key in asset_keys
+            }
+
+        with create_and_delete_test_runs(instance, [run_id]):
+            # no events
+            assert storage.get_latest_storage_id_by_partition_for_asset_keys(
+                [a, b], dagster_event_type
+            ) == {a: {}, b: {}}
+            assert (
+                storage.get_latest_storage_id_by_partition_for_asset_keys([], dagster_event_type)
+                == {}
+            )
+
+            a_p1 = _store_partition_event(a, "p1", tags={"dagster/a": "1"})
+            _store_partition_event(b, "p1", tags={"dagster/a": "..."})
+            a_p1 = _store_partition_event(a, "p1", tags={"dagster/a": "2"})
+            a_p2 = _store_partition_event(a, "p2", tags={"dagster/b": "1"})
+            c_p1 = _store_partition_event(c, "p1", tags={"dagster/a": "1"})
+
+            assert storage.get_latest_storage_id_by_partition_for_asset_keys(
+                [a, c], dagster_event_type
+            ) == {a: {"p1": a_p1, "p2": a_p2}, c: {"p1": c_p1}}
+            assert storage.get_latest_tags_by_partition_for_asset_keys(
+                [a, c], dagster_event_type, tag_keys=["dagster/a"]
+            ) == {a: {"p1": {"dagster/a": "2"}}, c: {"p1": {"dagster/a": "1"}}}
+            _assert_storage_matches([a, b, c])
+
+            if self.can_wipe():
+                storage.wipe_asset(a)
+                _assert_storage_matches([a, b, c])
+
+                _store_partition_event(a, "p2", tags={"dagster/a": "3"})
+                _assert_storage_matches([a, b, c])
+
     def test_get_latest_asset_partition_materialization_attempts_without_materializations(
         self, storage, instance
     ):
@@ -4524,6 +4878,73 @@ def claim(key, run_id, step_key, priority=0):
         assert storage.check_concurrency_claim("foo", run_id, "d").assigned_timestamp is None
         assert storage.check_concurrency_claim("foo", run_id, "e").assigned_timestamp is None
 
+    def test_bulk_concurrency_claims(self, storage: EventLogStorage):
+        if not storage.supports_global_concurrency_limits:
+            pytest.skip("storage does not support global op concurrency")
+
+        if self.can_wipe():
+            storage.wipe()
+
+        run_id = make_new_run_id()
+        other_run_id = make_new_run_id()
+
+        def claim(key, run_id, step_key, priority=0):
+            claim_status = storage.claim_concurrency_slot(key, run_id, step_key, priority)
+            return claim_status.slot_status
+
+        def claim_steps(run_id, step_claims):
+            claim_statuses = storage.claim_concurrency_slots(
+                run_id, [ConcurrencyStepClaim(*step_claim) for step_claim in step_claims]
+            )
+            return {
+                step_key: claim_status.slot_status
+                for step_key, claim_status in claim_statuses.items()
+            }
+
+        storage.set_concurrency_slots("foo", 3)
+        storage.set_concurrency_slots("bar", 1)
+
+        assert claim("foo", other_run_id, "other") == ConcurrencySlotStatus.CLAIMED
+
+        # the two highest priority foo steps claim the remaining foo slots
+        assert claim_steps(
+            run_id,
+            [("foo", "a", 0), ("foo", "b", 2), ("foo", "c", 1), ("bar", "d", 0), ("bar", "e", 0)],
+        ) == {
+            "a": ConcurrencySlotStatus.BLOCKED,
+            "b": ConcurrencySlotStatus.CLAIMED,
+            "c": ConcurrencySlotStatus.CLAIMED,
+            "d": ConcurrencySlotStatus.CLAIMED,
+            "e": ConcurrencySlotStatus.BLOCKED,
+        }
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 3
+        assert foo_info.pending_step_count == 1
+
+        # claiming again is idempotent
+        assert claim_steps(run_id, [("foo", "a", 0), ("foo", "b", 2)]) == {
+            "a": ConcurrencySlotStatus.BLOCKED,
+            "b": ConcurrencySlotStatus.CLAIMED,
+        }
+        assert storage.get_concurrency_info("foo").active_slot_count == 3
+
+        # freeing slots in bulk assigns the pending steps
+        storage.free_concurrency_slots_for_steps(run_id, ["b", "d"])
+        assert storage.check_concurrency_claim("foo", run_id, "a").is_assigned
+        assert storage.check_concurrency_claim("bar", run_id, "e").is_assigned
+        assert claim_steps(run_id, [("foo", "a", 0), ("bar", "e", 0)]) == {
+            "a": ConcurrencySlotStatus.CLAIMED,
+            "e": ConcurrencySlotStatus.CLAIMED,
+        }
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 3
+        assert foo_info.pending_step_count == 0
+        assert {slot.step_key for slot in foo_info.claimed_slots} == {"other", "a", "c"}
+
+        storage.free_concurrency_slots_for_steps(run_id, ["a", "c", "e"])
+        assert storage.get_concurrency_info("foo").active_slot_count == 1
+        assert storage.get_concurrency_info("bar").active_slot_count == 0
+
     def test_invalid_concurrency_limit(self, storage: EventLogStorage):
         if not storage.supports_global_concurrency_limits:
             pytest.skip("storage does not support global op concurrency")
@@ -2,8 +2,10 @@
 import tempfile
 import time
 import unittest
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Optional
+from unittest import mock
 
 import pendulum
 import pytest
@@ -34,6 +36,7 @@
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.schema import RunTagsTable
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
@@ -150,6 +153,70 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.job_name == "some_pipeline"
 
+    def test_add_runs(self, storage: RunStorage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+
+        added = storage.add_runs(
+            [
+                TestRunStorage.build_run(run_id=one, job_name="foo", tags={"tag1": "val1"}),
+                TestRunStorage.build_run(run_id=two, job_name="foo", tags={"tag1": "val2"}),
+            ]
+        )
+        assert [run.run_id for run in added] == [one, two]
+        assert storage.add_runs([]) == []
+
+        assert {run.run_id for run in storage.get_runs()} == {one, two}
+        assert _get_run_by_id(storage, one).tags == {"tag1": "val1"}
+        assert _get_run_by_id(storage, two).tags == {"tag1": "val2"}
+        assert storage.get_run_tags(tag_keys=["tag1"]) == [("tag1", {"val1", "val2"})]
+
+        three = make_new_run_id()
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(run_id=three, job_name="foo"),
+                    TestRunStorage.build_run(run_id=one, job_name="foo"),
+                ]
+            )
+        assert _get_run_by_id(storage, three) is None
+
+        if isinstance(storage, SqlRunStorage):
+            # runs are not stored if their tags fail to be stored
+            original_transaction = storage.transaction
+
+            class FailOnTagsInsert:
+                def __init__(self, conn):
+                    self._conn = conn
+
+                def execute(self, statement, *args, **kwargs):
+                    if getattr(statement, "table", None) is RunTagsTable:
+                        raise Exception("Failed to insert tags")
+                    return self._conn.execute(statement, *args, **kwargs)
+
+            @contextmanager
+            def failing_transaction():
+                with original_transaction() as conn:
+                    yield FailOnTagsInsert(conn)
+
+            four = make_new_run_id()
+            with mock.patch.object(storage, "transaction", failing_transaction):
+                with pytest.raises(Exception, match="Failed to insert tags"):
+                    storage.add_runs(
+                        [TestRunStorage.build_run(run_id=four, job_name="foo", tags={"a": "b"})]
+                    )
+            assert _get_run_by_id(storage, four) is None
+
+        with pytest.raises(DagsterSnapshotDoesNotExist):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=make_new_run_id(), job_name="foo", job_snapshot_id="not_a_snapshot"
+                    )
+                ]
+            )
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -975,6 +1042,34 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_job_snapshot(job_snapshot_id)
 
+    def test_snapshot_cache(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not cache snapshots")
+
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot = job_def.get_job_snapshot()
+        job_snapshot_id = storage.add_job_snapshot(job_snapshot)
+
+        cache = storage.snapshot_cache
+        assert job_snapshot_id not in cache
+
+        fetched_snapshot = storage.get_job_snapshot(job_snapshot_id)
+        assert job_snapshot_id in cache
+        assert cache.misses == 1
+        assert storage.get_job_snapshot(job_snapshot_id) is fetched_snapshot
+        assert cache.hits == 1
+        assert storage.has_job_snapshot(job_snapshot_id)
+
+        # missing snapshots are not cached
+        assert not storage.has_job_snapshot("nope")
+        assert storage.get_job_snapshot("nope") is None
+        assert "nope" not in cache
+
+        if self.can_delete_runs():
+            storage.wipe()
+            assert len(cache) == 0
+            assert not storage.has_job_snapshot(job_snapshot_id)
+
     def test_single_write_read_with_snapshot(self, storage: RunStorage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -1194,6 +1289,69 @@ def test_partition_status(self, storage: RunStorage):
         assert {_.partition for _ in partition_data} == {"one", "two", "three"}
         assert {_.run_id for _ in partition_data} == {one.run_id, two_retried.run_id, three.run_id}
 
+    def test_partition_status_latest_matching_run(self, storage: RunStorage):
+        def _add_partition_run(partition, status, partition_set="foo_set", tags=None):
+            run = TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                job_name="foo_job",
+                status=status,
+                tags={
+                    PARTITION_NAME_TAG: partition,
+                    PARTITION_SET_TAG: partition_set,
+                    **(tags or {}),
+                },
+            )
+            storage.add_run(run)
+            return run
+
+        one = _add_partition_run("one", DagsterRunStatus.SUCCESS, tags={"foo": "bar"})
+        _add_partition_run("one", DagsterRunStatus.CANCELED, tags={"foo": "bar"})
+        two = _add_partition_run("two", DagsterRunStatus.FAILURE)
+        two_retried = _add_partition_run("two", DagsterRunStatus.SUCCESS, tags={"foo": "bar"})
+        _add_partition_run("one", DagsterRunStatus.SUCCESS, partition_set="other_set")
+        _add_partition_run("", DagsterRunStatus.SUCCESS)
+
+        def _assert_partition_data():
+            partition_data = storage.get_run_partition_data(
+                runs_filter=RunsFilter(tags={PARTITION_SET_TAG: "foo_set"})
+            )
+            assert [(_.partition, _.status) for _ in partition_data] == [
+                ("two", DagsterRunStatus.SUCCESS),
+                ("one", DagsterRunStatus.CANCELED),
+            ]
+
+            # the latest run per partition is selected among the runs matching the filter
+            partition_data = storage.get_run_partition_data(
+                runs_filter=RunsFilter(
+                    statuses=[DagsterRunStatus.SUCCESS, DagsterRunStatus.FAILURE],
+                    tags={PARTITION_SET_TAG: "foo_set"},
+                )
+            )
+            assert [_.run_id for _ in partition_data] == [two_retried.run_id, one.run_id]
+
+            partition_data = storage.get_run_partition_data(
+                runs_filter=RunsFilter(
+                    statuses=[DagsterRunStatus.FAILURE],
+                    tags={PARTITION_SET_TAG: "foo_set"},
+                )
+            )
+            assert [_.run_id for _ in partition_data] == [two.run_id]
+
+            partition_data = storage.get_run_partition_data(
+                runs_filter=RunsFilter(
+                    statuses=[DagsterRunStatus.SUCCESS],
+                    tags={PARTITION_SET_TAG: "foo_set", "foo": "bar"},
+                )
+            )
+            assert [_.run_id for _ in partition_data] == [two_retried.run_id, one.run_id]
+
+        _assert_partition_data()
+
+        if isinstance(storage, SqlRunStorage):
+            # storages whose partition columns have not been migrated read partitions from tags
+            with mock.patch.object(storage, "has_built_index", return_value=False):
+                _assert_partition_data()
+
     def _skip_in_memory(self, storage):
         from dagster._core.storage.runs import InMemoryRunStorage
 
@@ -1,4 +1,4 @@
-from typing import ContextManager, Optional, cast
+from typing import ContextManager, Iterator, Optional, Set, Union, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -6,7 +6,8 @@
 import sqlalchemy.exc as db_exc
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.event_api import EventHandlerFn, EventLogRecord
+from dagster._core.events import DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import MySqlStorageConfig, mysql_config
 from dagster._core.storage.event_log import (
@@ -15,7 +16,7 @@
     SqlEventLogStorageMetadata,
     SqlPollingEventWatcher,
 )
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.base import DEFAULT_RECORDS_CHUNK_SIZE, EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.sql import (
     AlembicVersion,
@@ -176,10 +177,22 @@ def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     def index_connection(self) -> ContextManager[Connection]:
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+        chunk_size: int = DEFAULT_RECORDS_CHUNK_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        # stream the records through an unbuffered (SSCursor) server-side cursor rather than
+        # loading the full result set into memory
+        with self._connect() as conn:
+            yield from self._stream_records_for_run(conn, run_id, of_type, ascending, chunk_size)
 
     def has_table(self, table_name: str) -> bool:
         with self._connect() as conn:
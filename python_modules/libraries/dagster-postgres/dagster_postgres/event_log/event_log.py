@@ -1,5 +1,15 @@
 from contextlib import contextmanager
-from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, cast
+from typing import (
+    Any,
+    ContextManager,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 import sqlalchemy as db
@@ -7,8 +17,8 @@
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.event_api import EventHandlerFn, EventLogRecord
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -18,9 +28,10 @@
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.base import DEFAULT_RECORDS_CHUNK_SIZE, EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.sql_event_log import MAX_EVENT_BATCH_INSERT_SIZE
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -191,6 +202,8 @@ def store_event(self, event: EventLogEntry) -> None:
             )
             event_id = int(res[1])  # type: ignore
 
+        self.update_run_stats(event.run_id, [event])
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -208,26 +221,27 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
-    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
-        check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
-
-        insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
-
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
-
-        if any((event_id is None for event_id in event_ids)):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        # Postgres supports `INSERT ... RETURNING` on multi-row inserts, so the storage ids for the
+        # entire batch can be fetched without splitting it up into single-row inserts
+        event_ids = []
+        for i in range(0, len(events), MAX_EVENT_BATCH_INSERT_SIZE):
+            chunk = events[i : i + MAX_EVENT_BATCH_INSERT_SIZE]
+            result = conn.execute(
+                self.prepare_insert_event_batch(chunk).returning(SqlEventLogStorageTable.c.id)
+            )
+            event_ids.extend([cast(int, row[0]) for row in result.fetchall()])
 
-        self.store_asset_event_tags(events, event_ids)
+        # as in store_event, notify listeners to support version skew. The events of a batch are
+        # inserted per run, so this sends one notification per run rather than one per event
+        if event_ids:
+            conn.execute(
+                db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                {"notify_id": events[-1].run_id + "_" + str(event_ids[-1])},
+            )
+        return event_ids
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -305,10 +319,10 @@ def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
     def run_connection(self, run_id: Optional[str] = None) -> ContextManager[Connection]:
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     def index_connection(self) -> ContextManager[Connection]:
-        return self._connect()
+        return self._batch_or_new_connection(self._connect)
 
     @contextmanager
     def index_transaction(self) -> Iterator[Connection]:
@@ -321,6 +335,22 @@ def index_transaction(self) -> Iterator[Connection]:
                 with conn.begin():
                     yield conn
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        ascending: bool = True,
+        chunk_size: int = DEFAULT_RECORDS_CHUNK_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        # psycopg2 only uses a server-side (named) cursor within a transaction, so stream the
+        # records from a read-only transaction instead of the autocommit connection
+        with self._connect() as conn:
+            conn = conn.execution_options(isolation_level="READ COMMITTED")  # noqa: PLW2901
+            with conn.begin():
+                yield from self._stream_records_for_run(
+                    conn, run_id, of_type, ascending, chunk_size
+                )
+
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
@@ -1,5 +1,6 @@
 import zlib
-from typing import ContextManager, Mapping, Optional
+from contextlib import contextmanager
+from typing import ContextManager, Iterator, Mapping, Optional
 
 import dagster._check as check
 import sqlalchemy as db
@@ -156,6 +157,15 @@ def create_clean_storage(
     def connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """Context manager yielding a connection that has begun a transaction."""
+        with self.connect() as conn:
+            # connections are in autocommit mode, so switch to a transactional isolation level
+            conn = conn.execution_options(isolation_level="READ COMMITTED")  # noqa: PLW2901
+            with conn.begin():
+                yield conn
+
     def upgrade(self) -> None:
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)